@@ -0,0 +1,53 @@
+"""Time-sliced scheduling of enemy decisions."""
+
+from __future__ import annotations
+
+import time
+
+
+class AIScheduler:
+    """Stagger enemy decisions across frames and cap the AI time spent per frame.
+
+    Enemies are given different phases of the movement cycle so they do not all
+    decide on the same frame. Within a frame, decisions are granted until the
+    budget is used up; enemies asked after that reuse their previous decision.
+    The starting enemy rotates every frame so no enemy is starved permanently.
+    """
+
+    def __init__(self, frame_budget_ms: float, stagger_period: int):
+        self.frame_budget_ms = frame_budget_ms
+        self._stagger_period = max(1, stagger_period)
+        self._next_phase = 0
+        self._start_index = 0
+        self._deadline = 0.0
+        self.decisions = 0
+        self.deferred = 0
+        self.total_deferred = 0
+
+    def configure(self, frame_budget_ms: float, stagger_period: int) -> None:
+        self.frame_budget_ms = frame_budget_ms
+        self._stagger_period = max(1, stagger_period)
+
+    def stagger(self, enemy) -> None:
+        """Assign the next movement phase to a newly spawned enemy."""
+        enemy.move_counter = self._next_phase
+        self._next_phase = (self._next_phase + 1) % self._stagger_period
+
+    def begin_frame(self, enemy_count: int) -> int:
+        """Open the frame's budget and return the index of the first enemy to update."""
+        self._deadline = time.perf_counter() + self.frame_budget_ms / 1000
+        self.decisions = 0
+        self.deferred = 0
+        if enemy_count == 0:
+            return 0
+        self._start_index = (self._start_index + 1) % enemy_count
+        return self._start_index
+
+    def should_think(self) -> bool:
+        """Grant a decision while the frame budget lasts; count refusals otherwise."""
+        if time.perf_counter() < self._deadline:
+            self.decisions += 1
+            return True
+        self.deferred += 1
+        self.total_deferred += 1
+        return False
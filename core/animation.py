@@ -0,0 +1,24 @@
+"""Shared clock for purely cosmetic animation."""
+
+from __future__ import annotations
+
+
+class AnimationClock:
+    """Single time base that drawables derive their animation phase from.
+
+    Entities no longer count frames themselves; they read the clock when drawn.
+    Pausing or scaling the clock therefore pauses or slows every animation.
+    """
+
+    def __init__(self, time_scale: float = 1.0):
+        self.time = 0.0
+        self.time_scale = time_scale
+        self.paused = False
+
+    def tick(self, frames: float = 1.0) -> None:
+        if not self.paused:
+            self.time += frames * self.time_scale
+
+    def frame(self, period: int, offset: int = 0) -> int:
+        """Current frame of a cycle ``period`` frames long, shifted by ``offset``."""
+        return (int(self.time) + offset) % period
@@ -8,11 +8,19 @@ from typing import Tuple
 
 import pygame
 
+from core.ai_scheduler import AIScheduler
+from core.animation import AnimationClock
+from core.collision import boxes_overlap, sweep_walls
 from core.direction import Direction
 from core.game_state import SingletonGameState
 from core.interfaces import Collidable, Drawable
+from core.junction_graph import Corridor, JunctionGraph, opposite
 from utils.config_loader import GameSettings
 
+_DIRECTIONS = tuple(Direction)
+# Angle the mouth opens towards, per facing direction.
+_MOUTH_CENTRES = {Direction.RIGHT: 0, Direction.LEFT: 180, Direction.UP: 270, Direction.DOWN: 90}
+
 
 class Wall(Drawable):
     """Axis-aligned wall segment."""
@@ -24,25 +32,34 @@ class Wall(Drawable):
         self.width = width
         self.height = height
 
-    def draw(self, surface) -> None:  # type: ignore[override]
-        pygame.draw.rect(surface, self._settings.colors.wall, (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(surface, (0, 0, 100), (self.x, self.y, self.width, self.height), 2)
+    def draw(self, surface, offset: tuple[int, int] = (0, 0)) -> None:  # type: ignore[override]
+        """Draw the wall, shifted by ``-offset`` for surfaces covering part of the maze."""
+        rect = (self.x - offset[0], self.y - offset[1], self.width, self.height)
+        pygame.draw.rect(surface, self._settings.colors.wall, rect)
+        pygame.draw.rect(surface, (0, 0, 100), rect, 2)
 
 
 class Coin(Drawable):
     """Collectible coin with pulsing animation."""
 
-    def __init__(self, settings: GameSettings, x: int, y: int):
+    def __init__(self, settings: GameSettings, x: int, y: int, clock: AnimationClock | None = None, phase_offset: int = 0):
         self._settings = settings
         self.x = x
         self.y = y
         self.collected = False
         self._grid_size = settings.grid_size
         self.radius = self._grid_size // 4
-        self.animation_counter = 0
+        self._clock = clock or AnimationClock()
+        self.phase_offset = phase_offset
+
+    @property
+    def animation_counter(self) -> int:
+        return self._clock.frame(20, self.phase_offset)
 
-    def update(self) -> None:
-        self.animation_counter = (self.animation_counter + 1) % 20
+    def apply_settings(self, settings: GameSettings) -> None:
+        self._settings = settings
+        self._grid_size = settings.grid_size
+        self.radius = self._grid_size // 4
 
     def draw(self, surface) -> None:  # type: ignore[override]
         if self.collected:
@@ -57,17 +74,24 @@ class Coin(Drawable):
 class PowerPellet(Drawable):
     """Larger collectible that activates power mode."""
 
-    def __init__(self, settings: GameSettings, x: int, y: int):
+    def __init__(self, settings: GameSettings, x: int, y: int, clock: AnimationClock | None = None, phase_offset: int = 0):
         self._settings = settings
         self.x = x
         self.y = y
         self.collected = False
         self._grid_size = settings.grid_size
         self.radius = self._grid_size // 2 - 4
-        self.animation_counter = 0
+        self._clock = clock or AnimationClock()
+        self.phase_offset = phase_offset
+
+    @property
+    def animation_counter(self) -> int:
+        return self._clock.frame(30, self.phase_offset)
 
-    def update(self) -> None:
-        self.animation_counter = (self.animation_counter + 1) % 30
+    def apply_settings(self, settings: GameSettings) -> None:
+        self._settings = settings
+        self._grid_size = settings.grid_size
+        self.radius = self._grid_size // 2 - 4
 
     def draw(self, surface) -> None:  # type: ignore[override]
         if self.collected:
@@ -82,7 +106,10 @@ class PowerPellet(Drawable):
 class Player(Drawable, Collidable):
     """Player controlled Pac-man style entity."""
 
-    def __init__(self, settings: GameSettings):
+    # Small margin to allow better corridor navigation
+    _COLLISION_MARGIN = 2
+
+    def __init__(self, settings: GameSettings, clock: AnimationClock | None = None):
         self._settings = settings
         self.x = settings.grid_size
         self.y = settings.grid_size
@@ -90,14 +117,30 @@ class Player(Drawable, Collidable):
         self.score = 0
         self.lives = settings.player.initial_lives
         self.radius = settings.grid_size // 2 - 2
-        self.animation_counter = 0
-        self.mouth_angle = 45
+        self._clock = clock or AnimationClock()
         self.direction = Direction.RIGHT
+        self.prev_x = self.x
+        self.prev_y = self.y
+        # The singleton never changes, so look it up once instead of per query.
+        self._state = SingletonGameState()
+
+    def apply_settings(self, settings: GameSettings) -> None:
+        self._settings = settings
+        self.speed = settings.player.speed
+        self.radius = settings.grid_size // 2 - 2
 
-    def move(self, direction: Direction) -> None:
+    def move(self, direction: Direction) -> bool:
+        """Step in ``direction`` if possible; return whether the player moved."""
+        target = self._plan_move(direction)
+        if target is None:
+            return False
+        self.x, self.y = target
+        self.direction = direction
+        return True
+
+    def _plan_move(self, direction: Direction) -> Tuple[float, float] | None:
         dx, dy = direction.delta
-        new_x = self.x + dx * self.speed
-        new_y = self.y + dy * self.speed
+        x, y = self.x, self.y
         
         # Auto-align to grid when changing direction to help enter corridors
         grid = self._settings.grid_size
@@ -107,35 +150,42 @@ class Player(Drawable, Collidable):
         if dx != 0 and dy == 0:
             grid_y = round(self.y / grid) * grid
             if abs(self.y - grid_y) <= align_threshold:
-                new_y = grid_y
+                y = grid_y
         
         # If moving vertically, try to align horizontally to grid
         if dy != 0 and dx == 0:
             grid_x = round(self.x / grid) * grid
             if abs(self.x - grid_x) <= align_threshold:
-                new_x = grid_x
+                x = grid_x
+
+        # Sweep the whole step so a large speed cannot skip over a thin wall;
+        # the player stops flush against the wall instead.
+        travel = sweep_walls(x, y, grid, direction, self.speed, self._state.walls, self._COLLISION_MARGIN)
+        if travel <= 0:
+            return None
+        new_x = x + dx * travel
+        new_y = y + dy * travel
 
-        if 0 <= new_x < self._settings.width and 0 <= new_y < self._settings.height and not self.check_collision(new_x, new_y):
-            self.x = new_x
-            self.y = new_y
-            self.direction = direction
+        if 0 <= new_x < self._settings.maze_width and 0 <= new_y < self._settings.maze_height:
+            return new_x, new_y
+        return None
+
+    def mark_position(self) -> None:
+        """Remember the current position as the start of the next swept test."""
+        self.prev_x = self.x
+        self.prev_y = self.y
 
     def check_collision(self, x: float, y: float) -> bool:
-        game_state = SingletonGameState()
         grid_size = self._settings.grid_size
-        # Add small margin to allow better corridor navigation
-        margin = 2
-        for wall in game_state.walls:
-            if (x + margin < wall.x + wall.width and 
-                x + grid_size - margin > wall.x and 
-                y + margin < wall.y + wall.height and 
-                y + grid_size - margin > wall.y):
+        margin = self._COLLISION_MARGIN
+        for wall in self._state.walls:
+            if boxes_overlap(x + margin, y + margin, grid_size - 2 * margin, grid_size - 2 * margin, wall.x, wall.y, wall.width, wall.height):
                 return True
         return False
 
-    def update(self) -> None:
-        self.animation_counter = (self.animation_counter + 1) % 20
-        self.mouth_angle = 45 if self.animation_counter < 10 else 20
+    @property
+    def mouth_angle(self) -> int:
+        return 45 if self._clock.frame(20) < 10 else 20
 
     def draw(self, surface) -> None:  # type: ignore[override]
         center_x = self.x + self._settings.grid_size // 2
@@ -143,13 +193,12 @@ class Player(Drawable, Collidable):
 
         pygame.draw.circle(surface, self._settings.colors.primary, (center_x, center_y), self.radius)
 
-        direction_angles = {
-            Direction.RIGHT: (360 - self.mouth_angle, self.mouth_angle),
-            Direction.LEFT: (180 - self.mouth_angle, 180 + self.mouth_angle),
-            Direction.UP: (270 - self.mouth_angle, 270 + self.mouth_angle),
-            Direction.DOWN: (90 - self.mouth_angle, 90 + self.mouth_angle),
-        }
-        start_angle, end_angle = direction_angles.get(self.direction, (self.mouth_angle, 360 - self.mouth_angle))
+        mouth_angle = self.mouth_angle
+        centre = _MOUTH_CENTRES.get(self.direction)
+        if centre is None:
+            start_angle, end_angle = mouth_angle, 360 - mouth_angle
+        else:
+            start_angle, end_angle = (centre - mouth_angle) % 360, centre + mouth_angle
 
         points: list[Tuple[float, float]] = [(center_x, center_y)]
         
@@ -179,57 +228,127 @@ class Enemy(Drawable, Collidable):
         self.y = y
         self.color = color
         self.speed = settings.enemy.speed
-        self.direction = random.choice(list(Direction))
+        self.direction = random.choice(_DIRECTIONS)
         self.radius = settings.grid_size // 2 - 2
-        self.animation_counter = 0
         self.frightened = False
         self.move_counter = 0
         self.frozen = False
-        self.freeze_counter = 0
+        self.prev_x = x
+        self.prev_y = y
+        self._state = SingletonGameState()
+        # Pixel position of the junction the enemy is heading for, if on the graph.
+        self._target: tuple[int, int] | None = None
 
-    def update(self, power_mode_active: bool = False, freeze_active: bool = False, player: "Player | None" = None) -> None:
+    def apply_settings(self, settings: GameSettings) -> None:
+        self._settings = settings
+        self.speed = settings.enemy.speed
+        self.radius = settings.grid_size // 2 - 2
+
+    def update(
+        self,
+        power_mode_active: bool = False,
+        freeze_active: bool = False,
+        player: "Player | None" = None,
+        ai_scheduler: "AIScheduler | None" = None,
+    ) -> None:
         self.frightened = power_mode_active
         
-        # Handle freeze state
-        if freeze_active and not self.frozen:
-            self.frozen = True
-            self.freeze_counter = 60  # Freeze for 60 frames
-        
+        # Freeze expiry is owned by the power mode's timer, so no per-enemy countdown
+        self.frozen = freeze_active
         if self.frozen:
-            self.freeze_counter -= 1
-            if self.freeze_counter <= 0:
-                self.frozen = False
-            self.animation_counter = (self.animation_counter + 1) % 20
             return
         
         self.move_counter += 1
         if self.move_counter < self._settings.speed.movement_update_rate:
-            self.animation_counter = (self.animation_counter + 1) % 20
             return
 
         self.move_counter = 0
-        
+
+        navigation = self._state.navigation
+        if navigation is not None and self._follow_graph(navigation, player, ai_scheduler):
+            return
+
+        # Off the junction graph (not tile aligned, or spawned inside a wall):
+        # fall back to stepwise wall sweeps until the enemy is back on a tile.
+        # Over the frame's AI budget the enemy keeps its last decision and just
+        # carries on in the same direction (or waits if that is blocked).
+        think = ai_scheduler is None or ai_scheduler.should_think()
+
         # Smart AI: Chase player 40% of the time, random 60% of the time
-        if player and random.random() < 0.4:
-            new_x, new_y = self._get_smart_position(player)
-        else:
-            new_x, new_y = self._get_new_position()
+        if think and player and random.random() < 0.4:
+            self._choose_smart_direction(player)
 
-        if self.check_collision(new_x, new_y):
+        travel = self._sweep(self.direction)
+        if travel <= 0 and think:
             for _ in range(10):
-                self.direction = random.choice(list(Direction))
-                new_x, new_y = self._get_new_position()
-                if not self.check_collision(new_x, new_y):
+                self.direction = random.choice(_DIRECTIONS)
+                travel = self._sweep(self.direction)
+                if travel > 0:
                     break
 
-        if not self.check_collision(new_x, new_y):
-            self.x = new_x
-            self.y = new_y
-
-        self.animation_counter = (self.animation_counter + 1) % 20
-
-    def _get_smart_position(self, player: "Player") -> Tuple[float, float]:
-        """Move towards the player with some logic."""
+        if travel > 0:
+            dx, dy = self.direction.delta
+            self.x += dx * travel
+            self.y += dy * travel
+
+    def mark_position(self) -> None:
+        """Remember the current position as the start of the next swept test."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def _follow_graph(self, navigation: JunctionGraph, player: "Player | None", ai_scheduler: "AIScheduler | None") -> bool:
+        """Move one step along the current corridor, deciding only at junctions.
+
+        Corridors are wall-free by construction, so no collision queries are
+        made. Returns ``False`` when the enemy is not on the graph.
+        """
+        if self._target is None:
+            grid = self._settings.grid_size
+            if self.x % grid or self.y % grid:
+                return False
+            col, row = int(self.x // grid), int(self.y // grid)
+            exits = navigation.exits(col, row)
+            if not exits:
+                return False
+            if navigation.is_junction(col, row):
+                corridor = self._choose_corridor(exits, player, ai_scheduler)
+                if corridor is None:
+                    return True
+            else:
+                # Joining mid-corridor: carry on if possible, else take the other way.
+                corridor = exits.get(self.direction) or next(iter(exits.values()))
+            self.direction = corridor.direction
+            self._target = (corridor.end[0] * grid, corridor.end[1] * grid)
+
+        target_x, target_y = self._target
+        remaining = abs(target_x - self.x) + abs(target_y - self.y)
+        # Steps are clipped at the junction so every decision starts tile aligned.
+        travel = min(self.speed, remaining)
+        dx, dy = self.direction.delta
+        self.x += dx * travel
+        self.y += dy * travel
+        if travel == remaining:
+            self._target = None
+        return True
+
+    def _choose_corridor(
+        self, exits: dict[Direction, Corridor], player: "Player | None", ai_scheduler: "AIScheduler | None"
+    ) -> Corridor | None:
+        """Pick the corridor to take from a junction, or ``None`` to wait a step."""
+        heading = self.direction
+        if ai_scheduler is not None and not ai_scheduler.should_think():
+            # Over the frame's AI budget: keep going straight, or wait if that is blocked.
+            return exits.get(heading)
+        # Smart AI: Chase player 40% of the time, random 60% of the time
+        if player and random.random() < 0.4:
+            self._choose_smart_direction(player)
+            if self.direction in exits:
+                return exits[self.direction]
+        onward = [corridor for direction, corridor in exits.items() if direction is not opposite(heading)]
+        return random.choice(onward or list(exits.values()))
+
+    def _choose_smart_direction(self, player: "Player") -> None:
+        """Turn towards the player with some logic."""
         # Calculate direction to player
         dx = player.x - self.x
         dy = player.y - self.y
@@ -242,20 +361,16 @@ class Enemy(Drawable, Collidable):
             (Direction.UP, abs(dx - (dy - self._settings.enemy.speed))),
         ]
         
-        best_direction = min(directions, key=lambda x: x[1])[0]
-        self.direction = best_direction
-        
-        return self._get_new_position()
+        self.direction = min(directions, key=lambda x: x[1])[0]
 
-    def _get_new_position(self) -> Tuple[float, float]:
-        dx, dy = self.direction.delta
-        return self.x + dx * self.speed, self.y + dy * self.speed
+    def _sweep(self, direction: Direction) -> float:
+        """Distance the enemy can travel this step without crossing a wall."""
+        return sweep_walls(self.x, self.y, self._settings.grid_size, direction, self.speed, self._state.walls)
 
     def check_collision(self, x: float, y: float) -> bool:
         grid_size = self._settings.grid_size
-        game_state = SingletonGameState()
-        for wall in game_state.walls:
-            if x < wall.x + wall.width and x + grid_size > wall.x and y < wall.y + wall.height and y + grid_size > wall.y:
+        for wall in self._state.walls:
+            if boxes_overlap(x, y, grid_size, grid_size, wall.x, wall.y, wall.width, wall.height):
                 return True
         return False
 
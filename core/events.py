@@ -0,0 +1,102 @@
+"""Typed gameplay events delivered in one batch per simulation tick."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Any, Callable, Mapping, NamedTuple
+
+
+class GameEventType(IntEnum):
+    """Everything the controller announces; values index the dispatch table."""
+
+    LEVEL_STARTED = 0
+    COIN_COLLECTED = 1
+    POWER_PELLET_COLLECTED = 2
+    ENEMY_EATEN = 3
+    PLAYER_DIED = 4
+    GAME_OVER = 5
+    LEVEL_COMPLETE = 6
+    SCORE_CHANGED = 7
+    LIVES_CHANGED = 8
+    POWER_MODE_STARTED = 9
+    POWER_MODE_ENDED = 10
+    FREEZE_STARTED = 11
+    FREEZE_ENDED = 12
+
+
+class GameEvent(NamedTuple):
+    """Where it happened, plus an event specific value (new score, enemy colour...)."""
+
+    type: GameEventType
+    x: float = 0
+    y: float = 0
+    value: Any = None
+
+
+EventHandler = Callable[[GameEvent], None]
+
+
+class Subscription:
+    """Handlers registered together; :meth:`cancel` removes all of them."""
+
+    def __init__(self, bus: "EventBus", handlers: list[tuple[GameEventType, EventHandler]]):
+        self._bus = bus
+        self._handlers = handlers
+
+    def cancel(self) -> None:
+        for event_type, handler in self._handlers:
+            self._bus.unsubscribe(event_type, handler)
+        self._handlers = []
+
+
+class EventBus:
+    """Queue events during a tick and dispatch them all at once in :meth:`flush`.
+
+    Handlers live in a table indexed by event type, so dispatch is a list
+    lookup per event and publishing an event nobody listens to costs one
+    check and allocates nothing. The queue is swapped with a spare list on
+    every flush instead of being reallocated.
+    """
+
+    def __init__(self) -> None:
+        self._table: list[list[EventHandler]] = [[] for _ in GameEventType]
+        self._queue: list[GameEvent] = []
+        self._spare: list[GameEvent] = []
+
+    def subscribe(self, event_type: GameEventType, handler: EventHandler) -> None:
+        self._table[event_type].append(handler)
+
+    def unsubscribe(self, event_type: GameEventType, handler: EventHandler) -> None:
+        handlers = self._table[event_type]
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def subscribe_all(self, handlers: Mapping[GameEventType, EventHandler]) -> Subscription:
+        """Register a consumer's whole dispatch table and return a handle to undo it."""
+        registered = list(handlers.items())
+        for event_type, handler in registered:
+            self.subscribe(event_type, handler)
+        return Subscription(self, registered)
+
+    def publish(self, event_type: GameEventType, x: float = 0, y: float = 0, value: Any = None) -> None:
+        if self._table[event_type]:
+            self._queue.append(GameEvent(event_type, x, y, value))
+
+    def flush(self) -> int:
+        """Deliver the events queued since the last flush; return how many there were."""
+        events = self._queue
+        if not events:
+            return 0
+        # Handlers may publish; those events go out with the next flush.
+        self._queue, self._spare = self._spare, events
+        table = self._table
+        for event in events:
+            for handler in table[event.type]:
+                handler(event)
+        count = len(events)
+        events.clear()
+        return count
+
+    def clear(self) -> None:
+        """Drop queued events without delivering them."""
+        self._queue.clear()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from core.animation import AnimationClock
 from core.entities import Coin, Enemy, Player, PowerPellet, Wall
 from utils.config_loader import GameSettings
 
@@ -9,17 +10,18 @@ from utils.config_loader import GameSettings
 class GameObjectFactory:
     """Centralised creation logic implementing the factory pattern."""
 
-    def __init__(self, settings: GameSettings):
+    def __init__(self, settings: GameSettings, clock: AnimationClock | None = None):
         self._settings = settings
+        self.animation_clock = clock or AnimationClock()
 
     def create_player(self) -> Player:
-        return Player(self._settings)
+        return Player(self._settings, self.animation_clock)
 
-    def create_coin(self, x: int, y: int) -> Coin:
-        return Coin(self._settings, x, y)
+    def create_coin(self, x: int, y: int, phase_offset: int = 0) -> Coin:
+        return Coin(self._settings, x, y, self.animation_clock, phase_offset)
 
-    def create_power_pellet(self, x: int, y: int) -> PowerPellet:
-        return PowerPellet(self._settings, x, y)
+    def create_power_pellet(self, x: int, y: int, phase_offset: int = 0) -> PowerPellet:
+        return PowerPellet(self._settings, x, y, self.animation_clock, phase_offset)
 
     def create_enemy(self, x: int, y: int, color) -> Enemy:
         return Enemy(self._settings, x, y, color)
@@ -5,36 +5,106 @@ from __future__ import annotations
 import random
 import pygame
 
+from core.ai_scheduler import AIScheduler
+from core.animation import AnimationClock
+from core.collision import swept_boxes_overlap
 from core.direction import Direction
+from core.events import EventBus, GameEventType
 from core.factory import GameObjectFactory
 from core.game_state import SingletonGameState
+from core.input_buffer import KEY_DIRECTIONS, InputBuffer
 from core.level_builder import LevelBuilder
 from core.power_mode import PowerMode
+from core.timer_wheel import TimerWheel
 from utils.config_loader import GameSettings
 
 
+_DIRECTION_KEYS = {direction: key for key, direction in KEY_DIRECTIONS.items()}
+
+
 class GameController:
     """Coordinate player input, state updates, and level progression."""
 
     def __init__(self, settings: GameSettings):
         self._settings = settings
-        self.factory = GameObjectFactory(settings)
+        # Cosmetic animation time; advanced every update, including on the end screens.
+        self.animation_clock = AnimationClock()
+        self.factory = GameObjectFactory(settings, self.animation_clock)
         self.game_state = SingletonGameState()
         self.player = self.factory.create_player()
-        self.power_mode = PowerMode(settings)
+        # Gameplay events, delivered to subscribers once at the end of each tick.
+        self.events = EventBus()
+        # Shared clock for timed effects, advanced once per simulation tick.
+        self.timers = TimerWheel()
+        self.power_mode = PowerMode(settings, self.timers, self.events)
+        self.ai_scheduler = AIScheduler(settings.ai.frame_budget_ms, settings.speed.movement_update_rate)
+        self.input_buffer = InputBuffer(settings.input.turn_buffer_ms)
         self.game_over = False
         self.level_complete = False
+        self._pickups_left = 0
+        # Bumped whenever the level geometry is rebuilt so views can drop caches.
+        self.level_generation = 0
 
     def setup_level(self) -> None:
         self.game_state.reset()
         builder = LevelBuilder(self._settings, self.factory)
         builder.build_maze().build_coins().build_power_pellets().build_enemies().build()
+        for enemy in self.game_state.enemies:
+            self.ai_scheduler.stagger(enemy)
+        self._pickups_left = len(self.game_state.coins) + len(self.game_state.power_pellets)
         self.level_complete = False
+        self.level_generation += 1
+        self.events.publish(GameEventType.LEVEL_STARTED, value=self.level_generation)
+
+    def apply_settings(self, settings: GameSettings, changed: frozenset[str]) -> None:
+        """Adopt hot-reloaded settings, invalidating only the affected state.
+
+        Layout changes rebuild the level; every other change is pushed into the
+        live entities so the current round keeps its progress.
+        """
+        old_colors = self._settings.enemy.colors
+        self._settings = settings
+        self.factory = GameObjectFactory(settings, self.animation_clock)
+        self.player.apply_settings(settings)
+        self.power_mode.apply_settings(settings)
+        self.ai_scheduler.configure(settings.ai.frame_budget_ms, settings.speed.movement_update_rate)
+        self.input_buffer.buffer_ms = settings.input.turn_buffer_ms
+
+        if "layout" in changed:
+            self.player.x = settings.grid_size
+            self.player.y = settings.grid_size
+            self.player.mark_position()
+            if self.level_generation:
+                self.setup_level()
+            return
+
+        for entity in (*self.game_state.walls, *self.game_state.coins, *self.game_state.power_pellets):
+            entity.apply_settings(settings)
+        for enemy in self.game_state.enemies:
+            enemy.apply_settings(settings)
+            if "enemy" in changed and enemy.color in old_colors and settings.enemy.colors:
+                enemy.color = settings.enemy.colors[old_colors.index(enemy.color) % len(settings.enemy.colors)]
+
+    def queue_key(self, key: int, timestamp: float | None = None) -> None:
+        """Feed a ``KEYDOWN`` so the turn is kept until it becomes legal."""
+        if self.game_over or self.level_complete:
+            return
+        self.input_buffer.push_key(key, timestamp)
 
     def handle_input(self, pressed_keys: pygame.key.ScancodeWrapper) -> None:
         if self.game_over or self.level_complete:
             return
-        if pressed_keys[pygame.K_LEFT]:
+
+        buffered = self.input_buffer.pending()
+        if buffered is not None and self.player.move(buffered):
+            self.input_buffer.consume()
+            return
+
+        # Held keys keep the player moving; the most recently pressed one wins.
+        latest = self.input_buffer.latest
+        if latest is not None and pressed_keys[_DIRECTION_KEYS[latest]]:
+            self.player.move(latest)
+        elif pressed_keys[pygame.K_LEFT]:
             self.player.move(Direction.LEFT)
         elif pressed_keys[pygame.K_RIGHT]:
             self.player.move(Direction.RIGHT)
@@ -45,43 +115,65 @@ class GameController:
 
     def update(self) -> None:
         if self.game_over or self.level_complete:
+            # The simulation stops, but cosmetic animation (such as the final
+            # burst of particles) plays out on the end screens.
+            self.animation_clock.tick()
+            self.events.flush()
             return
 
-        self.player.update()
-        self.power_mode.update()
-
-        for coin in self.game_state.coins:
-            coin.update()
-
-        for pellet in self.game_state.power_pellets:
-            pellet.update()
+        self.timers.advance()
+        self.animation_clock.tick()
 
-        for enemy in self.game_state.enemies:
-            enemy.update(self.power_mode.active, self.power_mode.freeze_active, self.player)
+        enemies = self.game_state.enemies
+        enemy_count = len(enemies)
+        start = self.ai_scheduler.begin_frame(enemy_count)
+        for offset in range(enemy_count):
+            enemies[(start + offset) % enemy_count].update(
+                self.power_mode.active, self.power_mode.freeze_active, self.player, self.ai_scheduler
+            )
 
         self._check_coin_collection()
         self._check_power_pellet_collection()
         self._check_enemy_collision()
         self._check_win_condition()
 
+        # Positions at the end of this tick are where next tick's sweeps start.
+        self.player.mark_position()
+        for enemy in self.game_state.enemies:
+            enemy.mark_position()
+        self.events.flush()
+
     def restart(self) -> None:
+        self.input_buffer.clear()
         self.player = self.factory.create_player()
-        self.power_mode = PowerMode(self._settings)
+        self.power_mode.discard()
+        self.timers.clear()
+        self.power_mode = PowerMode(self._settings, self.timers, self.events)
         self.game_over = False
         self.level_complete = False
         self.setup_level()
+        self.events.publish(GameEventType.SCORE_CHANGED, value=self.player.score)
+        self.events.publish(GameEventType.LIVES_CHANGED, value=self.player.lives)
 
     def next_level(self) -> None:
+        self.input_buffer.clear()
         self.player.lives += 1
+        self.events.publish(GameEventType.LIVES_CHANGED, value=self.player.lives)
         self.player.x = self._settings.grid_size
         self.player.y = self._settings.grid_size
-        self.power_mode = PowerMode(self._settings)
+        self.player.mark_position()
+        self.power_mode.discard()
+        self.timers.clear()
+        self.power_mode = PowerMode(self._settings, self.timers, self.events)
         self.setup_level()
         if len(self.game_state.enemies) < 5 and self._settings.enemy.colors:
             color = (128, 0, 128)
-            self.game_state.enemies.append(
-                self.factory.create_enemy(self._settings.grid_size * 2, self._settings.grid_size * 7, color)
-            )
+            self._spawn_enemy(self._settings.grid_size * 2, self._settings.grid_size * 7, color)
+
+    def _spawn_enemy(self, x: int, y: int, color) -> None:
+        enemy = self.factory.create_enemy(x, y, color)
+        self.ai_scheduler.stagger(enemy)
+        self.game_state.enemies.append(enemy)
 
     def _check_coin_collection(self) -> None:
         grid = self._settings.grid_size
@@ -90,7 +182,10 @@ class GameController:
                 continue
             if self.player.x < coin.x + grid and self.player.x + grid > coin.x and self.player.y < coin.y + grid and self.player.y + grid > coin.y:
                 coin.collected = True
+                self._pickups_left -= 1
                 self.player.score += self._settings.player.score_per_coin
+                self.events.publish(GameEventType.COIN_COLLECTED, coin.x, coin.y)
+                self.events.publish(GameEventType.SCORE_CHANGED, value=self.player.score)
                 # 15% chance to freeze enemies when collecting a coin
                 if random.random() < 0.15:
                     self.power_mode.activate_freeze()
@@ -102,32 +197,52 @@ class GameController:
                 continue
             if self.player.x < pellet.x + grid and self.player.x + grid > pellet.x and self.player.y < pellet.y + grid and self.player.y + grid > pellet.y:
                 pellet.collected = True
+                self._pickups_left -= 1
                 self.player.score += self._settings.player.score_per_power_pellet
+                self.events.publish(GameEventType.POWER_PELLET_COLLECTED, pellet.x, pellet.y)
+                self.events.publish(GameEventType.SCORE_CHANGED, value=self.player.score)
                 self.power_mode.activate()
 
     def _check_enemy_collision(self) -> None:
         grid = self._settings.grid_size
-        enemies_snapshot = list(self.game_state.enemies)
-        for enemy in enemies_snapshot:
-            if self.player.x < enemy.x + grid and self.player.x + grid > enemy.x and self.player.y < enemy.y + grid and self.player.y + grid > enemy.y:
+        enemies = self.game_state.enemies
+        player = self.player
+        # Visit the enemies present at the start of the tick by index, without
+        # copying the list: eaten ones are deleted in place and their
+        # replacements are appended past ``end``.
+        index, end = 0, len(enemies)
+        while index < end:
+            enemy = enemies[index]
+            index += 1
+            # Swept test over this tick's motion so fast movers cannot pass through each other.
+            if swept_boxes_overlap((player.prev_x, player.prev_y), (player.x, player.y), (enemy.prev_x, enemy.prev_y), (enemy.x, enemy.y), grid):
                 if self.power_mode.active:
-                    self.game_state.enemies.remove(enemy)
+                    index -= 1
+                    end -= 1
+                    del enemies[index]
                     self.player.score += self._settings.player.score_per_enemy
+                    self.events.publish(GameEventType.ENEMY_EATEN, enemy.x, enemy.y, enemy.color)
+                    self.events.publish(GameEventType.SCORE_CHANGED, value=self.player.score)
                     spawn_x = self._settings.grid_size * random.randint(1, self._settings.grid_width - 2)
                     spawn_y = self._settings.grid_size * random.randint(1, self._settings.grid_height - 2)
                     if self._settings.enemy.colors:
                         color = random.choice(self._settings.enemy.colors)
                     else:
                         color = (255, 0, 0)
-                    self.game_state.enemies.append(self.factory.create_enemy(spawn_x, spawn_y, color))
+                    self._spawn_enemy(spawn_x, spawn_y, color)
                 else:
                     self.player.lives -= 1
+                    self.events.publish(GameEventType.PLAYER_DIED, player.x, player.y, self.player.lives)
+                    self.events.publish(GameEventType.LIVES_CHANGED, value=self.player.lives)
                     if self.player.lives <= 0:
                         self.game_over = True
+                        self.events.publish(GameEventType.GAME_OVER, value=self.player.score)
                     else:
                         self.player.x = self._settings.grid_size
                         self.player.y = self._settings.grid_size
+                        self.player.mark_position()
 
     def _check_win_condition(self) -> None:
-        if all(coin.collected for coin in self.game_state.coins) and all(pellet.collected for pellet in self.game_state.power_pellets):
+        if self._pickups_left <= 0:
             self.level_complete = True
+            self.events.publish(GameEventType.LEVEL_COMPLETE, self.player.x, self.player.y, self.level_generation)
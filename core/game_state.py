@@ -14,6 +14,8 @@ class SingletonGameState:
             cls._instance.coins = []
             cls._instance.power_pellets = []
             cls._instance.enemies = []
+            # JunctionGraph of the current maze, set by LevelBuilder.build_maze.
+            cls._instance.navigation = None
         return cls._instance
 
     def reset(self) -> None:
@@ -22,3 +24,4 @@ class SingletonGameState:
         self.coins.clear()
         self.power_pellets.clear()
         self.enemies.clear()
+        self.navigation = None
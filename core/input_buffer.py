@@ -0,0 +1,78 @@
+"""Event-driven turn buffering and input latency tracking."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+import pygame
+
+from core.direction import Direction
+from utils.stats import percentiles
+
+KEY_DIRECTIONS = {
+    pygame.K_LEFT: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT,
+    pygame.K_UP: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN,
+}
+
+
+class InputBuffer:
+    """Remember the latest requested turn until the player can take it.
+
+    Key presses are fed in from ``KEYDOWN`` events with the time they were read,
+    so a turn pressed just before a corridor opens, or a tap shorter than a
+    frame, is not lost. The delay between reading the event and the player
+    actually moving that way is sampled for latency percentiles. It starts at
+    dequeue, not at the key press: pygame does not expose SDL's event
+    timestamps, so time spent in the event queue is not included.
+    """
+
+    def __init__(self, buffer_ms: float = 250, sample_size: int = 2048):
+        self.buffer_ms = buffer_ms
+        self._pending: Direction | None = None
+        self._pending_since = 0.0
+        self.latest: Direction | None = None
+        self._samples: deque[float] = deque(maxlen=sample_size)
+
+    def push_key(self, key: int, timestamp: float | None = None) -> None:
+        """Record a key press; ``timestamp`` is in ``time.perf_counter`` seconds."""
+        direction = KEY_DIRECTIONS.get(key)
+        if direction is None:
+            return
+        self._pending = direction
+        self._pending_since = time.perf_counter() if timestamp is None else timestamp
+        self.latest = direction
+
+    def pending(self, now: float | None = None) -> Direction | None:
+        """The buffered turn, or ``None`` once it has been taken or has expired."""
+        if self._pending is None:
+            return None
+        now = time.perf_counter() if now is None else now
+        if (now - self._pending_since) * 1000 > self.buffer_ms:
+            self._pending = None
+        return self._pending
+
+    def consume(self, now: float | None = None) -> None:
+        """Mark the buffered turn as performed and sample its latency."""
+        if self._pending is None:
+            return
+        now = time.perf_counter() if now is None else now
+        self._samples.append((now - self._pending_since) * 1000)
+        self._pending = None
+
+    def clear(self) -> None:
+        self._pending = None
+        self.latest = None
+
+    def latency_percentiles(self, points: tuple[int, ...] = (50, 95, 99)) -> dict[int, float]:
+        """Dequeue-to-move latency in milliseconds for the requested percentiles."""
+        return percentiles(self._samples, points)
+
+    def latency_report(self) -> str:
+        stats = self.latency_percentiles()
+        if not stats:
+            return "Input dequeue-to-move latency: no buffered turns recorded"
+        parts = ", ".join(f"p{percentile} {value:.1f} ms" for percentile, value in stats.items())
+        return f"Input dequeue-to-move latency over {len(self._samples)} turns: {parts}"
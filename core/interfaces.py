@@ -12,6 +12,10 @@ class Drawable(ABC):
     def draw(self, surface) -> None:  # type: ignore[override]
         """Draw the object to the provided surface."""
 
+    def apply_settings(self, settings) -> None:
+        """Swap in reloaded settings; override to refresh derived attributes."""
+        self._settings = settings
+
 
 class Collidable(ABC):
     """Interface for objects that can participate in collision checks."""
@@ -0,0 +1,77 @@
+"""Junctions of a maze and the straight corridors that connect them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from core.direction import Direction
+from core.maze_grid import MazeGrid
+
+_OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
+
+def opposite(direction: Direction) -> Direction:
+    return _OPPOSITE[direction]
+
+
+@dataclass(frozen=True)
+class Corridor:
+    """A straight run of open tiles ending at the junction ``end``."""
+
+    direction: Direction
+    length: int
+    end: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class JunctionGraph:
+    """Decision points of a maze, compiled once per level geometry.
+
+    A junction is any open tile where carrying straight on is not the only
+    move: intersections, corners and dead ends. Between junctions a mover can
+    only continue, so ``routes`` maps every open tile to the corridor ahead in
+    each open direction; an entity following one needs no wall checks until it
+    reaches ``end``.
+    """
+
+    columns: int
+    rows: int
+    junctions: frozenset[tuple[int, int]]
+    routes: dict[tuple[int, int], dict[Direction, Corridor]]
+
+    @classmethod
+    def from_grid(cls, maze: MazeGrid) -> "JunctionGraph":
+        open_moves = {tile: maze.open_neighbours(*tile) for tile in maze.open_tiles()}
+        junctions = frozenset(tile for tile, moves in open_moves.items() if not _is_straight(moves))
+        routes: dict[tuple[int, int], dict[Direction, Corridor]] = {}
+        for tile, moves in open_moves.items():
+            ahead = {}
+            for direction in moves:
+                dx, dy = direction.delta
+                col, row = tile
+                length = 0
+                while True:
+                    col += dx
+                    row += dy
+                    length += 1
+                    if (col, row) in junctions:
+                        break
+                ahead[direction] = Corridor(direction, length, (col, row))
+            routes[tile] = ahead
+        return cls(maze.columns, maze.rows, junctions, routes)
+
+    def is_junction(self, col: int, row: int) -> bool:
+        return (col, row) in self.junctions
+
+    def exits(self, col: int, row: int) -> dict[Direction, Corridor]:
+        """Corridors leaving an open tile, keyed by direction; empty for walls."""
+        return self.routes.get((col, row), {})
+
+
+def _is_straight(moves: list[Direction]) -> bool:
+    return len(moves) == 2 and moves[0] is opposite(moves[1])
@@ -3,12 +3,82 @@
 from __future__ import annotations
 
 import random
+from dataclasses import dataclass
 
 from core.factory import GameObjectFactory
 from core.game_state import SingletonGameState
+from core.junction_graph import JunctionGraph
+from core.maze_grid import MazeGrid
 from utils.config_loader import GameSettings
 
 
+@dataclass(frozen=True)
+class CompiledLevel:
+    """Pixel positions of everything a level contains, derived once per geometry."""
+
+    walls: tuple[tuple[int, int, int, int], ...]
+    coins: tuple[tuple[int, int], ...]
+    power_pellets: tuple[tuple[int, int], ...]
+    enemies: tuple[tuple[int, int], ...]
+    navigation: JunctionGraph
+
+
+# Classic Pac-Man style maze with connected corridors and chambers, as
+# ``(column, row, columns, rows)`` tile rectangles inside the border. It fills
+# one block of ``_BLOCK_SIZE`` tiles starting at tile (1, 1).
+_CLASSIC_INTERIOR = (
+    # Top left chamber
+    (2, 2, 3, 1),
+    (2, 2, 1, 3),
+
+    # Top center area
+    (6, 2, 2, 3),
+    (9, 2, 3, 1),
+    (12, 2, 2, 3),
+
+    # Top right chamber
+    (15, 2, 3, 1),
+    (17, 2, 1, 3),
+
+    # Upper middle section - horizontal barriers
+    (2, 6, 2, 1),
+    (5, 6, 3, 1),
+    (9, 5, 2, 3),
+    (12, 6, 3, 1),
+    (16, 6, 2, 1),
+
+    # Center ghost house
+    (7, 8, 6, 1),
+    (7, 8, 1, 2),
+    (12, 8, 1, 2),
+    (7, 10, 6, 1),
+
+    # Lower middle section
+    (2, 8, 2, 2),
+    (5, 9, 2, 1),
+    (13, 9, 2, 1),
+    (16, 8, 2, 2),
+
+    # Bottom left chamber
+    (2, 11, 1, 2),
+    (2, 11, 3, 1),
+
+    # Bottom center
+    (6, 11, 2, 2),
+    (9, 12, 2, 1),
+    (12, 11, 2, 2),
+
+    # Bottom right chamber
+    (15, 11, 3, 1),
+    (17, 11, 1, 2),
+)
+_BLOCK_SIZE = (18, 13)
+
+# Keyed by level geometry; filled lazily, or up front by a preforking parent so
+# forked workers share the compiled data instead of recomputing it.
+_compiled_levels: dict[tuple[int, ...], CompiledLevel] = {}
+
+
 class LevelBuilder:
     """Incrementally assemble a level using the builder pattern."""
 
@@ -17,104 +87,117 @@ class LevelBuilder:
         self._state = SingletonGameState()
         self._factory = factory or GameObjectFactory(settings)
 
+    def compile(self) -> CompiledLevel:
+        """Return the cached layout for the current geometry, computing it on first use."""
+        settings = self._settings
+        key = (settings.width, settings.height, settings.grid_size, settings.grid_width, settings.grid_height)
+        compiled = _compiled_levels.get(key)
+        if compiled is None:
+            walls = tuple(self.maze_layout())
+            maze = MazeGrid.from_rects(settings.grid_size, settings.grid_width, settings.grid_height, walls)
+            compiled = CompiledLevel(
+                walls=walls,
+                coins=tuple(self.coin_positions(maze)),
+                power_pellets=tuple(self.power_pellet_positions()),
+                enemies=tuple(self.enemy_positions()),
+                navigation=JunctionGraph.from_grid(maze),
+            )
+            _compiled_levels[key] = compiled
+        return compiled
+
     def build_maze(self) -> "LevelBuilder":
+        compiled = self.compile()
+        for x, y, w, h in compiled.walls:
+            self._state.walls.append(self._factory.create_wall(x, y, w, h))
+        self._state.navigation = compiled.navigation
+        return self
+
+    def maze_layout(self) -> list[tuple[int, int, int, int]]:
+        """Return the wall rectangles ``(x, y, width, height)`` without building them.
+
+        The classic interior is repeated across mazes larger than one block,
+        clipped to the border; at the default size it appears exactly once.
+        """
         grid = self._settings.grid_size
-        width = self._settings.width
-        height = self._settings.height
+        columns = self._settings.grid_width
+        rows = self._settings.grid_height
+        width = columns * grid
+        height = rows * grid
 
-        # Classic Pac-Man style maze with connected corridors and chambers
         walls_data = [
             # Border walls
             (0, 0, width, grid),
             (0, height - grid, width, grid),
             (0, 0, grid, height),
             (width - grid, 0, grid, height),
-            
-            # Top left chamber
-            (grid * 2, grid * 2, grid * 3, grid),
-            (grid * 2, grid * 2, grid, grid * 3),
-            
-            # Top center area
-            (grid * 6, grid * 2, grid * 2, grid * 3),
-            (grid * 9, grid * 2, grid * 3, grid),
-            (grid * 12, grid * 2, grid * 2, grid * 3),
-            
-            # Top right chamber
-            (grid * 15, grid * 2, grid * 3, grid),
-            (grid * 17, grid * 2, grid, grid * 3),
-            
-            # Upper middle section - horizontal barriers
-            (grid * 2, grid * 6, grid * 2, grid),
-            (grid * 5, grid * 6, grid * 3, grid),
-            (grid * 9, grid * 5, grid * 2, grid * 3),
-            (grid * 12, grid * 6, grid * 3, grid),
-            (grid * 16, grid * 6, grid * 2, grid),
-            
-            # Center ghost house
-            (grid * 7, grid * 8, grid * 6, grid),
-            (grid * 7, grid * 8, grid, grid * 2),
-            (grid * 12, grid * 8, grid, grid * 2),
-            (grid * 7, grid * 10, grid * 6, grid),
-            
-            # Lower middle section
-            (grid * 2, grid * 8, grid * 2, grid * 2),
-            (grid * 5, grid * 9, grid * 2, grid),
-            (grid * 13, grid * 9, grid * 2, grid),
-            (grid * 16, grid * 8, grid * 2, grid * 2),
-            
-            # Bottom left chamber
-            (grid * 2, grid * 11, grid, grid * 2),
-            (grid * 2, grid * 11, grid * 3, grid),
-            
-            # Bottom center
-            (grid * 6, grid * 11, grid * 2, grid * 2),
-            (grid * 9, grid * 12, grid * 2, grid),
-            (grid * 12, grid * 11, grid * 2, grid * 2),
-            
-            # Bottom right chamber
-            (grid * 15, grid * 11, grid * 3, grid),
-            (grid * 17, grid * 11, grid, grid * 2),
         ]
+        block_columns, block_rows = _BLOCK_SIZE
+        for block_row in range(max(1, -(-(rows - 2) // block_rows))):
+            for block_col in range(max(1, -(-(columns - 2) // block_columns))):
+                col_shift = block_col * block_columns
+                row_shift = block_row * block_rows
+                for col, row, span_cols, span_rows in _CLASSIC_INTERIOR:
+                    left = max(col + col_shift, 1)
+                    top = max(row + row_shift, 1)
+                    right = min(col + col_shift + span_cols, columns - 1)
+                    bottom = min(row + row_shift + span_rows, rows - 1)
+                    if left < right and top < bottom:
+                        walls_data.append((left * grid, top * grid, (right - left) * grid, (bottom - top) * grid))
+        return walls_data
 
-        for x, y, w, h in walls_data:
-            self._state.walls.append(self._factory.create_wall(x, y, w, h))
+    def build_coins(self) -> "LevelBuilder":
+        for x, y in self.compile().coins:
+            self._state.coins.append(self._factory.create_coin(x, y))
         return self
 
-    def build_coins(self) -> "LevelBuilder":
+    def coin_positions(self, maze: MazeGrid) -> list[tuple[int, int]]:
+        """Return the coin positions for ``maze``, this builder's wall grid, without building them."""
         grid = self._settings.grid_size
+        positions = []
         # Place coins in all open corridors (like original Pac-Man)
         for row in range(1, self._settings.grid_height - 1):
             for col in range(1, self._settings.grid_width - 1):
-                pos_x, pos_y = col * grid, row * grid
                 # Skip the center ghost house area
-                if 7 <= col <= 12 and 8 <= row <= 10:
+                if self.in_ghost_house(col, row):
                     continue
                 # Place coin if no wall
-                if not self._has_wall(pos_x, pos_y):
-                    self._state.coins.append(self._factory.create_coin(pos_x, pos_y))
-        return self
+                if not maze.is_wall(col, row):
+                    positions.append((col * grid, row * grid))
+        return positions
+
+    @staticmethod
+    def in_ghost_house(col: int, row: int) -> bool:
+        """Whether a tile lies in a block's central ghost house, which holds no coins."""
+        block_col = (col - 1) % _BLOCK_SIZE[0] + 1
+        block_row = (row - 1) % _BLOCK_SIZE[1] + 1
+        return 7 <= block_col <= 12 and 8 <= block_row <= 10
 
     def build_power_pellets(self) -> "LevelBuilder":
+        for x, y in self.compile().power_pellets:
+            self._state.power_pellets.append(self._factory.create_power_pellet(x, y))
+        return self
+
+    def power_pellet_positions(self) -> list[tuple[int, int]]:
         grid = self._settings.grid_size
-        positions = [
+        return [
             (grid * 1, grid * 1),
             (grid * (self._settings.grid_width - 2), grid * 1),
             (grid * 1, grid * (self._settings.grid_height - 2)),
             (grid * (self._settings.grid_width - 2), grid * (self._settings.grid_height - 2)),
         ]
-        for x, y in positions:
-            self._state.power_pellets.append(self._factory.create_power_pellet(x, y))
-        return self
 
-    def build_enemies(self, count: int = 4) -> "LevelBuilder":
+    def enemy_positions(self) -> list[tuple[int, int]]:
         grid = self._settings.grid_size
-        colors = self._settings.enemy.colors
-        positions = [
+        return [
             (grid * 3, grid * 3),
             (grid * 4, grid * 4),
             (grid * 5, grid * 3),
             (grid * 4, grid * 5),
         ]
+
+    def build_enemies(self, count: int = 4) -> "LevelBuilder":
+        colors = self._settings.enemy.colors
+        positions = self.compile().enemies
         for idx in range(min(count, len(positions))):
             x, y = positions[idx]
             self._state.enemies.append(self._factory.create_enemy(x, y, colors[idx % len(colors)]))
@@ -122,10 +205,3 @@ class LevelBuilder:
 
     def build(self) -> SingletonGameState:
         return self._state
-
-    def _has_wall(self, x: int, y: int) -> bool:
-        grid = self._settings.grid_size
-        for wall in self._state.walls:
-            if x < wall.x + wall.width and x + grid > wall.x and y < wall.y + wall.height and y + grid > wall.y:
-                return True
-        return False
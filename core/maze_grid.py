@@ -0,0 +1,55 @@
+"""Tile-level view of a maze built from wall rectangles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from core.direction import Direction
+
+
+@dataclass(frozen=True)
+class MazeGrid:
+    """Immutable occupancy grid with one byte per tile (1 = wall)."""
+
+    columns: int
+    rows: int
+    walls: bytes
+
+    @classmethod
+    def from_rects(cls, grid_size: int, columns: int, rows: int, rects: Iterable[tuple[int, int, int, int]]) -> "MazeGrid":
+        """Rasterise pixel-space wall rectangles onto the tile grid.
+
+        A tile counts as a wall when any rectangle overlaps it, which matches
+        how ``LevelBuilder`` decides where coins may go.
+        """
+        cells = bytearray(columns * rows)
+        for x, y, width, height in rects:
+            first_col = max(0, x // grid_size)
+            last_col = min(columns - 1, (x + width - 1) // grid_size)
+            first_row = max(0, y // grid_size)
+            last_row = min(rows - 1, (y + height - 1) // grid_size)
+            for row in range(first_row, last_row + 1):
+                start = row * columns
+                cells[start + first_col:start + last_col + 1] = b"\x01" * (last_col - first_col + 1)
+        return cls(columns, rows, bytes(cells))
+
+    @classmethod
+    def from_walls(cls, grid_size: int, columns: int, rows: int, walls: Iterable) -> "MazeGrid":
+        """Rasterise ``Wall`` entities (anything with x, y, width and height)."""
+        return cls.from_rects(grid_size, columns, rows, ((w.x, w.y, w.width, w.height) for w in walls))
+
+    def is_wall(self, col: int, row: int) -> bool:
+        if not (0 <= col < self.columns and 0 <= row < self.rows):
+            return True
+        return self.walls[row * self.columns + col] == 1
+
+    def open_tiles(self) -> Iterator[tuple[int, int]]:
+        for row in range(self.rows):
+            for col in range(self.columns):
+                if not self.walls[row * self.columns + col]:
+                    yield col, row
+
+    def open_neighbours(self, col: int, row: int) -> list[Direction]:
+        """Directions leading from an open tile to an adjacent open tile."""
+        return [direction for direction in Direction if not self.is_wall(col + direction.delta[0], row + direction.delta[1])]
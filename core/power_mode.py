@@ -2,39 +2,76 @@
 
 from __future__ import annotations
 
+from core.events import EventBus, GameEventType
+from core.timer_wheel import TimerHandle, TimerWheel
 from utils.config_loader import GameSettings
 
 
 class PowerMode:
-    """Handle temporary empowered state for the player."""
+    """Handle temporary empowered state for the player.
 
-    def __init__(self, settings: GameSettings):
+    Expiry is registered on the shared :class:`TimerWheel`, so nothing is
+    decremented per frame; the wheel flips the flags off when the effect ends.
+    Starts and ends are published on ``events`` when one is given.
+    """
+
+    def __init__(self, settings: GameSettings, timers: TimerWheel, events: EventBus | None = None):
         self._settings = settings
+        self._timers = timers
+        self._events = events
         self.active = False
-        self.timer = 0
         self.freeze_active = False
-        self.freeze_timer = 0
+        self._power_timer: TimerHandle | None = None
+        self._freeze_timer: TimerHandle | None = None
+
+    @property
+    def timer(self) -> int:
+        """Ticks of power mode left."""
+        return self._timers.remaining(self._power_timer)
+
+    @property
+    def freeze_timer(self) -> int:
+        """Ticks of enemy freeze left."""
+        return self._timers.remaining(self._freeze_timer)
+
+    def apply_settings(self, settings: GameSettings) -> None:
+        """Use reloaded settings; a running timer keeps its remaining ticks."""
+        self._settings = settings
 
     def activate(self) -> None:
         if not self._settings.power_mode.enabled:
             return
         self.active = True
-        self.timer = self._settings.power_mode.duration
+        self._timers.cancel(self._power_timer)
+        self._power_timer = self._timers.schedule(self._settings.power_mode.duration, self._end_power)
+        self._publish(GameEventType.POWER_MODE_STARTED)
 
     def activate_freeze(self) -> None:
         """Freeze all enemies temporarily."""
         if not self._settings.power_mode.enabled:
             return
         self.freeze_active = True
-        self.freeze_timer = self._settings.power_mode.duration
+        self._timers.cancel(self._freeze_timer)
+        self._freeze_timer = self._timers.schedule(self._settings.power_mode.duration, self._end_freeze)
+        self._publish(GameEventType.FREEZE_STARTED)
 
-    def update(self) -> None:
+    def discard(self) -> None:
+        """End any running effect before this instance is replaced, so listeners see it end."""
+        self._timers.cancel(self._power_timer)
+        self._timers.cancel(self._freeze_timer)
         if self.active:
-            self.timer -= 1
-            if self.timer <= 0:
-                self.active = False
-        
+            self._end_power()
         if self.freeze_active:
-            self.freeze_timer -= 1
-            if self.freeze_timer <= 0:
-                self.freeze_active = False
+            self._end_freeze()
+
+    def _end_power(self) -> None:
+        self.active = False
+        self._publish(GameEventType.POWER_MODE_ENDED)
+
+    def _end_freeze(self) -> None:
+        self.freeze_active = False
+        self._publish(GameEventType.FREEZE_ENDED)
+
+    def _publish(self, event_type: GameEventType) -> None:
+        if self._events is not None:
+            self._events.publish(event_type)
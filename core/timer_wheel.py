@@ -0,0 +1,85 @@
+"""Hashed timer wheel driven by the simulation tick."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+
+class TimerHandle:
+    """A scheduled callback; keep it to query the remaining time or cancel it.
+
+    ``done`` becomes true once the timer has fired or been cancelled.
+    """
+
+    __slots__ = ("deadline", "callback", "done")
+
+    def __init__(self, deadline: int, callback: Callable[[], None]):
+        self.deadline = deadline
+        self.callback = callback
+        self.done = False
+
+
+class TimerWheel:
+    """Schedule callbacks a number of ticks ahead.
+
+    Timers are hashed into ``slots`` buckets by deadline, so advancing one tick
+    only inspects the bucket for that tick instead of every active effect.
+    Time is counted in simulation ticks, never wall-clock time, which keeps
+    expiry exact when the game is stepped with a fixed timestep or fast-forwarded
+    with ``advance(ticks)``.
+    """
+
+    def __init__(self, slots: int = 256):
+        self.now = 0
+        self._slots: list[list[TimerHandle]] = [[] for _ in range(slots)]
+        self._pending = 0
+
+    def schedule(self, delay: int, callback: Callable[[], None]) -> TimerHandle:
+        """Run ``callback`` after ``delay`` ticks (at least one)."""
+        handle = TimerHandle(self.now + max(1, delay), callback)
+        self._slots[handle.deadline % len(self._slots)].append(handle)
+        self._pending += 1
+        return handle
+
+    def cancel(self, handle: TimerHandle | None) -> None:
+        """Cancel a timer; it is discarded when its slot comes up."""
+        if handle is not None:
+            handle.done = True
+
+    def remaining(self, handle: TimerHandle | None) -> int:
+        """Ticks left before ``handle`` fires, or 0 if it is gone."""
+        if handle is None or handle.done:
+            return 0
+        return max(0, handle.deadline - self.now)
+
+    def advance(self, ticks: int = 1) -> None:
+        """Move time forward, firing due callbacks in deadline order."""
+        target = self.now + ticks
+        while self.now < target:
+            if not self._pending:
+                self.now = target
+                return
+            self.now += 1
+            bucket = self._slots[self.now % len(self._slots)]
+            if bucket:
+                self._fire(bucket)
+
+    def clear(self) -> None:
+        """Drop every pending timer without firing it."""
+        for bucket in self._slots:
+            for handle in bucket:
+                handle.done = True
+            bucket.clear()
+        self._pending = 0
+
+    def _fire(self, bucket: list[TimerHandle]) -> None:
+        now = self.now
+        due = [handle for handle in bucket if handle.deadline == now]
+        if not due:
+            return
+        bucket[:] = [handle for handle in bucket if handle.deadline != now]
+        self._pending -= len(due)
+        for handle in due:
+            if not handle.done:
+                handle.done = True
+                handle.callback()
@@ -0,0 +1,280 @@
+"""Batched, render-free simulation of the game for bots and automated QA.
+
+``VectorGameEnv`` steps many independent games in lockstep with NumPy. It is a
+tile-level model of the real game: the maze, coins, pellets, enemy spawns and
+scores come from the same ``LevelBuilder`` and settings, one step is the time
+the player needs to cross one tile, and enemies move at their configured speed
+relative to the player. Nothing touches pygame or ``SingletonGameState``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+from core.direction import Direction
+from core.level_builder import LevelBuilder
+from core.maze_grid import MazeGrid
+from utils.config_loader import GameSettings
+
+# Action ids accepted by ``step``: 0 keeps the player still.
+ACTIONS: tuple[Direction | None, ...] = (None, Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+OBSERVATION_CHANNELS = ("walls", "coins", "power_pellets", "enemies", "player")
+
+_ENEMY_DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+_CHASE_PROBABILITY = 0.4
+_FREEZE_PROBABILITY = 0.15
+
+# Salts that keep the per-purpose random streams independent.
+_SALT_START_DIRECTION = 1
+_SALT_CHASE = 2
+_SALT_WANDER = 3
+_SALT_FREEZE = 4
+_SALT_RESPAWN = 5
+
+
+def _uniform(seeds: np.ndarray, counters: np.ndarray, salt: int, width: int) -> np.ndarray:
+    """Counter-based uniforms in [0, 1) of shape ``(len(seeds), width)``.
+
+    Each value depends only on its environment's seed, that environment's own
+    step counter, the salt and the column, so sub-environments stay reproducible
+    no matter how they are batched.
+    """
+    lanes = np.arange(width, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        z = seeds[:, None] ^ (counters[:, None] * np.uint64(0xD1B54A32D192ED03))
+        z = z ^ ((lanes + np.uint64(salt << 32)) * np.uint64(0x9E3779B97F4A7C15))
+        z = z + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+class VectorGameEnv:
+    """Step ``num_envs`` games at once from a batch of action ids.
+
+    ``reset`` returns observations shaped ``(num_envs, 5, rows, columns)`` with
+    one ``uint8`` tile map per entry of :data:`OBSERVATION_CHANNELS`. ``step``
+    returns ``(observations, rewards, dones, info)``; finished games are reset
+    automatically and ``info`` carries their final score and outcome.
+    """
+
+    def __init__(self, settings: GameSettings, num_envs: int, seed: int | Sequence[int] | None = None, max_steps: int = 2000):
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self._settings = settings
+
+        builder = LevelBuilder(settings)
+        grid = settings.grid_size
+        maze = MazeGrid.from_rects(grid, settings.grid_width, settings.grid_height, builder.maze_layout())
+        rows, columns = maze.rows, maze.columns
+        self.observation_shape = (len(OBSERVATION_CHANNELS), rows, columns)
+        self.action_count = len(ACTIONS)
+
+        self._walls = np.frombuffer(maze.walls, dtype=np.uint8).reshape(rows, columns).astype(bool)
+        self._coin_template = np.zeros((rows, columns), dtype=bool)
+        for x, y in builder.coin_positions(maze):
+            self._coin_template[y // grid, x // grid] = True
+        self._pellet_template = np.zeros((rows, columns), dtype=bool)
+        for x, y in builder.power_pellet_positions():
+            self._pellet_template[y // grid, x // grid] = True
+        spawns = builder.enemy_positions()
+        self._spawn_rows = np.array([y // grid for _, y in spawns], dtype=np.int64)
+        self._spawn_cols = np.array([x // grid for x, _ in spawns], dtype=np.int64)
+        enemies = len(spawns)
+
+        # Time scale: one step is one tile of player movement.
+        ticks_per_step = grid / max(1, settings.player.speed)
+        self._enemy_tiles_per_step = settings.enemy.speed / max(1, settings.speed.movement_update_rate) / grid * ticks_per_step
+        self._effect_steps = max(1, math.ceil(settings.power_mode.duration / ticks_per_step)) if settings.power_mode.enabled else 0
+
+        action_deltas = [(0, 0)] + [(d.delta[1], d.delta[0]) for d in ACTIONS[1:]]
+        self._action_drow = np.array([d[0] for d in action_deltas], dtype=np.int64)
+        self._action_dcol = np.array([d[1] for d in action_deltas], dtype=np.int64)
+        self._enemy_drow = np.array([d.delta[1] for d in _ENEMY_DIRECTIONS], dtype=np.int64)
+        self._enemy_dcol = np.array([d.delta[0] for d in _ENEMY_DIRECTIONS], dtype=np.int64)
+
+        k = num_envs
+        self._coins = np.zeros((k, rows, columns), dtype=bool)
+        self._pellets = np.zeros((k, rows, columns), dtype=bool)
+        self._player_row = np.ones(k, dtype=np.int64)
+        self._player_col = np.ones(k, dtype=np.int64)
+        self._enemy_row = np.zeros((k, enemies), dtype=np.int64)
+        self._enemy_col = np.zeros((k, enemies), dtype=np.int64)
+        self._enemy_dir = np.zeros((k, enemies), dtype=np.int64)
+        self._enemy_progress = np.zeros(k, dtype=np.float64)
+        self._power_left = np.zeros(k, dtype=np.int64)
+        self._freeze_left = np.zeros(k, dtype=np.int64)
+        self._lives = np.zeros(k, dtype=np.int64)
+        self._score = np.zeros(k, dtype=np.int64)
+        self._steps = np.zeros(k, dtype=np.int64)
+        self._seeds = np.zeros(k, dtype=np.uint64)
+        self._counters = np.zeros(k, dtype=np.uint64)
+        self._observations = np.zeros((k, *self.observation_shape), dtype=np.uint8)
+        self._observations[:, 0] = self._walls
+        self._env_index = np.arange(k)
+
+        self.seed(seed)
+
+    def seed(self, seed: int | Sequence[int] | None = None) -> None:
+        """Seed every sub-environment, either from one root seed or one seed each."""
+        if seed is not None and not isinstance(seed, int):
+            seeds = np.asarray(seed, dtype=np.uint64)
+            if seeds.shape != (self.num_envs,):
+                raise ValueError(f"Expected {self.num_envs} seeds, got {seeds.shape}")
+            self._seeds[:] = seeds
+        else:
+            self._seeds[:] = np.random.SeedSequence(seed).generate_state(self.num_envs, dtype=np.uint64)
+        self._counters[:] = 0
+
+    def reset(self, seed: int | Sequence[int] | None = None) -> np.ndarray:
+        if seed is not None:
+            self.seed(seed)
+        self._reset_envs(np.ones(self.num_envs, dtype=bool))
+        return self._observe()
+
+    def step(self, actions: Sequence[int] | np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        actions = np.asarray(actions, dtype=np.int64)
+        if actions.shape != (self.num_envs,):
+            raise ValueError(f"Expected {self.num_envs} actions, got {actions.shape}")
+        if actions.min(initial=0) < 0 or actions.max(initial=0) >= self.action_count:
+            raise ValueError(f"Actions must be in [0, {self.action_count})")
+
+        settings = self._settings
+        envs = self._env_index
+        self._counters += np.uint64(1)
+        self._steps += 1
+        score_before = self._score.copy()
+
+        # Player: one tile in the chosen direction unless a wall is in the way.
+        old_row, old_col = self._player_row.copy(), self._player_col.copy()
+        target_row = old_row + self._action_drow[actions]
+        target_col = old_col + self._action_dcol[actions]
+        free = ~self._walls[target_row, target_col]
+        self._player_row = np.where(free, target_row, old_row)
+        self._player_col = np.where(free, target_col, old_col)
+        row, col = self._player_row, self._player_col
+
+        coin_hit = self._coins[envs, row, col]
+        self._coins[envs, row, col] = False
+        self._score += coin_hit * settings.player.score_per_coin
+        freeze_roll = _uniform(self._seeds, self._counters, _SALT_FREEZE, 1)[:, 0]
+        self._freeze_left = np.where(coin_hit & (freeze_roll < _FREEZE_PROBABILITY), self._effect_steps, self._freeze_left)
+
+        pellet_hit = self._pellets[envs, row, col]
+        self._pellets[envs, row, col] = False
+        self._score += pellet_hit * settings.player.score_per_power_pellet
+        self._power_left = np.where(pellet_hit, self._effect_steps, self._power_left)
+
+        # Enemies move whole tiles at their speed relative to the player.
+        enemy_old_row, enemy_old_col = self._enemy_row.copy(), self._enemy_col.copy()
+        self._enemy_progress += self._enemy_tiles_per_step
+        moving = (self._enemy_progress >= 1.0) & (self._freeze_left == 0)
+        self._enemy_progress = np.where(self._enemy_progress >= 1.0, self._enemy_progress - 1.0, self._enemy_progress)
+        if moving.any():
+            self._move_enemies(moving)
+
+        # Contact counts when sharing a tile or swapping tiles within the step.
+        same_tile = (self._enemy_row == row[:, None]) & (self._enemy_col == col[:, None])
+        swapped = (
+            (self._enemy_row == old_row[:, None]) & (self._enemy_col == old_col[:, None])
+            & (enemy_old_row == row[:, None]) & (enemy_old_col == col[:, None])
+        )
+        contact = same_tile | swapped
+        powered = self._power_left > 0
+        eaten = contact & powered[:, None]
+        self._score += eaten.sum(axis=1) * settings.player.score_per_enemy
+        if eaten.any():
+            self._respawn_enemies(eaten)
+        caught = contact.any(axis=1) & ~powered
+        self._lives -= caught
+        self._player_row = np.where(caught, 1, self._player_row)
+        self._player_col = np.where(caught, 1, self._player_col)
+
+        self._power_left = np.maximum(self._power_left - 1, 0)
+        self._freeze_left = np.maximum(self._freeze_left - 1, 0)
+
+        rewards = (self._score - score_before).astype(np.float32)
+        won = ~self._coins.any(axis=(1, 2)) & ~self._pellets.any(axis=(1, 2))
+        lost = self._lives <= 0
+        truncated = (self._steps >= self.max_steps) & ~won & ~lost
+        dones = won | lost | truncated
+        info = {
+            "score": self._score.copy(),
+            "lives": self._lives.copy(),
+            "won": won,
+            "truncated": truncated,
+            "caught": caught,
+        }
+        if dones.any():
+            self._reset_envs(dones)
+        return self._observe(), rewards, dones, info
+
+    def _move_enemies(self, moving: np.ndarray) -> None:
+        k, enemies = self._enemy_row.shape
+        next_row = self._enemy_row[:, :, None] + self._enemy_drow[None, None, :]
+        next_col = self._enemy_col[:, :, None] + self._enemy_dcol[None, None, :]
+        legal = ~self._walls[next_row, next_col]
+
+        # Chase: the legal direction that minimises the Manhattan distance.
+        distance = np.abs(next_row - self._player_row[:, None, None]) + np.abs(next_col - self._player_col[:, None, None])
+        chase_dir = np.where(legal, distance, np.iinfo(np.int64).max).argmin(axis=2)
+
+        # Wander: keep going while possible, otherwise pick a random legal turn.
+        wander = _uniform(self._seeds, self._counters, _SALT_WANDER, enemies * 4).reshape(k, enemies, 4)
+        random_dir = np.where(legal, wander, -1.0).argmax(axis=2)
+        current_legal = np.take_along_axis(legal, self._enemy_dir[:, :, None], axis=2)[:, :, 0]
+        wander_dir = np.where(current_legal, self._enemy_dir, random_dir)
+
+        chase = _uniform(self._seeds, self._counters, _SALT_CHASE, enemies) < _CHASE_PROBABILITY
+        direction = np.where(chase, chase_dir, wander_dir)
+        can_move = np.take_along_axis(legal, direction[:, :, None], axis=2)[:, :, 0] & moving[:, None]
+
+        self._enemy_dir = np.where(moving[:, None], direction, self._enemy_dir)
+        self._enemy_row = np.where(can_move, self._enemy_row + self._enemy_drow[direction], self._enemy_row)
+        self._enemy_col = np.where(can_move, self._enemy_col + self._enemy_dcol[direction], self._enemy_col)
+
+    def _respawn_enemies(self, eaten: np.ndarray) -> None:
+        """Put eaten enemies on a random inner tile facing a random way, as ``GameController`` does."""
+        k, enemies = eaten.shape
+        rows, columns = self._walls.shape
+        roll = _uniform(self._seeds, self._counters, _SALT_RESPAWN, enemies * 3).reshape(k, enemies, 3)
+        # Like random.randint(1, size - 2); the tile may be a wall, as in the game.
+        spawn_row = 1 + (roll[:, :, 0] * (rows - 2)).astype(np.int64)
+        spawn_col = 1 + (roll[:, :, 1] * (columns - 2)).astype(np.int64)
+        spawn_dir = (roll[:, :, 2] * len(_ENEMY_DIRECTIONS)).astype(np.int64)
+        self._enemy_row = np.where(eaten, spawn_row, self._enemy_row)
+        self._enemy_col = np.where(eaten, spawn_col, self._enemy_col)
+        self._enemy_dir = np.where(eaten, spawn_dir, self._enemy_dir)
+
+    def _reset_envs(self, mask: np.ndarray) -> None:
+        count = int(mask.sum())
+        if not count:
+            return
+        self._coins[mask] = self._coin_template
+        self._pellets[mask] = self._pellet_template
+        self._player_row[mask] = 1
+        self._player_col[mask] = 1
+        self._enemy_row[mask] = self._spawn_rows
+        self._enemy_col[mask] = self._spawn_cols
+        start = _uniform(self._seeds[mask], self._counters[mask], _SALT_START_DIRECTION, self._spawn_rows.size)
+        self._enemy_dir[mask] = (start * len(_ENEMY_DIRECTIONS)).astype(np.int64)
+        self._enemy_progress[mask] = 0.0
+        self._power_left[mask] = 0
+        self._freeze_left[mask] = 0
+        self._lives[mask] = self._settings.player.initial_lives
+        self._score[mask] = 0
+        self._steps[mask] = 0
+
+    def _observe(self) -> np.ndarray:
+        observations = self._observations
+        observations[:, 1] = self._coins
+        observations[:, 2] = self._pellets
+        observations[:, 3:] = 0
+        env_column = self._env_index[:, None]
+        np.add.at(observations[:, 3], (np.broadcast_to(env_column, self._enemy_row.shape), self._enemy_row, self._enemy_col), 1)
+        observations[self._env_index, 4, self._player_row, self._player_col] = 1
+        return observations.copy()
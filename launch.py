@@ -4,20 +4,67 @@
 Irancell Anniversary Pac-Man Game Launcher
 """
 
-import pygame
-import sys
+import argparse
 import os
+import sys
+import time
+
+# Captured before any heavy import so the startup report covers them too.
+_LAUNCH_STARTED = time.perf_counter()
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Irancell Anniversary Pac-Man")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print an import/initialization timing breakdown once the game is playable",
+    )
+    parser.add_argument(
+        "--input-latency",
+        action="store_true",
+        help="print input latency percentiles (event dequeue to movement) on exit",
+    )
+    parser.add_argument(
+        "--capture",
+        metavar="DIR",
+        help="record every presented frame into DIR without slowing the game (frames are dropped if the writer falls behind)",
+    )
+    parser.add_argument(
+        "--capture-format",
+        choices=("png", "raw", "video"),
+        default="png",
+        help="PNG sequence, one raw RGB24 stream, or an MP4 via ffmpeg (default: png)",
+    )
+    parser.add_argument(
+        "--memory-diagnostics",
+        action="store_true",
+        help="report allocations at every level start; F9 or SIGUSR1 writes a full diff to .cache/memory/",
+    )
+    parser.add_argument(
+        "--async-loop",
+        action="store_true",
+        help="drive frames from an asyncio event loop and print frame lateness percentiles on exit",
+    )
+    args = parser.parse_args()
+
     print("Starting Irancell Anniversary Pac-Man Game...")
     print("Loading game assets...")
     
     # Change to the script's directory
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
+    sys.path.insert(0, os.getcwd())
+
+    from utils.startup_profiler import StartupProfiler
+
+    profiler = StartupProfiler(origin=_LAUNCH_STARTED)
+
     # Import and run the main game
     try:
-        import main
+        with profiler.phase("import pygame"):
+            import pygame  # noqa: F401
+        with profiler.phase("import game modules"):
+            import main as game
     except ImportError as e:
         print(f"Error importing main game module: {e}")
         print("Make sure main.py exists in this directory.")
@@ -26,5 +73,14 @@ def main():
         print(f"Unexpected error: {e}")
         sys.exit(1)
 
+    game.main(
+        profiler if args.profile_startup else None,
+        report_input_latency=args.input_latency,
+        capture_dir=args.capture,
+        capture_format=args.capture_format,
+        memory_diagnostics=args.memory_diagnostics,
+        use_asyncio=args.async_loop,
+    )
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
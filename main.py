@@ -2,65 +2,402 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
+import time
+from typing import Callable
 
 import pygame
 
+from core.events import GameEvent, GameEventType, Subscription
 from core.game_controller import GameController
-from utils.config_loader import load_settings
-from views.fonts import create_font_bundle
-from views.game_renderer import GameRenderer
+from utils.config_loader import GameSettings, load_settings
+from utils.config_watcher import ConfigWatcher
+from utils.heatmap import HeatmapRecorder
+from utils.memory_diagnostics import MemoryDiagnostics
+from utils.score_client import ScoreClient
+from utils.sound_manager import SoundManager
+from utils.stats import percentiles
+from utils.stall_watchdog import StallWatchdog
+from utils.startup_profiler import StartupProfiler
+from views.capture import FrameCapture
+from views.fonts import FontBundle, create_font_bundle
+from views.quality import QualityGovernor
+from views.render_backend import create_backend
 
 
-def main() -> None:
-    pygame.init()
-    settings = load_settings()
-    screen = pygame.display.set_mode((settings.width, settings.height))
-    pygame.display.set_caption(settings.title)
-    clock = pygame.time.Clock()
+def main(
+    profiler: StartupProfiler | None = None,
+    report_input_latency: bool = False,
+    capture_dir: str | None = None,
+    capture_format: str = "png",
+    memory_diagnostics: bool = False,
+    use_asyncio: bool = False,
+) -> None:
+    """Run the game; pass a profiler to print the startup timing breakdown.
+
+    With ``capture_dir`` every presented frame is recorded there in the
+    background (see :class:`views.capture.FrameCapture`). ``memory_diagnostics``
+    prints a tracemalloc report at every level start; F9 or ``SIGUSR1`` writes
+    a full diff. ``use_asyncio`` drives the frames from an asyncio event loop
+    (see :func:`run_async`).
+    """
+    diagnostics = MemoryDiagnostics() if memory_diagnostics else None
+    report_startup = profiler is not None
+    profiler = profiler or StartupProfiler()
+    # Only the subsystems the game uses; the mixer is opened lazily by SoundManager.
+    with profiler.phase("pygame subsystems"):
+        pygame.display.init()
+        pygame.font.init()
+    with profiler.phase("settings"):
+        settings = load_settings()
+    with profiler.phase("fonts"):
+        fonts = create_font_bundle(settings.font_name)
+    capture = FrameCapture(capture_dir, capture_format, settings.speed.fps) if capture_dir else None
+    options = dict(
+        profiler=profiler,
+        report_startup=report_startup,
+        report_input_latency=report_input_latency,
+        capture=capture,
+        diagnostics=diagnostics,
+    )
+    try:
+        if use_asyncio:
+            asyncio.run(run_async(settings, fonts, **options))
+        else:
+            run(settings, fonts, **options)
+    finally:
+        if capture is not None:
+            capture.close()
+            print(capture.report())
+    pygame.quit()
+    sys.exit()
+
+
+class GameSession:
+    """One game window: controller, backend and the per-frame work.
+
+    The loops below only decide when :meth:`frame` runs and what happens in
+    between, so the blocking and the asyncio runner play identically.
+    """
+
+    def __init__(
+        self,
+        settings: GameSettings,
+        fonts: FontBundle,
+        profiler: StartupProfiler | None = None,
+        report_startup: bool = False,
+        display_index: int = 0,
+        capture: FrameCapture | None = None,
+        diagnostics: MemoryDiagnostics | None = None,
+        score_worker: bool = True,
+    ):
+        self.settings = settings
+        self._fonts = fonts
+        self._profiler = profiler or StartupProfiler()
+        self._report_startup = report_startup
+        self._display_index = display_index
+        self._capture = capture
+        self._diagnostics = diagnostics
+        self._score_worker = score_worker
+        with self._profiler.phase("controller"):
+            self.controller = GameController(settings)
+        self.governor = QualityGovernor(settings.quality, settings.speed.fps)
+        with self._profiler.phase("display, renderer and assets"):
+            self.backend = create_backend(settings, fonts, display_index)
+            self.backend.apply_quality(self.governor.tier)
+            self.backend.attach(self.controller)
+        self.sound_manager = SoundManager()
+        self._sound_subscription = self.sound_manager.attach(self.controller.events)
+        self.config_watcher = ConfigWatcher(settings)
+        self.score_client = self._create_score_client(settings)
+        self.heatmap: HeatmapRecorder | None = None
+        self._heatmap_subscription: Subscription | None = None
+        self._create_heatmap(settings)
+        self.watchdog: StallWatchdog | None = None
+        self._create_watchdog(settings)
+        self.show_start_screen = True
+        self._was_game_over = False
+        self._diagnosed_level = 0
+
+    def _create_score_client(self, settings: GameSettings) -> ScoreClient | None:
+        if not settings.score_backend.enabled:
+            return None
+        return ScoreClient(settings.score_backend, start_worker=self._score_worker)
+
+    def _create_heatmap(self, settings: GameSettings) -> None:
+        if self.heatmap is not None:
+            self._heatmap_subscription.cancel()
+            self.heatmap.close()
+            self.heatmap = None
+        if not settings.heatmap.enabled:
+            return
+        self.heatmap = HeatmapRecorder(
+            settings.grid_size, settings.grid_width, settings.grid_height, settings.heatmap.directory, settings.heatmap.flush_ticks
+        )
+        self._heatmap_subscription = self.controller.events.subscribe_all({GameEventType.PLAYER_DIED: self._on_player_died})
+
+    def _create_watchdog(self, settings: GameSettings) -> None:
+        if self.watchdog is not None:
+            self.watchdog.close()
+            self.watchdog = None
+        config = settings.stall_watchdog
+        if config.enabled:
+            self.watchdog = StallWatchdog(settings.speed.fps, config.margin_ms, config.sample_interval_ms, config.directory)
 
-    fonts = create_font_bundle()
-    controller = GameController(settings)
-    renderer = GameRenderer(settings, fonts)
+    def _on_player_died(self, event: GameEvent) -> None:
+        self.heatmap.record_death(event.x, event.y)
 
-    running = True
-    show_start_screen = True
+    def poll_config(self) -> None:
+        """Apply ``config.json`` edits picked up by the watcher."""
+        reloaded = self.config_watcher.poll()
+        if reloaded is None:
+            return
+        settings, changed = reloaded
+        self.settings = settings
+        self.controller.apply_settings(settings, changed)
+        if changed & {"quality", "speed"}:
+            self.governor.configure(settings.quality, settings.speed.fps)
+        if "display" in changed and settings.display.backend != self.backend.name:
+            self.backend.detach()
+            self.backend.close()
+            self.backend = create_backend(settings, self._fonts, self._display_index)
+            self.backend.attach(self.controller)
+        else:
+            self.backend.apply_settings(settings, changed)
+        self.backend.apply_quality(self.governor.tier)
+        if "score_backend" in changed:
+            if self.score_client is not None:
+                # Do not wait for a drain on the frame thread; unsent records stay
+                # in the outbox and the new client delivers them.
+                self.score_client.close(timeout=0)
+            self.score_client = self._create_score_client(settings)
+        if changed & {"heatmap", "layout"}:
+            self._create_heatmap(settings)
+        if changed & {"stall_watchdog", "speed"}:
+            self._create_watchdog(settings)
 
-    while running:
+    def frame(self) -> bool:
+        """Handle input, simulate, draw and present one frame; ``False`` once closed."""
+        if self.watchdog is not None:
+            self.watchdog.heartbeat()
+        controller = self.controller
+        backend = self.backend
+        running = True
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-            if show_start_screen and event.type == pygame.KEYDOWN:
-                show_start_screen = False
-                controller.setup_level()
-
-        if show_start_screen:
-            renderer.draw_start_screen(screen)
-            pygame.display.flip()
-            clock.tick(settings.speed.fps)
-            continue
-
-        pressed_keys = pygame.key.get_pressed()
-        controller.handle_input(pressed_keys)
-        controller.update()
-        renderer.draw_scene(screen, controller)
-
-        if controller.game_over:
-            renderer.draw_game_over(screen)
-            if pressed_keys[pygame.K_r]:
-                controller.restart()
-
-        if controller.level_complete:
-            renderer.draw_level_complete(screen)
-            if pressed_keys[pygame.K_n]:
-                controller.next_level()
-
-        pygame.display.flip()
-        clock.tick(settings.speed.fps)
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F9 and self._diagnostics is not None:
+                    self._diagnostics.request_dump()
+                elif self.show_start_screen:
+                    self.show_start_screen = False
+                    controller.setup_level()
+                else:
+                    controller.queue_key(event.key, time.perf_counter())
 
-    pygame.quit()
-    sys.exit()
+        if self.show_start_screen:
+            backend.draw_start_screen()
+        else:
+            pressed_keys = pygame.key.get_pressed()
+            controller.handle_input(pressed_keys)
+            ticking = not (controller.game_over or controller.level_complete)
+            controller.update()
+            if ticking and self.heatmap is not None:
+                self.heatmap.sample(controller.player, controller.game_state.enemies)
+            backend.draw_scene(controller)
+
+            if controller.game_over and not self._was_game_over and self.score_client is not None:
+                self.score_client.submit({"event": "game_over", "score": controller.player.score, "recorded_at": time.time()})
+            self._was_game_over = controller.game_over
+
+            if controller.game_over:
+                backend.draw_game_over()
+                if pressed_keys[pygame.K_r]:
+                    controller.restart()
+
+            if controller.level_complete:
+                backend.draw_level_complete()
+                if pressed_keys[pygame.K_n]:
+                    controller.next_level()
+
+        if self._diagnostics is not None:
+            if controller.level_generation != self._diagnosed_level:
+                self._diagnosed_level = controller.level_generation
+                self._diagnostics.level_boundary()
+            self._diagnostics.poll()
+
+        if self._capture is not None:
+            self._capture.capture(backend)
+        backend.present()
+        if self.show_start_screen and not self._profiler.ready:
+            self._profiler.mark_ready()
+            if self._report_startup:
+                print(self._profiler.report())
+        return running
+
+    def record_work(self, work_ms: float) -> None:
+        """Feed the time a gameplay frame took (excluding any wait) to the quality governor."""
+        if not self.show_start_screen and self.governor.record(work_ms):
+            self.backend.apply_quality(self.governor.tier)
+
+    def close(self, report_input_latency: bool = False) -> None:
+        self._sound_subscription.cancel()
+        if self.score_client is not None:
+            self.score_client.close()
+        if self.heatmap is not None:
+            self.heatmap.close()
+        if self.watchdog is not None:
+            self.watchdog.close()
+        if report_input_latency:
+            print(self.controller.input_buffer.latency_report())
+
+
+def run(
+    settings: GameSettings,
+    fonts: FontBundle,
+    profiler: StartupProfiler | None = None,
+    report_startup: bool = False,
+    report_input_latency: bool = False,
+    display_index: int = 0,
+    on_frame: Callable[[float], None] | None = None,
+    capture: FrameCapture | None = None,
+    diagnostics: MemoryDiagnostics | None = None,
+) -> None:
+    """Open a window on ``display_index`` and run the game loop until it is closed.
+
+    Expects the display and font modules to be initialised already.
+    ``on_frame`` is called after every presented frame with its duration in
+    milliseconds, which lets a supervising process collect health stats.
+    """
+    session = GameSession(settings, fonts, profiler, report_startup, display_index, capture, diagnostics)
+    clock = pygame.time.Clock()
+    try:
+        while True:
+            session.poll_config()
+            if not session.frame():
+                break
+            frame_ms = clock.tick(session.settings.speed.fps)
+            # get_rawtime() is the work done this frame, without tick()'s sleep.
+            session.record_work(clock.get_rawtime())
+            if on_frame is not None:
+                on_frame(frame_ms)
+    finally:
+        # Also on Ctrl-C, so heatmap counts and queued scores are flushed.
+        session.close(report_input_latency)
+
+
+class FramePacer:
+    """Frame task state shared with the background coroutines.
+
+    Lateness is how far past its deadline each frame actually started, which
+    is exactly the delay background work (or anything else) caused.
+    """
+
+    def __init__(self) -> None:
+        self.frame_done = asyncio.Event()
+        self.lateness_ms: list[float] = []
+
+    async def after_frame(self) -> None:
+        """Wait until a frame has just been presented, when the most time is left."""
+        self.frame_done.clear()
+        await self.frame_done.wait()
+
+    def lateness_report(self) -> str:
+        if not self.lateness_ms:
+            return "Frame lateness: no frames"
+        parts = ", ".join(f"p{percentile} {value:.2f} ms" for percentile, value in percentiles(self.lateness_ms).items())
+        return f"Frame lateness over {len(self.lateness_ms)} frames: {parts}, max {max(self.lateness_ms):.2f} ms"
+
+
+async def run_async(
+    settings: GameSettings,
+    fonts: FontBundle,
+    profiler: StartupProfiler | None = None,
+    report_startup: bool = False,
+    report_input_latency: bool = False,
+    display_index: int = 0,
+    on_frame: Callable[[float], None] | None = None,
+    capture: FrameCapture | None = None,
+    diagnostics: MemoryDiagnostics | None = None,
+) -> None:
+    """Like :func:`run`, but frames are an asyncio task paced against a monotonic deadline.
+
+    Config watching and score uploads run as coroutines on the same loop. They
+    start their work right after a frame is presented and keep blocking I/O in
+    executor threads, so the frame task is never held up for long; how late
+    each frame started is measured and printed on exit.
+    """
+    session = GameSession(settings, fonts, profiler, report_startup, display_index, capture, diagnostics, score_worker=False)
+    pacer = FramePacer()
+    background = [
+        asyncio.create_task(_watch_config(session, pacer)),
+        asyncio.create_task(_upload_scores(session, pacer)),
+    ]
+    try:
+        await _frame_task(session, pacer, on_frame)
+    finally:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        session.close(report_input_latency)
+    print(pacer.lateness_report())
+
+
+async def _frame_task(session: GameSession, pacer: FramePacer, on_frame: Callable[[float], None] | None) -> None:
+    deadline = time.monotonic()
+    previous_start = deadline
+    while True:
+        start = time.monotonic()
+        pacer.lateness_ms.append(max(0.0, start - deadline) * 1000)
+        if not session.frame():
+            return
+        finished = time.monotonic()
+        session.record_work((finished - start) * 1000)
+        if on_frame is not None:
+            on_frame((start - previous_start) * 1000)
+        previous_start = start
+        pacer.frame_done.set()
+
+        period = 1 / max(1, session.settings.speed.fps)
+        deadline += period
+        if deadline < finished - period:
+            # After a long stall, start a fresh schedule rather than rushing to catch up.
+            deadline = finished
+        await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+
+
+async def _watch_config(session: GameSession, pacer: FramePacer) -> None:
+    while True:
+        # ConfigWatcher throttles its own stat calls; this only keeps the task quiet.
+        await asyncio.sleep(1.0)
+        await pacer.after_frame()
+        session.poll_config()
+
+
+async def _upload_scores(session: GameSession, pacer: FramePacer) -> None:
+    while True:
+        client = session.score_client
+        delay = None
+        if client is not None:
+            await pacer.after_frame()
+            delay = await asyncio.to_thread(client.deliver_once)
+        if delay != 0:
+            await asyncio.sleep(delay or 1.0)
+
+
+def _option_value(name: str) -> str | None:
+    if name in sys.argv[:-1]:
+        return sys.argv[sys.argv.index(name) + 1]
+    return None
 
 
 if __name__ == "__main__":
-    main()
+    main(
+        StartupProfiler() if "--profile-startup" in sys.argv else None,
+        report_input_latency="--input-latency" in sys.argv,
+        capture_dir=_option_value("--capture"),
+        capture_format=_option_value("--capture-format") or "png",
+        memory_diagnostics="--memory-diagnostics" in sys.argv,
+        use_asyncio="--async-loop" in sys.argv,
+    )
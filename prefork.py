@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+"""
+Prefork launcher: one parent loads the game once and forks a worker per display.
+
+The parent imports pygame and the game modules, reads the settings, opens the
+fonts, decodes the logo and compiles the level layout, then freezes the
+garbage collector so those objects are never touched again. Forked workers
+share the pages copy-on-write and only have to open their own window. Each
+worker reports frame rate, worst frame time and memory once a second; the
+parent prints a health table and flags workers that stop reporting.
+
+POSIX only, since it relies on ``fork``.
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import queue
+import resource
+import signal
+import sys
+import time
+
+_HEARTBEAT_INTERVAL = 1.0
+_REPORT_INTERVAL = 5.0
+_STALE_AFTER = 5.0
+# How long stopped workers get to close their sessions before they are killed.
+_SHUTDOWN_GRACE = 6.0
+
+
+def _memory_kb():
+    """Return ``(rss_kb, pss_kb, rss_is_peak)`` for this process.
+
+    PSS is ``None`` off Linux. Where current RSS cannot be read either, the
+    peak RSS from ``getrusage`` is returned and flagged.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as rollup:
+            fields = dict(line.split(":", 1) for line in rollup if ":" in line)
+        return int(fields["Rss"].split()[0]), int(fields["Pss"].split()[0]), False
+    except (OSError, KeyError, ValueError):
+        pass
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024, None, False
+    except (OSError, IndexError, ValueError):
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux and the BSDs kilobytes.
+    return (peak // 1024 if sys.platform == "darwin" else peak), None, True
+
+
+def _preload():
+    """Load everything workers can share read-only and return what they need."""
+    import pygame
+
+    import main as game  # noqa: F401  (imports the whole game module graph)
+    from core.level_builder import LevelBuilder
+    from utils.config_loader import load_settings
+    from views.anniversary import load_logo_source
+    from views.fonts import create_font_bundle
+
+    # The display is left uninitialised: each worker opens its own after the fork.
+    pygame.font.init()
+    settings = load_settings()
+    fonts = create_font_bundle(settings.font_name)
+    load_logo_source()
+    LevelBuilder(settings).compile()
+
+    # Move everything loaded so far out of the collector's reach; otherwise the
+    # first collection in each worker writes to every object header and undoes
+    # the copy-on-write sharing.
+    gc.collect()
+    gc.freeze()
+    return settings, fonts
+
+
+def _stop_worker(signum, frame):
+    # Stop like Ctrl-C would, once; the game loop closes its session on the way out.
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    raise KeyboardInterrupt
+
+
+def _worker(display_index, settings, fonts, heartbeats, forked_at):
+    import pygame
+
+    import main as game
+
+    # Ctrl-C in the terminal reaches every process in the group; only the
+    # parent acts on it and stops the workers with SIGTERM.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _stop_worker)
+    pygame.display.init()
+    window = {"started": time.perf_counter(), "frames": 0, "worst": 0.0, "ready": False}
+
+    def on_frame(frame_ms):
+        now = time.perf_counter()
+        if not window["ready"]:
+            window["ready"] = True
+            heartbeats.put(("ready", display_index, os.getpid(), (time.time() - forked_at) * 1000))
+        window["frames"] += 1
+        window["worst"] = max(window["worst"], frame_ms)
+        elapsed = now - window["started"]
+        if elapsed >= _HEARTBEAT_INTERVAL:
+            rss, pss, rss_is_peak = _memory_kb()
+            heartbeats.put(
+                ("beat", display_index, os.getpid(), window["frames"] / elapsed, window["worst"], rss, pss, rss_is_peak)
+            )
+            window.update(started=now, frames=0, worst=0.0)
+
+    try:
+        game.run(settings, fonts, display_index=display_index, on_frame=on_frame)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pygame.quit()
+
+
+class _Supervisor:
+    """Start workers, collect their heartbeats and print a health table."""
+
+    def __init__(self, settings, fonts, displays, respawn):
+        self._settings = settings
+        self._fonts = fonts
+        self._context = multiprocessing.get_context("fork")
+        self._heartbeats = self._context.Queue()
+        self._respawn = respawn
+        self._workers = {}
+        self._health = {}
+        for display_index in range(displays):
+            self._spawn(display_index)
+
+    def _spawn(self, display_index):
+        process = self._context.Process(
+            target=_worker,
+            args=(display_index, self._settings, self._fonts, self._heartbeats, time.time()),
+            name=f"display-{display_index}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[display_index] = process
+        self._health[display_index] = {"pid": process.pid, "seen": time.monotonic(), "fps": 0.0, "worst": 0.0, "rss": 0, "pss": None, "rss_is_peak": False}
+
+    def run(self):
+        next_report = time.monotonic() + _REPORT_INTERVAL
+        try:
+            while self._workers:
+                self._drain(timeout=_HEARTBEAT_INTERVAL)
+                self._reap()
+                if time.monotonic() >= next_report:
+                    print(self.report())
+                    next_report = time.monotonic() + _REPORT_INTERVAL
+        except KeyboardInterrupt:
+            for process in self._workers.values():
+                process.terminate()
+            deadline = time.monotonic() + _SHUTDOWN_GRACE
+            for process in self._workers.values():
+                process.join(timeout=max(0.0, deadline - time.monotonic()))
+                if process.is_alive():
+                    print(f"Warning: worker {process.pid} did not stop in {_SHUTDOWN_GRACE:.0f} s, killing it")
+                    process.kill()
+        finally:
+            for process in self._workers.values():
+                process.join(timeout=2)
+
+    def _drain(self, timeout):
+        try:
+            message = self._heartbeats.get(timeout=timeout)
+        except queue.Empty:
+            return
+        while True:
+            kind, display_index, pid = message[:3]
+            health = self._health.setdefault(display_index, {})
+            health.update(pid=pid, seen=time.monotonic())
+            if kind == "ready":
+                print(f"Display {display_index}: worker {pid} ready {message[3]:.0f} ms after fork")
+            else:
+                health.update(fps=message[3], worst=message[4], rss=message[5], pss=message[6], rss_is_peak=message[7])
+            try:
+                message = self._heartbeats.get_nowait()
+            except queue.Empty:
+                return
+
+    def _reap(self):
+        for display_index, process in list(self._workers.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self._workers[display_index]
+            if process.exitcode == 0:
+                print(f"Display {display_index}: worker {process.pid} exited")
+                self._health.pop(display_index, None)
+            elif self._respawn:
+                print(f"Warning: Display {display_index} worker {process.pid} died (exit code {process.exitcode}), respawning")
+                self._spawn(display_index)
+            else:
+                print(f"Warning: Display {display_index} worker {process.pid} died (exit code {process.exitcode})")
+                self._health.pop(display_index, None)
+
+    def report(self):
+        now = time.monotonic()
+        lines = [f"{'display':>7} {'pid':>7} {'fps':>6} {'worst ms':>9} {'rss MiB':>8} {'pss MiB':>8}  status"]
+        any_peak = False
+        for display_index in sorted(self._health):
+            health = self._health[display_index]
+            stale = now - health["seen"] > _STALE_AFTER
+            pss = "-" if health["pss"] is None else f"{health['pss'] / 1024:.1f}"
+            rss = f"{health['rss'] / 1024:.1f}"
+            if health.get("rss_is_peak"):
+                rss += "*"
+                any_peak = True
+            lines.append(
+                f"{display_index:>7} {health['pid']:>7} {health['fps']:>6.1f} {health['worst']:>9.1f} "
+                f"{rss:>8} {pss:>8}  {'STALE' if stale else 'ok'}"
+            )
+        if any_peak:
+            lines.append("* peak RSS; current RSS is not available on this platform")
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run one Irancell Anniversary Pac-Man window per display")
+    parser.add_argument("--displays", type=int, default=1, help="number of displays (one worker each)")
+    parser.add_argument("--respawn", action="store_true", help="restart workers that crash")
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        print("Error: the prefork launcher needs a POSIX system; use launch.py instead.")
+        sys.exit(1)
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.getcwd())
+
+    started = time.perf_counter()
+    settings, fonts = _preload()
+    print(f"Preloaded game resources in {(time.perf_counter() - started) * 1000:.0f} ms")
+    _Supervisor(settings, fonts, args.displays, args.respawn).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+"""
+Measure steady-state allocations of the game loop and enforce a budget.
+
+    python tools/alloc_budget.py --frames 600 --budget draw=2048
+
+Plays scripted input headlessly; after ``--warmup`` frames every phase of
+every frame runs under tracemalloc. Per phase it reports the transient peak
+(memory allocated and released inside the phase), the bytes still held
+afterwards, and the garbage collections it triggered. Frames that rebuild a
+level (restart, next level, and the first frame drawn after one) are not
+steady state and are left out. Exits with status 1 when a phase's average
+transient peak per frame exceeds its budget.
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PHASES = ("input", "update", "draw", "present")
+
+# Average transient bytes per frame each phase may allocate; roughly twice
+# the worst average seen over seeds 1-12 with the default and short warm-ups.
+DEFAULT_BUDGETS = {
+    "input": 384,
+    "update": 512,
+    "draw": 768,
+    "present": 256,
+}
+
+
+class PhaseStats:
+    """Allocation totals of one phase over the measured frames."""
+
+    def __init__(self):
+        self.transient = 0
+        self.worst = 0
+        self.retained = 0
+        self.collections = 0
+
+
+class AllocationMeter:
+    """Run phases under tracemalloc and attribute allocations and collections to them."""
+
+    def __init__(self):
+        self.stats = {phase: PhaseStats() for phase in PHASES}
+        self.frames = 0
+        self.skipped = 0
+        # The current frame's phases; added to ``stats`` by end_frame().
+        self._frame = {phase: PhaseStats() for phase in PHASES}
+        self._phase = None
+        self.overhead = 0
+        self.retained_overhead = 0
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, event, info):
+        if event == "start" and self._phase is not None:
+            self._phase.collections += 1
+
+    def calibrate(self, samples=200):
+        """Measure an empty phase; what it shows is the measurement's own cost."""
+        probe = PhaseStats()
+        self._frame["calibration"] = probe
+        for _ in range(samples):
+            self.run("calibration", _nothing)
+        del self._frame["calibration"]
+        self.overhead = probe.worst
+        self.retained_overhead = probe.retained // samples
+
+    def run(self, phase, function, *args):
+        stats = self._frame[phase]
+        self._phase = stats
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        function(*args)
+        current, peak = tracemalloc.get_traced_memory()
+        self._phase = None
+        transient = max(0, peak - before - self.overhead)
+        stats.transient += transient
+        stats.worst = max(stats.worst, transient)
+        stats.retained += current - before - self.retained_overhead
+
+    def end_frame(self, steady):
+        """Count the frame just measured, or drop it if it was not ``steady``."""
+        for phase, frame in self._frame.items():
+            if steady:
+                stats = self.stats[phase]
+                stats.transient += frame.transient
+                stats.worst = max(stats.worst, frame.worst)
+                stats.retained += frame.retained
+                stats.collections += frame.collections
+            self._frame[phase] = PhaseStats()
+        if steady:
+            self.frames += 1
+        else:
+            self.skipped += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steady-state allocation budget for the PAC-IRANCELL game loop")
+    parser.add_argument("--frames", type=int, default=600, help="measured frames (default: 600)")
+    parser.add_argument("--warmup", type=int, default=300, help="frames played before measuring (default: 300)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="PHASE=BYTES",
+        help="override the average transient bytes per frame allowed for a phase",
+    )
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        phase, _, value = item.partition("=")
+        if phase not in budgets or not value.isdigit():
+            parser.error(f"invalid budget {item!r}; phases are {', '.join(PHASES)}")
+        budgets[phase] = int(value)
+
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+
+    from core.game_controller import GameController
+    from utils.config_loader import load_settings
+    from views.fonts import create_font_bundle
+    from views.render_backend import create_backend
+
+    pygame.display.init()
+    pygame.font.init()
+    settings = load_settings()
+    backend = create_backend(settings, create_font_bundle(settings.font_name))
+    controller = GameController(settings)
+    backend.attach(controller)
+    controller.setup_level()
+    # The enemy AI budget is wall-clock based; do not let a slow traced frame
+    # change which decisions are taken.
+    controller.ai_scheduler.configure(1000.0, settings.speed.movement_update_rate)
+
+    rng = random.Random(args.seed)
+    arrows = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+    keys = [_Pressed(key) for key in arrows]
+    # Enemy AI uses the global generator.
+    random.seed(args.seed)
+
+    def play(frame, meter=None):
+        if frame % 30 == 0:
+            play.pressed = rng.choice(keys)
+        # The first frame of a new level re-indexes it for drawing.
+        steady = controller.level_generation == play.generation
+        play.generation = controller.level_generation
+        steps = (
+            ("input", controller.handle_input, play.pressed),
+            ("update", controller.update),
+            ("draw", backend.draw_scene, controller),
+            ("present", backend.present),
+        )
+        for phase, function, *call_args in steps:
+            if meter is None:
+                function(*call_args)
+            else:
+                meter.run(phase, function, *call_args)
+        if meter is not None:
+            meter.end_frame(steady)
+        if controller.game_over:
+            controller.restart()
+        elif controller.level_complete:
+            controller.next_level()
+
+    play.pressed = keys[0]
+    play.generation = controller.level_generation
+    for frame in range(args.warmup):
+        play(frame)
+
+    tracemalloc.start()
+    meter = AllocationMeter()
+    meter.calibrate()
+    for frame in range(args.warmup, args.warmup + args.frames):
+        play(frame, meter)
+    tracemalloc.stop()
+    gc.callbacks.remove(meter._on_gc)
+
+    failed = False
+    print(
+        f"{meter.frames} steady frames after {args.warmup} warm-up frames, {meter.skipped} level rebuild frames "
+        f"left out (measurement overhead {meter.overhead} B)"
+    )
+    print(f"{'phase':<8} {'avg B/frame':>12} {'worst B':>9} {'retained B':>11} {'gc runs':>8} {'budget':>8}")
+    for phase in PHASES:
+        stats = meter.stats[phase]
+        average = stats.transient / max(1, meter.frames)
+        over = average > budgets[phase]
+        failed |= over
+        print(
+            f"{phase:<8} {average:>12.0f} {stats.worst:>9} {stats.retained:>11} {stats.collections:>8} "
+            f"{budgets[phase]:>8}{'  OVER BUDGET' if over else ''}"
+        )
+    sys.exit(1 if failed else 0)
+
+
+def _nothing():
+    pass
+
+
+class _Pressed:
+    """Stand-in for ``pygame.key.get_pressed()`` with one arrow key held."""
+
+    def __init__(self, key):
+        self._key = key
+
+    def __getitem__(self, key):
+        return key == self._key
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+
+"""
+Difficulty numbers for mazes before they ship.
+
+    python tools/analyze_levels.py                    # the configured maze
+    python tools/analyze_levels.py 20x15 40x30
+    python tools/analyze_levels.py --sweep 20x15:60x45 --json levels.json
+
+Each maze comes from ``LevelBuilder`` at the given size. All-pairs tile
+distances are computed with a breadth-first search over the wall grid that
+advances every source at once in NumPy; from them the tool derives the length
+of a route collecting every coin and power pellet (nearest neighbour, then
+2-opt), dead ends, chokepoints (tiles whose loss splits the maze), how far any
+tile is from a power pellet, and the par time at the configured player speed.
+Mazes are analyzed in a process pool and results are cached in
+``.cache/level_analysis/`` by a hash of the maze, so only new or changed
+layouts are recomputed.
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(".cache", "level_analysis")
+
+# Bump when the analysis changes so cached results are recomputed.
+ANALYSIS_VERSION = 1
+
+# Improvement passes 2-opt may make over a route.
+TWO_OPT_PASSES = 20
+
+
+@dataclasses.dataclass(frozen=True)
+class MazeSpec:
+    """What the analysis needs from a built level, in tiles."""
+
+    columns: int
+    rows: int
+    walls: bytes
+    start: tuple
+    pickups: tuple
+    pellets: tuple
+
+    def digest(self):
+        data = json.dumps(
+            [ANALYSIS_VERSION, self.columns, self.rows, self.walls.hex(), self.start, self.pickups, self.pellets]
+        )
+        return hashlib.sha1(data.encode("ascii")).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze PAC-IRANCELL mazes for difficulty")
+    parser.add_argument("sizes", nargs="*", metavar="COLSxROWS", help="maze sizes to analyze (default: the configured maze)")
+    parser.add_argument("--sweep", metavar="FROM:TO", help="also analyze every size from e.g. 20x15 to 60x45")
+    parser.add_argument("--workers", type=int, default=None, help="analysis processes (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true", help="recompute even if a cached result exists")
+    parser.add_argument("--json", metavar="FILE", help="also write every result to FILE")
+    args = parser.parse_args()
+
+    try:
+        sizes = [_parse_size(size) for size in args.sizes]
+        if args.sweep:
+            first, _, last = args.sweep.partition(":")
+            (first_columns, first_rows), (last_columns, last_rows) = _parse_size(first), _parse_size(last)
+            sizes += [
+                (columns, rows)
+                for columns in range(first_columns, last_columns + 1)
+                for rows in range(first_rows, last_rows + 1)
+            ]
+    except ValueError as exc:
+        parser.error(str(exc))
+    json_path = os.path.abspath(args.json) if args.json else None
+
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from utils.config_loader import load_settings
+
+    settings = load_settings()
+    if not sizes:
+        sizes = [(settings.grid_width, settings.grid_height)]
+    specs = {size: _maze_spec(settings, *size) for size in dict.fromkeys(sizes)}
+
+    results = {}
+    pending = {}
+    for size, spec in specs.items():
+        digest = spec.digest()
+        cached = None if args.no_cache else _load_cached(digest)
+        if cached is not None:
+            results[size] = cached
+        else:
+            pending[size] = spec
+    if len(pending) > 1 and args.workers != 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            analyses = pool.map(analyze_maze, pending.values(), chunksize=max(1, len(pending) // 64))
+            computed = dict(zip(pending, analyses))
+    else:
+        computed = {size: analyze_maze(spec) for size, spec in pending.items()}
+    for size, result in computed.items():
+        _store_cached(specs[size].digest(), result)
+        results[size] = result
+
+    # Par time depends on speed, so it is not part of the cached analysis.
+    seconds_per_tile = settings.grid_size / max(1, settings.player.speed) / max(1, settings.speed.fps)
+    report = []
+    print(f"{len(results)} mazes, {len(computed)} analyzed, {len(results) - len(computed)} from cache")
+    print(
+        f"{'maze':>7} {'tiles':>6} {'pickups':>7} {'route':>6} {'par s':>6} "
+        f"{'dead ends':>9} {'chokepoints':>11} {'worst cut':>9} {'pellet radius':>13}"
+    )
+    for size in specs:
+        result = results[size]
+        par_time = round(result["route_tiles"] * seconds_per_tile, 1)
+        report.append({"columns": size[0], "rows": size[1], **result, "par_seconds": par_time})
+        warning = f"  ({result['unreachable_pickups']} pickups unreachable)" if result["unreachable_pickups"] else ""
+        print(
+            f"{size[0]:>3}x{size[1]:<3} {result['open_tiles']:>6} {result['pickups']:>7} {result['route_tiles']:>6} "
+            f"{par_time:>6} {result['dead_ends']:>9} {result['chokepoints']:>11} {result['worst_cut']:>9} "
+            f"{result['pellet_radius_max']:>6} / {result['pellet_radius_mean']:<4}{warning}"
+        )
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Wrote {json_path}")
+
+
+def _parse_size(text):
+    columns, separator, rows = text.lower().partition("x")
+    if not separator or not columns.isdigit() or not rows.isdigit() or int(columns) < 3 or int(rows) < 3:
+        raise ValueError(f"invalid maze size {text!r}; expected COLSxROWS such as 20x15")
+    return int(columns), int(rows)
+
+
+def _maze_spec(settings, columns, rows):
+    """Build the level at ``columns`` x ``rows`` the way the game does."""
+    from core.level_builder import LevelBuilder
+    from core.maze_grid import MazeGrid
+
+    grid = settings.grid_size
+    settings = dataclasses.replace(settings, grid_width=columns, grid_height=rows)
+    builder = LevelBuilder(settings)
+    maze = MazeGrid.from_rects(grid, columns, rows, builder.maze_layout())
+    # The same placement LevelBuilder.compile() uses, converted to tiles.
+    coins = [(x // grid, y // grid) for x, y in builder.coin_positions(maze)]
+    pellets = [(x // grid, y // grid) for x, y in builder.power_pellet_positions()]
+    # The player spawns at (grid, grid); see GameObjectFactory.create_player.
+    return MazeSpec(columns, rows, maze.walls, (1, 1), tuple(dict.fromkeys(coins + pellets)), tuple(pellets))
+
+
+def _load_cached(digest):
+    try:
+        with open(os.path.join(CACHE_DIR, f"{digest}.json"), "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(digest, result):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, f"{digest}.json"), "w", encoding="utf-8") as handle:
+            json.dump(result, handle)
+    except OSError as exc:
+        print(f"Warning: Could not cache level analysis: {exc}")
+
+
+def analyze_maze(spec):
+    """Every metric that does not depend on speed, in tiles; runs in a worker process."""
+    open_mask = ~np.frombuffer(spec.walls, dtype=np.uint8).reshape(spec.rows, spec.columns).astype(bool)
+    tile_rows, tile_cols = np.nonzero(open_mask)
+    index = np.full(open_mask.shape, -1, dtype=np.int64)
+    index[tile_rows, tile_cols] = np.arange(len(tile_rows))
+    distances = all_pairs_distances(open_mask)
+
+    def indices(tiles):
+        found = [index[row, col] for col, row in tiles if 0 <= row < spec.rows and 0 <= col < spec.columns]
+        return np.array([i for i in found if i >= 0], dtype=np.int64)
+
+    start = indices([spec.start])[0]
+    pickups = indices(spec.pickups)
+    reachable = pickups[distances[start, pickups] >= 0]
+    route = [start] + [i for i in reachable.tolist() if i != start]
+    route_distances = distances[np.ix_(route, route)]
+    order = two_opt(route_distances, nearest_neighbour(route_distances))
+    route_tiles = int(route_distances[order[:-1], order[1:]].sum())
+
+    # Tiles outside the board count as walls, so padding gives every tile four neighbours.
+    padded = np.pad(open_mask, 1)
+    neighbours = padded[:-2, 1:-1].astype(np.int8) + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
+    dead_ends = int((open_mask & (neighbours == 1)).sum())
+    cuts = articulation_points(open_mask, index, tile_rows, tile_cols)
+
+    pellets = indices(spec.pellets)
+    pellet_distances = distances[pellets][:, distances[start] >= 0].astype(np.float64)
+    pellet_distances[pellet_distances < 0] = np.inf
+    nearest_pellet = pellet_distances.min(axis=0) if len(pellets) else np.array([np.inf])
+    covered = nearest_pellet[np.isfinite(nearest_pellet)]
+    return {
+        "open_tiles": int(open_mask.sum()),
+        "pickups": len(pickups),
+        "unreachable_pickups": len(pickups) - len(reachable),
+        "diameter": int(distances.max()),
+        "route_tiles": route_tiles,
+        "dead_ends": dead_ends,
+        "chokepoints": len(cuts),
+        # Open tiles cut off by the single most damaging chokepoint.
+        "worst_cut": max(cuts.values(), default=0),
+        "pellet_radius_max": int(covered.max()) if len(covered) else None,
+        "pellet_radius_mean": round(float(covered.mean()), 1) if len(covered) else None,
+    }
+
+
+def all_pairs_distances(open_mask):
+    """Shortest path lengths between open tiles, ``-1`` where there is no path.
+
+    One breadth-first search per open tile, all advanced together. Each tile
+    holds a bitset of the searches that have reached it (``np.packbits``
+    over the sources), so a step is four shifts of a ``(rows, columns,
+    sources / 8)`` byte array; only the tiles each step newly reaches are
+    unpacked into the distance matrix.
+    """
+    tile_rows, tile_cols = np.nonzero(open_mask)
+    count = len(tile_rows)
+    distances = np.full((count, count), -1, dtype=np.int32)
+    np.fill_diagonal(distances, 0)
+    frontier = np.zeros(open_mask.shape + ((count + 7) // 8,), dtype=np.uint8)
+    frontier[tile_rows, tile_cols] = np.packbits(np.eye(count, dtype=bool), axis=1)
+    reached = frontier.copy()
+    walls = ~open_mask
+    step = 0
+    while True:
+        step += 1
+        grown = np.zeros_like(frontier)
+        grown[1:] |= frontier[:-1]
+        grown[:-1] |= frontier[1:]
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+        grown &= ~reached
+        grown[walls] = 0
+        if not grown.any():
+            break
+        reached |= grown
+        frontier = grown
+        # Rows are the tiles reached, columns the searches; distances are symmetric.
+        distances[np.unpackbits(grown[tile_rows, tile_cols], axis=1, count=count).view(bool)] = step
+    return distances
+
+
+def nearest_neighbour(distances):
+    """Visit order starting at point 0, always moving to the closest unvisited point."""
+    count = len(distances)
+    visited = np.zeros(count, dtype=bool)
+    order = [0]
+    visited[0] = True
+    for _ in range(count - 1):
+        row = np.where(visited, np.iinfo(np.int32).max, distances[order[-1]])
+        following = int(row.argmin())
+        order.append(following)
+        visited[following] = True
+    return np.array(order, dtype=np.int64)
+
+
+def two_opt(distances, order, passes=TWO_OPT_PASSES):
+    """Shorten an open route from ``order[0]`` by reversing segments while that helps."""
+    order = order.copy()
+    count = len(order)
+    for _ in range(passes):
+        improved = False
+        for i in range(count - 2):
+            a, b = order[i], order[i + 1]
+            ends = order[i + 2:]
+            following = order[i + 3:]
+            # Reversing order[i+1..j] swaps edges (a, b) + (c, d) for (a, c) + (b, d);
+            # at the route's end there is no d.
+            gain = distances[a, ends] - distances[a, b]
+            gain[:-1] += distances[b, following] - distances[ends[:-1], following]
+            best = int(gain.argmin())
+            if gain[best] < 0:
+                j = i + 2 + best
+                order[i + 1:j + 1] = order[i + 1:j + 1][::-1].copy()
+                improved = True
+        if not improved:
+            break
+    return order
+
+
+def articulation_points(open_mask, index, tile_rows, tile_cols):
+    """Open tiles whose removal disconnects the maze, with how many tiles each cuts off.
+
+    Iterative Tarjan over the tile graph. A cut vertex's value counts the
+    tiles no longer connected to the largest remaining region without it.
+    """
+    rows, columns = open_mask.shape
+    count = len(tile_rows)
+    adjacency = []
+    for row, col in zip(tile_rows.tolist(), tile_cols.tolist()):
+        adjacency.append([
+            int(index[r, c])
+            for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+            if 0 <= r < rows and 0 <= c < columns and index[r, c] >= 0
+        ])
+    discovered = [-1] * count
+    low = [0] * count
+    size = [1] * count
+    cuts = {}
+    clock = 0
+    for root in range(count):
+        if discovered[root] >= 0:
+            continue
+        component = []
+        discovered[root] = low[root] = clock
+        clock += 1
+        stack = [(root, -1, iter(adjacency[root]))]
+        while stack:
+            node, parent, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                component.append(node)
+                if parent >= 0:
+                    low[parent] = min(low[parent], low[node])
+                    size[parent] += size[node]
+                    if low[node] >= discovered[parent]:
+                        cuts.setdefault(parent, []).append(size[node])
+            elif discovered[child] < 0:
+                discovered[child] = low[child] = clock
+                clock += 1
+                stack.append((child, node, iter(adjacency[child])))
+            elif child != parent:
+                low[node] = min(low[node], discovered[child])
+        total = len(component)
+        # The root is a cut vertex only if it has several separate subtrees.
+        if len(cuts.get(root, ())) < 2:
+            cuts.pop(root, None)
+        for node in component:
+            if node in cuts:
+                pieces = cuts[node]
+                rest = total - 1 - sum(pieces)
+                cuts[node] = total - 1 - max(pieces + [rest])
+    return cuts
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+Render recorded heatmaps as an overlay on the maze.
+
+    python tools/render_heatmap.py .cache/heatmaps/heatmap-20x15.npy --layer deaths -o deaths.png
+
+Several files (e.g. one per kiosk) are summed before rendering.
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render PAC-IRANCELL heatmaps over the maze")
+    parser.add_argument("files", nargs="+", help="heatmap .npy files of the same maze size")
+    parser.add_argument("--layer", choices=("player", "enemies", "deaths"), default="player")
+    parser.add_argument("-o", "--output", default="heatmap.png", help="PNG to write (default: heatmap.png)")
+    parser.add_argument("--merge", metavar="FILE", help="also save the summed counts to FILE (.npy)")
+    args = parser.parse_args()
+    files = [os.path.abspath(path) for path in args.files]
+    output = os.path.abspath(args.output)
+    merge = os.path.abspath(args.merge) if args.merge else None
+
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+
+    from core.level_builder import LevelBuilder
+    from utils.config_loader import load_settings
+    from utils.heatmap import HEATMAP_LAYERS, load_heatmap
+
+    try:
+        counts = load_heatmap(files)
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}")
+        sys.exit(1)
+    if merge:
+        np.save(merge, counts)
+
+    _, rows, columns = counts.shape
+    settings = load_settings()
+    settings = dataclasses.replace(settings, grid_width=columns, grid_height=rows)
+    grid = settings.grid_size
+    layer = counts[HEATMAP_LAYERS.index(args.layer)]
+
+    image = pygame.Surface((columns * grid, rows * grid))
+    image.fill(settings.colors.background)
+    for rect in LevelBuilder(settings).maze_layout():
+        pygame.draw.rect(image, settings.colors.wall, rect)
+
+    # Log scale so a few hot tiles do not wash out everything else.
+    heat = np.log1p(layer.astype(np.float64))
+    if heat.max() > 0:
+        heat /= heat.max()
+    # One pixel per tile, yellow (cold) to red (hot), then scaled up to the maze.
+    tiles = pygame.Surface((columns, rows), pygame.SRCALPHA)
+    colors = pygame.surfarray.pixels3d(tiles)
+    colors[..., 0] = 255
+    colors[..., 1] = (255 * (1 - heat.T)).astype(np.uint8)
+    colors[..., 2] = 0
+    del colors
+    alpha = pygame.surfarray.pixels_alpha(tiles)
+    alpha[...] = (200 * heat.T).astype(np.uint8)
+    del alpha
+    overlay = pygame.transform.scale(tiles, image.get_size())
+    image.blit(overlay, (0, 0))
+
+    pygame.image.save(image, output)
+    total = int(layer.sum())
+    hottest = np.unravel_index(int(layer.argmax()), layer.shape)
+    print(f"{args.layer}: {total} samples over {int((layer > 0).sum())} tiles, hottest tile {hottest[1]},{hottest[0]}")
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -12,6 +12,14 @@ _DEFAULT_CONFIG: Dict[str, Any] = {
     "window_width": 800,
     "window_height": 600,
     "grid_size": 40,
+    "font_name": None,
+    # UI language; catalogs live in assets/i18n/<language>.json.
+    "language": "en",
+    # Maze size in tiles; None fits the maze to the window. Larger mazes scroll.
+    "maze": {
+        "columns": None,
+        "rows": None,
+    },
     "colors": {
         "primary": [255, 204, 0],
         "background": [0, 0, 0],
@@ -48,6 +56,46 @@ _DEFAULT_CONFIG: Dict[str, Any] = {
         "anniversary_text": "Irancell Anniversary Edition",
         "years_of_service": 20,
     },
+    "display": {
+        "backend": "software",
+        "fullscreen": False,
+    },
+    "ai_settings": {
+        "frame_budget_ms": 1.0,
+    },
+    "input": {
+        "turn_buffer_ms": 250,
+    },
+    "effects": {
+        "particles": True,
+        "particle_cap": 512,
+    },
+    "quality": {
+        "tier": "high",
+        "adaptive": True,
+        "window_frames": 60,
+        "headroom": 0.6,
+    },
+    "score_backend": {
+        "enabled": False,
+        "endpoint": "http://127.0.0.1:8080/api/scores",
+        "queue_dir": ".cache/score_queue",
+        "batch_size": 20,
+        "timeout": 5.0,
+    },
+    # Where players and enemies go and where players die, summed across sessions.
+    "heatmap": {
+        "enabled": False,
+        "directory": ".cache/heatmaps",
+        "flush_ticks": 3600,
+    },
+    # Profile the frame loop whenever a frame starts this late.
+    "stall_watchdog": {
+        "enabled": False,
+        "margin_ms": 100,
+        "sample_interval_ms": 5,
+        "directory": ".cache/stalls",
+    },
 }
 
 
@@ -94,6 +142,60 @@ class Branding:
     years_of_service: int
 
 
+@dataclass(frozen=True)
+class DisplaySettings:
+    backend: str
+    fullscreen: bool
+
+
+@dataclass(frozen=True)
+class AISettings:
+    frame_budget_ms: float
+
+
+@dataclass(frozen=True)
+class InputSettings:
+    turn_buffer_ms: int
+
+
+@dataclass(frozen=True)
+class EffectsSettings:
+    particles: bool
+    particle_cap: int
+
+
+@dataclass(frozen=True)
+class QualitySettings:
+    tier: str
+    adaptive: bool
+    window_frames: int
+    headroom: float
+
+
+@dataclass(frozen=True)
+class ScoreBackendSettings:
+    enabled: bool
+    endpoint: str
+    queue_dir: str
+    batch_size: int
+    timeout: float
+
+
+@dataclass(frozen=True)
+class HeatmapSettings:
+    enabled: bool
+    directory: str
+    flush_ticks: int
+
+
+@dataclass(frozen=True)
+class StallWatchdogSettings:
+    enabled: bool
+    margin_ms: float
+    sample_interval_ms: float
+    directory: str
+
+
 @dataclass(frozen=True)
 class GameSettings:
     title: str
@@ -108,6 +210,25 @@ class GameSettings:
     speed: GameSpeed
     power_mode: PowerModeSettings
     branding: Branding
+    display: DisplaySettings
+    ai: AISettings
+    input: InputSettings
+    effects: EffectsSettings
+    quality: QualitySettings
+    score_backend: ScoreBackendSettings
+    heatmap: HeatmapSettings
+    stall_watchdog: StallWatchdogSettings
+    font_name: str | None = None
+    language: str = "en"
+
+    @property
+    def maze_width(self) -> int:
+        """Maze width in pixels; when it exceeds ``width`` the view scrolls."""
+        return self.grid_width * self.grid_size
+
+    @property
+    def maze_height(self) -> int:
+        return self.grid_height * self.grid_size
 
 
 def _ensure_game_speed(config: Dict[str, Any]) -> None:
@@ -174,21 +295,104 @@ def load_settings(path: str | Path = "config.json") -> GameSettings:
         years_of_service=branding_config.get("years_of_service", _DEFAULT_CONFIG["branding"]["years_of_service"]),
     )
 
+    display_config = raw_config.get("display", {})
+    display = DisplaySettings(
+        backend=display_config.get("backend", _DEFAULT_CONFIG["display"]["backend"]),
+        fullscreen=display_config.get("fullscreen", _DEFAULT_CONFIG["display"]["fullscreen"]),
+    )
+
+    ai_config = raw_config.get("ai_settings", {})
+    ai = AISettings(
+        frame_budget_ms=ai_config.get("frame_budget_ms", _DEFAULT_CONFIG["ai_settings"]["frame_budget_ms"]),
+    )
+
+    input_config = raw_config.get("input", {})
+    input_settings = InputSettings(
+        turn_buffer_ms=input_config.get("turn_buffer_ms", _DEFAULT_CONFIG["input"]["turn_buffer_ms"]),
+    )
+
+    effects_config = raw_config.get("effects", {})
+    effects = EffectsSettings(
+        particles=effects_config.get("particles", _DEFAULT_CONFIG["effects"]["particles"]),
+        particle_cap=effects_config.get("particle_cap", _DEFAULT_CONFIG["effects"]["particle_cap"]),
+    )
+
+    quality_config = raw_config.get("quality", {})
+    quality = QualitySettings(
+        tier=quality_config.get("tier", _DEFAULT_CONFIG["quality"]["tier"]),
+        adaptive=quality_config.get("adaptive", _DEFAULT_CONFIG["quality"]["adaptive"]),
+        window_frames=quality_config.get("window_frames", _DEFAULT_CONFIG["quality"]["window_frames"]),
+        headroom=quality_config.get("headroom", _DEFAULT_CONFIG["quality"]["headroom"]),
+    )
+
+    backend_config = raw_config.get("score_backend", {})
+    score_backend = ScoreBackendSettings(
+        enabled=backend_config.get("enabled", _DEFAULT_CONFIG["score_backend"]["enabled"]),
+        endpoint=backend_config.get("endpoint", _DEFAULT_CONFIG["score_backend"]["endpoint"]),
+        queue_dir=backend_config.get("queue_dir", _DEFAULT_CONFIG["score_backend"]["queue_dir"]),
+        batch_size=backend_config.get("batch_size", _DEFAULT_CONFIG["score_backend"]["batch_size"]),
+        timeout=backend_config.get("timeout", _DEFAULT_CONFIG["score_backend"]["timeout"]),
+    )
+
+    heatmap_config = raw_config.get("heatmap", {})
+    heatmap = HeatmapSettings(
+        enabled=heatmap_config.get("enabled", _DEFAULT_CONFIG["heatmap"]["enabled"]),
+        directory=heatmap_config.get("directory", _DEFAULT_CONFIG["heatmap"]["directory"]),
+        flush_ticks=heatmap_config.get("flush_ticks", _DEFAULT_CONFIG["heatmap"]["flush_ticks"]),
+    )
+
+    watchdog_config = raw_config.get("stall_watchdog", {})
+    stall_watchdog = StallWatchdogSettings(
+        enabled=watchdog_config.get("enabled", _DEFAULT_CONFIG["stall_watchdog"]["enabled"]),
+        margin_ms=watchdog_config.get("margin_ms", _DEFAULT_CONFIG["stall_watchdog"]["margin_ms"]),
+        sample_interval_ms=watchdog_config.get("sample_interval_ms", _DEFAULT_CONFIG["stall_watchdog"]["sample_interval_ms"]),
+        directory=watchdog_config.get("directory", _DEFAULT_CONFIG["stall_watchdog"]["directory"]),
+    )
+
     width = raw_config.get("window_width", _DEFAULT_CONFIG["window_width"])
     height = raw_config.get("window_height", _DEFAULT_CONFIG["window_height"])
     grid_size = raw_config.get("grid_size", _DEFAULT_CONFIG["grid_size"])
+    maze_config = raw_config.get("maze", {})
+    columns = maze_config.get("columns", _DEFAULT_CONFIG["maze"]["columns"]) or width // grid_size
+    rows = maze_config.get("rows", _DEFAULT_CONFIG["maze"]["rows"]) or height // grid_size
 
     return GameSettings(
         title=raw_config.get("game_title", _DEFAULT_CONFIG["game_title"]),
         width=width,
         height=height,
         grid_size=grid_size,
-        grid_width=width // grid_size,
-        grid_height=height // grid_size,
+        grid_width=columns,
+        grid_height=rows,
         colors=palette,
         player=player,
         enemy=enemy,
         speed=speed,
         power_mode=power_mode,
         branding=branding,
+        display=display,
+        ai=ai,
+        input=input_settings,
+        effects=effects,
+        quality=quality,
+        score_backend=score_backend,
+        heatmap=heatmap,
+        stall_watchdog=stall_watchdog,
+        font_name=raw_config.get("font_name", _DEFAULT_CONFIG["font_name"]),
+        language=raw_config.get("language", _DEFAULT_CONFIG["language"]),
     )
+
+
+_LAYOUT_FIELDS = frozenset({"width", "height", "grid_size", "grid_width", "grid_height"})
+
+
+def diff_settings(old: GameSettings, new: GameSettings) -> frozenset[str]:
+    """Return the names of the settings groups that differ between two snapshots.
+
+    Geometry fields are folded into a single ``"layout"`` group because any of
+    them invalidates the level; every other top-level field maps to its own name.
+    """
+    changed = set()
+    for field in fields(GameSettings):
+        if getattr(old, field.name) != getattr(new, field.name):
+            changed.add("layout" if field.name in _LAYOUT_FIELDS else field.name)
+    return frozenset(changed)
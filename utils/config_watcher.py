@@ -0,0 +1,61 @@
+"""Polling watcher that hot-reloads ``config.json`` while the game runs."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from utils.config_loader import GameSettings, diff_settings, load_settings
+
+
+class ConfigWatcher:
+    """Detect edits to the configuration file and produce fresh settings.
+
+    The watcher only stats the file once per ``interval`` seconds so it is cheap
+    enough to poll from the frame loop.
+    """
+
+    def __init__(self, settings: GameSettings, path: str | Path = "config.json", interval: float = 1.0):
+        self._path = Path(path)
+        self._interval = interval
+        self._settings = settings
+        self._next_check = time.monotonic() + interval
+        self._signature = self._stat_signature()
+
+    @property
+    def settings(self) -> GameSettings:
+        return self._settings
+
+    def poll(self) -> tuple[GameSettings, frozenset[str]] | None:
+        """Return ``(settings, changed_groups)`` when the file changed, else ``None``."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return None
+        self._next_check = now + self._interval
+
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return None
+        self._signature = signature
+
+        try:
+            new_settings = load_settings(self._path)
+        except (OSError, ValueError, TypeError, ZeroDivisionError) as exc:
+            # Editors often write files in several steps; keep the last good config.
+            print(f"Warning: Could not reload {self._path}: {exc}")
+            return None
+
+        changed = diff_settings(self._settings, new_settings)
+        self._settings = new_settings
+        if not changed:
+            return None
+        return new_settings, changed
+
+    def _stat_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
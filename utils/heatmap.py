@@ -0,0 +1,99 @@
+"""Tile occupancy and death heatmaps, merged into memory-mapped ``.npy`` files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent writers on one machine are not locked.
+    fcntl = None
+
+# Layers of a heatmap file, in order.
+HEATMAP_LAYERS = ("player", "enemies", "deaths")
+
+
+def heatmap_path(directory: str | Path, columns: int, rows: int) -> Path:
+    """The file that accumulates counts for mazes of one size."""
+    return Path(directory) / f"heatmap-{columns}x{rows}.npy"
+
+
+class HeatmapRecorder:
+    """Count tile visits per tick and player deaths, and add them to a file.
+
+    Counts live in one ``(layers, rows, columns)`` array; a sample is one
+    increment for the player and one per enemy. Every ``flush_ticks`` samples
+    (and on :meth:`close`) the counts are added to :func:`heatmap_path`
+    through a memory map under a file lock, then zeroed, so sessions and
+    several kiosk processes on one machine sum into the same file. Files from
+    different machines can be combined with :func:`load_heatmap`.
+    """
+
+    def __init__(self, grid_size: int, columns: int, rows: int, directory: str | Path, flush_ticks: int = 3600):
+        self._grid = grid_size
+        self._half = grid_size // 2
+        self._path = heatmap_path(directory, columns, rows)
+        self._flush_ticks = max(1, flush_ticks)
+        self._ticks = 0
+        self.counts = np.zeros((len(HEATMAP_LAYERS), rows, columns), dtype=np.int64)
+        self._player, self._enemies, self._deaths = self.counts
+
+    def sample(self, player, enemies) -> None:
+        """Record the tiles under the player's and every enemy's centre."""
+        grid, half = self._grid, self._half
+        self._player[int(player.y + half) // grid, int(player.x + half) // grid] += 1
+        counts = self._enemies
+        for enemy in enemies:
+            counts[int(enemy.y + half) // grid, int(enemy.x + half) // grid] += 1
+        self._ticks += 1
+        if self._ticks >= self._flush_ticks:
+            self.flush()
+
+    def record_death(self, x: float, y: float) -> None:
+        self._deaths[int(y + self._half) // self._grid, int(x + self._half) // self._grid] += 1
+
+    def flush(self) -> None:
+        """Add the pending counts to the file and start counting from zero."""
+        self._ticks = 0
+        if not self.counts.any():
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path.with_suffix(".lock"), "w") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                if self._path.exists():
+                    stored = np.lib.format.open_memmap(self._path, mode="r+")
+                    if stored.shape != self.counts.shape:
+                        print(f"Warning: {self._path} has shape {stored.shape}, expected {self.counts.shape}; not merging")
+                        return
+                else:
+                    stored = np.lib.format.open_memmap(self._path, mode="w+", dtype=np.int64, shape=self.counts.shape)
+                stored += self.counts
+                stored.flush()
+                del stored
+        except (OSError, ValueError) as exc:
+            print(f"Warning: Could not write heatmap {self._path}: {exc}")
+            return
+        self.counts[:] = 0
+
+    def close(self) -> None:
+        self.flush()
+
+
+def load_heatmap(paths: list[str | Path]) -> np.ndarray:
+    """Sum heatmap files of the same maze size, e.g. collected from several kiosks."""
+    total = None
+    for path in paths:
+        counts = np.load(path, mmap_mode="r")
+        if total is None:
+            total = np.array(counts, dtype=np.int64)
+        elif counts.shape != total.shape:
+            raise ValueError(f"{path} has shape {counts.shape}, expected {total.shape}")
+        else:
+            total += counts
+    if total is None:
+        raise ValueError("no heatmap files given")
+    return total
@@ -0,0 +1,156 @@
+"""tracemalloc based memory reports taken at level boundaries."""
+
+from __future__ import annotations
+
+import gc
+import linecache
+import signal
+import threading
+import time
+import tokenize
+import tracemalloc
+from collections import Counter, deque
+from pathlib import Path
+
+MEMORY_DUMP_DIR = Path(".cache") / "memory"
+
+# Objects from these packages are counted by type at every level boundary.
+_GAME_PACKAGES = ("core.", "views.", "utils.")
+
+
+class MemoryDiagnostics:
+    """Track allocations across levels to find slow growth in long sessions.
+
+    At each level boundary a tracemalloc snapshot is taken and compared with
+    the previous one, game objects are counted by type, and every category
+    (object type, or traced bytes per source file) that grew at each of the
+    last ``window`` boundaries is flagged. :meth:`request_dump` writes a full
+    diff against the first snapshot; it is safe to call from a signal handler
+    and is wired to ``SIGUSR1`` where available.
+    """
+
+    def __init__(self, frames: int = 1, top: int = 10, window: int = 5, dump_dir: Path = MEMORY_DUMP_DIR):
+        self._top = top
+        self._dump_dir = dump_dir
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._previous_sites: dict[tuple[str, int], tuple[int, int]] | None = None
+        self._history: deque[Counter[str]] = deque(maxlen=window + 1)
+        self._dump_requested = False
+        self.levels = 0
+        # Every traced allocation records ``frames`` stack frames, so deeper
+        # tracebacks make the whole game markedly slower while tracing.
+        tracemalloc.start(frames)
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.request_dump())
+
+    def request_dump(self) -> None:
+        """Ask for a diff dump at the next :meth:`poll`; only sets a flag."""
+        self._dump_requested = True
+
+    def poll(self) -> None:
+        """Write a requested dump; call once per frame from the main loop."""
+        if self._dump_requested:
+            self._dump_requested = False
+            print(f"Memory dump written to {self.dump()}")
+
+    def level_boundary(self) -> str:
+        """Snapshot at the start of a level, print the report and return it."""
+        self.levels += 1
+        snapshot = tracemalloc.take_snapshot()
+        sites = self._site_sizes(snapshot)
+        counts = self.object_counts()
+        categories = Counter({f"objects:{name}": count for name, count in counts.items()})
+        for (filename, _), (size, _) in sites.items():
+            categories[f"bytes:{filename}"] += size
+        self._history.append(categories)
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Memory at level {self.levels}: {current / 1024:.0f} KiB traced, peak {peak / 1024:.0f} KiB"]
+        if self._previous_sites is not None:
+            lines.append("  Top allocation changes since the previous level:")
+            lines.extend(f"    {change}" for change in self._top_changes(sites, self._previous_sites))
+        lines.append("  Game objects: " + ", ".join(f"{name} {count}" for name, count in counts.most_common()))
+        growing = self.growing_categories()
+        if growing:
+            lines.append(f"  Warning: grew at each of the last {self._history.maxlen - 1} levels: " + ", ".join(growing))
+        if self._baseline is None:
+            self._baseline = snapshot
+        self._previous_sites = sites
+        report = "\n".join(lines)
+        print(report)
+        return report
+
+    def growing_categories(self) -> list[str]:
+        """Categories that increased at every one of the recorded boundaries."""
+        if len(self._history) < self._history.maxlen:
+            return []
+        history = list(self._history)
+        return sorted(
+            category
+            for category in history[-1]
+            if all(earlier[category] < later[category] for earlier, later in zip(history, history[1:]))
+        )
+
+    @staticmethod
+    def object_counts() -> Counter[str]:
+        """Live instances of the game's own classes, keyed by class name."""
+        gc.collect()
+        return Counter(
+            type(obj).__qualname__
+            for obj in gc.get_objects()
+            if type(obj).__module__.startswith(_GAME_PACKAGES)
+        )
+
+    def dump(self) -> Path:
+        """Write a diff of the current heap against the first level's snapshot."""
+        snapshot = tracemalloc.take_snapshot()
+        reference = self._baseline or snapshot
+        self._dump_dir.mkdir(parents=True, exist_ok=True)
+        path = self._dump_dir / f"memory-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+        lines = [f"Allocation changes since level 1 ({self.levels} levels played)", ""]
+        changes = [
+            stat for stat in snapshot.compare_to(reference, "traceback")
+            if stat.size_diff and not _ignored(stat.traceback[0].filename)
+        ]
+        for stat in changes[: self._top * 5]:
+            frame = stat.traceback[0]
+            lines.append(_format_change(frame.filename, frame.lineno, stat.size_diff, stat.count_diff))
+            for line in stat.traceback.format()[-6:]:
+                lines.append(f"    {line}")
+        lines += ["", "Game objects:"]
+        lines.extend(f"  {name}: {count}" for name, count in self.object_counts().most_common())
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+    def _top_changes(self, sites: dict[tuple[str, int], tuple[int, int]], previous: dict[tuple[str, int], tuple[int, int]]) -> list[str]:
+        changes = []
+        for site in sites.keys() | previous.keys():
+            size, count = sites.get(site, (0, 0))
+            old_size, old_count = previous.get(site, (0, 0))
+            if size != old_size:
+                changes.append((abs(size - old_size), site, size - old_size, count - old_count))
+        changes.sort(reverse=True)
+        return [_format_change(site[0], site[1], size_diff, count_diff) for _, site, size_diff, count_diff in changes[: self._top]]
+
+    @staticmethod
+    def _site_sizes(snapshot: tracemalloc.Snapshot) -> dict[tuple[str, int], tuple[int, int]]:
+        """``(size, count)`` per allocating line, grouped once per snapshot."""
+        sites = {}
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            if not _ignored(frame.filename):
+                sites[(frame.filename, frame.lineno)] = (stat.size, stat.count)
+        return sites
+
+
+# Allocations made by the diagnostics themselves would otherwise read as growth.
+_IGNORED_FILES = frozenset({tracemalloc.__file__, linecache.__file__, tokenize.__file__, __file__})
+
+
+def _ignored(filename: str) -> bool:
+    return filename in _IGNORED_FILES or filename.startswith("<")
+
+
+def _format_change(filename: str, lineno: int, size_diff: int, count_diff: int) -> str:
+    source = linecache.getline(filename, lineno).strip()
+    return f"{filename}:{lineno}: {size_diff / 1024:+.1f} KiB ({count_diff:+d} blocks)  {source}"
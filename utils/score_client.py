@@ -0,0 +1,271 @@
+"""Background score submission with an on-disk outbox."""
+
+from __future__ import annotations
+
+import http.client
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from utils.config_loader import ScoreBackendSettings
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP connections to one host, reused across requests."""
+
+    def __init__(self, endpoint: str, timeout: float, max_idle: int = 2):
+        parts = urlsplit(endpoint)
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._host = parts.netloc
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path += "?" + parts.query
+        self._timeout = timeout
+        self._max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> http.client.HTTPConnection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connection_class(self._host, timeout=self._timeout)
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class ScoreClient:
+    """Queue score records on disk and deliver them from a worker thread.
+
+    :meth:`submit` only writes a small JSON file (atomically, via rename), so
+    the game never waits on the network. The worker posts the oldest records
+    in batches as ``{"records": [...]}`` over a keep-alive connection and
+    deletes them once the server accepts them. Connection errors and 5xx
+    responses back off exponentially with jitter; records the server rejects
+    with another 4xx are moved to ``rejected/`` so they cannot block the queue.
+    Anything still queued at exit is sent on the next run.
+
+    Several processes (prefork workers) may share one outbox. Before sending,
+    a client claims its batch by moving each file with ``os.replace`` into
+    its own directory under ``claimed/``, so no record is posted by two
+    clients. A failed send puts the batch back; claims left behind by a
+    process that died mid-send are returned to the outbox once they are
+    older than any send could take.
+    """
+
+    BASE_DELAY = 1.0
+    MAX_DELAY = 300.0
+    IDLE_POLL = 30.0
+
+    def __init__(self, settings: ScoreBackendSettings, start_worker: bool = True):
+        self._settings = settings
+        self._queue_dir = Path(settings.queue_dir)
+        self._queue_dir.mkdir(parents=True, exist_ok=True)
+        self._claims_dir = self._queue_dir / "claimed"
+        self._claim_dir = self._claims_dir / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        # A claim older than this belongs to a client that died while sending.
+        self._stale_claim = max(60.0, 4 * settings.timeout)
+        self._pool = _ConnectionPool(settings.endpoint, settings.timeout)
+        self._sequence = itertools.count()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._stopping = False
+        self.sent = 0
+        self.failures = 0
+        self._consecutive_failures = 0
+        self._worker: threading.Thread | None = None
+        if start_worker:
+            self._worker = threading.Thread(target=self._run, name="score-client", daemon=True)
+            self._worker.start()
+
+    @property
+    def pending(self) -> int:
+        """Records not delivered yet, including batches other clients are sending."""
+        return len(self._queued_files()) + len(list(self._claims_dir.glob("*/*.json")))
+
+    def submit(self, record: dict[str, Any]) -> None:
+        """Persist ``record`` to the outbox and wake the worker."""
+        name = f"{time.time_ns():020d}-{os.getpid()}-{next(self._sequence):06d}"
+        temporary = self._queue_dir / f"{name}.tmp"
+        try:
+            temporary.write_text(json.dumps(record), encoding="utf-8")
+            os.replace(temporary, self._queue_dir / f"{name}.json")
+        except OSError as exc:
+            print(f"Warning: Could not queue score record: {exc}")
+            return
+        self._idle.clear()
+        self._wake.set()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wake the worker and wait until the outbox is empty or ``timeout`` passes."""
+        if self._worker is None:
+            return self.pending == 0
+        self._idle.clear()
+        self._wake.set()
+        return self._idle.wait(timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Give the worker ``timeout`` seconds to drain the queue, then stop it."""
+        if self._worker is None:
+            self._pool.close()
+            self._remove_claim_dir()
+            return
+        self.flush(timeout)
+        self._stopping = True
+        self._wake.set()
+        self._worker.join(timeout)
+        self._pool.close()
+
+    def _queued_files(self) -> list[Path]:
+        return sorted(self._queue_dir.glob("*.json"))
+
+    def deliver_once(self) -> float | None:
+        """Send the oldest batch (blocking).
+
+        Returns ``None`` when the outbox is empty, ``0`` after a successful
+        send, or the backoff in seconds to wait after a failure. The worker
+        thread calls this in a loop; an event loop without the thread can call
+        it from an executor instead.
+        """
+        batch = self._claim(max(1, self._settings.batch_size))
+        if not batch:
+            self._recover_stale_claims()
+            return None
+        try:
+            self._send(batch)
+        except (OSError, http.client.HTTPException) as exc:
+            self._unclaim(batch)
+            self._consecutive_failures += 1
+            self.failures += 1
+            delay = min(self.MAX_DELAY, self.BASE_DELAY * 2 ** (self._consecutive_failures - 1))
+            delay *= random.uniform(0.5, 1.0)
+            print(f"Warning: Score upload failed ({exc}), retrying in {delay:.1f}s")
+            return delay
+        self._consecutive_failures = 0
+        return 0.0
+
+    def _run(self) -> None:
+        while not self._stopping:
+            # Cleared before looking at the queue so a submit that lands while
+            # a batch is in flight still wakes the next wait.
+            self._wake.clear()
+            delay = self.deliver_once()
+            if delay == 0:
+                continue
+            if delay is None:
+                self._idle.set()
+                delay = self.IDLE_POLL
+            self._wake.wait(delay)
+        self._remove_claim_dir()
+
+    def _claim(self, limit: int) -> list[Path]:
+        """Move up to ``limit`` of the oldest records into this client's claim directory."""
+        batch = []
+        for path in self._queued_files():
+            claimed = self._claim_dir / path.name
+            try:
+                self._claim_dir.mkdir(parents=True, exist_ok=True)
+                os.replace(path, claimed)
+            except FileNotFoundError:
+                continue  # Claimed by another client first.
+            except OSError as exc:
+                print(f"Warning: Could not claim score record {path.name}: {exc}")
+                break
+            # The age of a claim is measured from now, not from when it was queued.
+            try:
+                os.utime(claimed)
+            except OSError:
+                pass
+            batch.append(claimed)
+            if len(batch) >= limit:
+                break
+        return batch
+
+    def _unclaim(self, batch: list[Path]) -> None:
+        """Return claimed records to the outbox."""
+        for path in batch:
+            try:
+                os.replace(path, self._queue_dir / path.name)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                print(f"Warning: Could not return score record {path.name} to the outbox: {exc}")
+
+    def _recover_stale_claims(self) -> None:
+        now = time.time()
+        for path in self._claims_dir.glob("*/*.json"):
+            try:
+                stale = now - path.stat().st_mtime > self._stale_claim
+            except OSError:
+                continue
+            if stale:
+                self._unclaim([path])
+
+    def _remove_claim_dir(self) -> None:
+        try:
+            self._claim_dir.rmdir()
+        except OSError:
+            pass  # Never created, or still holds a batch that will be recovered.
+
+    def _send(self, batch: list[Path]) -> None:
+        records = []
+        for path in batch:
+            try:
+                records.append(json.loads(path.read_text(encoding="utf-8")))
+            except ValueError:
+                # A torn or hand-edited file would otherwise block the queue forever.
+                self._reject([path])
+                self._unclaim([other for other in batch if other != path])
+                return
+        body = json.dumps({"records": records}).encode("utf-8")
+        connection = self._pool.acquire()
+        try:
+            connection.request(
+                "POST",
+                self._pool.path,
+                body=body,
+                headers={"Content-Type": "application/json", "Connection": "keep-alive"},
+            )
+            response = connection.getresponse()
+            response.read()
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._pool.release(connection)
+
+        if 200 <= response.status < 300:
+            for path in batch:
+                path.unlink(missing_ok=True)
+            self.sent += len(batch)
+        elif 400 <= response.status < 500 and response.status not in (408, 429):
+            print(f"Warning: Score server rejected {len(batch)} records with HTTP {response.status}")
+            self._reject(batch)
+        else:
+            raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+
+    def _reject(self, batch: list[Path]) -> None:
+        rejected = self._queue_dir / "rejected"
+        rejected.mkdir(exist_ok=True)
+        for path in batch:
+            os.replace(path, rejected / path.name)
@@ -4,15 +4,55 @@ from __future__ import annotations
 
 import pygame
 
+from core.events import EventBus, GameEvent, GameEventType, Subscription
+
 
 class SoundManager:
-    """Centralised sound loader and playback helper."""
+    """Centralised sound loader and playback helper.
+
+    The mixer is opened on first use rather than at construction so that a game
+    without audio never pays for audio device initialisation at startup.
+    """
 
     def __init__(self) -> None:
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
         self.sounds: dict[str, pygame.mixer.Sound | None] = {}
+        self._audio_unavailable = False
+
+    def attach(self, events: EventBus) -> Subscription:
+        """Play the matching effect for gameplay events published on ``events``."""
+        players = {
+            GameEventType.COIN_COLLECTED: self.play_coin_collect,
+            GameEventType.POWER_PELLET_COLLECTED: self.play_power_mode,
+            GameEventType.ENEMY_EATEN: self.play_enemy_eaten,
+            GameEventType.GAME_OVER: self.play_game_over,
+        }
+        return events.subscribe_all({event_type: self._player(play) for event_type, play in players.items()})
+
+    @staticmethod
+    def _player(play):
+        def handle(event: GameEvent) -> None:
+            play()
+
+        return handle
+
+    def _ensure_mixer(self) -> bool:
+        if pygame.mixer.get_init():
+            return True
+        if self._audio_unavailable:
+            # Do not retry the device (and warn again) for every gameplay event.
+            return False
+        try:
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        except pygame.error:
+            print("Warning: Audio device unavailable, sounds disabled")
+            self._audio_unavailable = True
+            return False
+        return True
 
     def load_sound(self, name: str, file_path: str) -> None:
+        if not self._ensure_mixer():
+            self.sounds[name] = None
+            return
         try:
             self.sounds[name] = pygame.mixer.Sound(file_path)
         except pygame.error:
@@ -24,14 +64,18 @@ class SoundManager:
         if sound:
             sound.play()
 
+    def _play_placeholder(self) -> None:
+        if self._ensure_mixer():
+            pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytearray([128] * 44)))
+
     def play_coin_collect(self) -> None:
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytearray([128] * 44)))
+        self._play_placeholder()
 
     def play_power_mode(self) -> None:
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytearray([128] * 44)))
+        self._play_placeholder()
 
     def play_enemy_eaten(self) -> None:
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytearray([128] * 44)))
+        self._play_placeholder()
 
     def play_game_over(self) -> None:
-        pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=bytearray([128] * 44)))
+        self._play_placeholder()
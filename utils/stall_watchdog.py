@@ -0,0 +1,170 @@
+"""Detect frame stalls and sample what the game loop was doing during them."""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+
+STALL_REPORT_DIR = Path(".cache") / "stalls"
+
+
+class StallWatchdog:
+    """Watch the frame loop's heartbeat and profile it while it is late.
+
+    The loop calls :meth:`heartbeat` at the start of every frame. A daemon
+    thread checks it; once no frame has started for a frame period plus
+    ``margin_ms`` it samples the loop thread's stack via
+    ``sys._current_frames`` every ``sample_interval_ms`` until the next
+    heartbeat, then writes two files to ``directory``:
+
+    * ``stall-<time>.folded``: the samples aggregated into folded stacks
+      (``outer;inner count`` per line), ready for ``flamegraph.pl`` or
+      speedscope;
+    * ``stall-<time>.txt``: duration, garbage collector counters when the
+      stall was noticed, the collections that ran during it, and the top
+      stacks.
+
+    The sampler needs the GIL, so code that holds it (a collection, a long C
+    call such as ``SysFont``) shows up as fewer samples, attributed to the
+    Python line that made the call. Collections are timed separately through
+    ``gc.callbacks`` for that reason.
+    """
+
+    def __init__(
+        self,
+        fps: int,
+        margin_ms: float = 100.0,
+        sample_interval_ms: float = 5.0,
+        directory: str | Path = STALL_REPORT_DIR,
+    ):
+        self._period = 1 / max(1, fps)
+        self._margin = margin_ms / 1000
+        self._interval = max(0.001, sample_interval_ms / 1000)
+        # Idle checks only need to notice a stall well within the margin.
+        self._idle_interval = max(self._interval, min(0.05, self._margin / 4))
+        self._directory = Path(directory)
+        self._thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._gc_started: float | None = None
+        self._collections: deque[tuple[int, float, float, int]] = deque(maxlen=4096)
+        self._frame_names: dict[tuple[object, int], str] = {}
+        self.stalls = 0
+        self._stop = threading.Event()
+        gc.callbacks.append(self._on_gc)
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def heartbeat(self) -> None:
+        """Mark the start of a frame; call from the loop thread."""
+        self._beat = time.monotonic()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._gc_started = time.monotonic()
+        elif self._gc_started is not None:
+            self._collections.append((info["generation"], self._gc_started, time.monotonic(), info["collected"]))
+            self._gc_started = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self._idle_interval):
+            beat = self._beat
+            if time.monotonic() - beat > self._period + self._margin:
+                self._profile_stall(beat)
+
+    def _profile_stall(self, beat: float) -> None:
+        noticed = time.monotonic()
+        wall_clock = time.time()
+        gc_counts = gc.get_count()
+        gc_stats = gc.get_stats()
+        stacks: Counter[str] = Counter()
+        samples = 0
+        while self._beat == beat and not self._stop.is_set():
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                return
+            stacks[self._fold(frame)] += 1
+            samples += 1
+            del frame
+            self._stop.wait(self._interval)
+        ended = self._beat if self._beat != beat else time.monotonic()
+        self.stalls += 1
+        try:
+            path = self._write_report(beat, noticed, ended, wall_clock, gc_counts, gc_stats, stacks, samples)
+        except OSError as exc:
+            print(f"Warning: Could not write stall report: {exc}")
+            return
+        print(f"Frame stall of {(ended - beat) * 1000:.0f} ms; report written to {path}")
+
+    def _fold(self, frame) -> str:
+        """One sample as ``outermost;...;innermost`` frame names."""
+        names = []
+        if frame.f_code is _GC_CALLBACK:
+            # Caught as a collection finished: charge the sample to the collector.
+            names.append("[garbage collection]")
+            frame = frame.f_back
+        while frame is not None:
+            key = (frame.f_code, frame.f_lineno)
+            name = self._frame_names.get(key)
+            if name is None:
+                code = frame.f_code
+                qualname = getattr(code, "co_qualname", code.co_name)
+                name = f"{qualname} ({os.path.basename(code.co_filename)}:{frame.f_lineno})".replace(";", ":")
+                self._frame_names[key] = name
+            names.append(name)
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    def _write_report(self, beat, noticed, ended, wall_clock, gc_counts, gc_stats, stacks, samples) -> Path:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        stem = self._directory / f"stall-{time.strftime('%Y%m%d-%H%M%S', time.localtime(wall_clock))}-{self.stalls}"
+        folded = stem.with_suffix(".folded")
+        folded.write_text("".join(f"{stack} {count}\n" for stack, count in stacks.most_common()), encoding="utf-8")
+
+        budget = self._period * 1000
+        lines = [
+            f"Frame stall: {(ended - beat) * 1000:.1f} ms without a new frame "
+            f"(budget {budget:.1f} ms + {self._margin * 1000:.0f} ms margin), noticed at "
+            f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_clock))}",
+            f"Samples: {samples} every {self._interval * 1000:.1f} ms over the last {(ended - noticed) * 1000:.1f} ms",
+            f"Folded stacks: {folded.name}",
+            "",
+            f"GC when noticed: pending counts {gc_counts}, thresholds {gc.get_threshold()}",
+        ]
+        lines.extend(
+            f"  generation {generation}: {stats['collections']} collections, "
+            f"{stats['collected']} collected, {stats['uncollectable']} uncollectable"
+            for generation, stats in enumerate(gc_stats)
+        )
+        # list() copies in one C call, so the loop thread cannot append midway.
+        during = [entry for entry in list(self._collections) if entry[2] >= beat and entry[1] <= ended]
+        total = sum(stop - start for _, start, stop, _ in during) * 1000
+        lines.append(f"Collections during the stall: {len(during)}, {total:.1f} ms")
+        for generation in range(len(gc_stats)):
+            times = [stop - start for number, start, stop, _ in during if number == generation]
+            if times:
+                collected = sum(entry[3] for entry in during if entry[0] == generation)
+                lines.append(
+                    f"  generation {generation}: {len(times)} runs, {sum(times) * 1000:.1f} ms, "
+                    f"longest {max(times) * 1000:.1f} ms, {collected} collected"
+                )
+        lines += ["", "Top stacks (innermost frame last):"]
+        for stack, count in stacks.most_common(10):
+            lines.append(f"  {count} samples ({count / max(1, samples):.0%})")
+            lines.extend(f"    {name}" for name in stack.split(";")[-8:])
+        summary = stem.with_suffix(".txt")
+        summary.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return summary
+
+
+_GC_CALLBACK = StallWatchdog._on_gc.__code__
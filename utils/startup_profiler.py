@@ -0,0 +1,44 @@
+"""Wall-clock breakdown of the boot-to-playable path."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class StartupProfiler:
+    """Record named startup phases and print a timing table once playable."""
+
+    def __init__(self, origin: float | None = None):
+        self._origin = time.perf_counter() if origin is None else origin
+        self._phases: list[tuple[str, float]] = []
+        self._ready_at: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start))
+
+    def mark_ready(self) -> None:
+        """Note the moment the first frame was presented; later calls are ignored."""
+        if self._ready_at is None:
+            self._ready_at = time.perf_counter()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready_at is not None
+
+    def report(self) -> str:
+        end = self._ready_at if self._ready_at is not None else time.perf_counter()
+        total = end - self._origin
+        lines = ["Startup timing:"]
+        for name, duration in self._phases:
+            lines.append(f"  {name:<24}{duration * 1000:9.1f} ms")
+        accounted = sum(duration for _, duration in self._phases)
+        lines.append(f"  {'other':<24}{(total - accounted) * 1000:9.1f} ms")
+        lines.append(f"  {'boot to playable':<24}{total * 1000:9.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,13 @@
+"""Small summary statistics shared by the timing reports."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+
+def percentiles(samples: Iterable[float], points: tuple[int, ...] = (50, 95, 99)) -> dict[int, float]:
+    """Nearest-rank percentiles of ``samples``, keyed by percentile; empty if there are none."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    return {point: ordered[round(point / 100 * (len(ordered) - 1))] for point in points}
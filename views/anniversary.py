@@ -10,44 +10,72 @@ import pygame
 
 from utils.config_loader import GameSettings
 from views.fonts import FontBundle
+from views.localization import Localizer
+
+
+LOGO_PATHS = (
+    Path("assets/start-logo.png"),
+    Path("assets/logo.png"),
+    Path("assets/irancell-pacman.png"),
+)
+
+# Decoded once per process; a preforking parent fills it before forking.
+_logo_cache: dict[str, pygame.Surface | None] = {}
+
+
+def load_logo_source() -> pygame.Surface | None:
+    """Decode the first available anniversary logo, reusing an earlier decode."""
+    if "logo" not in _logo_cache:
+        _logo_cache["logo"] = None
+        for path in LOGO_PATHS:
+            if path.exists():
+                try:
+                    _logo_cache["logo"] = pygame.image.load(str(path))
+                    break
+                except Exception:
+                    continue
+    return _logo_cache["logo"]
 
 
 class AnniversaryView:
     """Render anniversary specific UI elements."""
 
-    def __init__(self, settings: GameSettings, fonts: FontBundle):
+    def __init__(self, settings: GameSettings, fonts: FontBundle, localizer: Localizer | None = None):
         self._settings = settings
         self._fonts = fonts
+        self._localizer = localizer or Localizer(settings.language)
         self._logo = None
+        self._logo_source = None
         self._load_logo()
 
+    def apply_settings(self, settings: GameSettings, changed: frozenset[str]) -> None:
+        """Adopt reloaded settings, rescaling the already decoded logo if needed."""
+        self._settings = settings
+        if "language" in changed:
+            self._localizer.set_language(settings.language)
+        if "layout" in changed and self._logo_source is not None:
+            self._logo = self._scale_logo(self._logo_source)
+
     def _load_logo(self) -> None:
         """Load the anniversary logo image."""
-        logo_paths = [
-            Path("assets/start-logo.png"),
-            Path("assets/logo.png"),
-            Path("assets/irancell-pacman.png"),
-        ]
-        for path in logo_paths:
-            if path.exists():
-                try:
-                    self._logo = pygame.image.load(str(path))
-                    # Scale logo to fit nicely on screen (max 600px wide, 400px tall)
-                    logo_rect = self._logo.get_rect()
-                    max_width = min(600, self._settings.width - 100)
-                    max_height = 400
-                    
-                    scale_factor = min(max_width / logo_rect.width, max_height / logo_rect.height)
-                    new_width = int(logo_rect.width * scale_factor)
-                    new_height = int(logo_rect.height * scale_factor)
-                    
-                    self._logo = pygame.transform.scale(self._logo, (new_width, new_height))
-                    break
-                except Exception:
-                    continue
+        self._logo_source = load_logo_source()
+        if self._logo_source is not None:
+            self._logo = self._scale_logo(self._logo_source)
+
+    def _scale_logo(self, logo: pygame.Surface) -> pygame.Surface:
+        # Scale logo to fit nicely on screen (max 600px wide, 400px tall)
+        logo_rect = logo.get_rect()
+        max_width = min(600, self._settings.width - 100)
+        max_height = 400
+
+        scale_factor = min(max_width / logo_rect.width, max_height / logo_rect.height)
+        new_width = int(logo_rect.width * scale_factor)
+        new_height = int(logo_rect.height * scale_factor)
+
+        return pygame.transform.scale(logo, (new_width, new_height))
 
     def draw_decorations(self, surface: pygame.Surface) -> None:
-        year_text = self._fonts.small.render(f"{datetime.now().year}", True, self._settings.colors.primary)
+        year_text = self._localizer.render(self._fonts.small, "year", self._settings.colors.primary, year=datetime.now().year)
         surface.blit(year_text, (20, 20))
         surface.blit(year_text, (self._settings.width - 40, 20))
         pygame.draw.circle(surface, self._settings.colors.primary, (25, self._settings.height - 25), 15, 2)
@@ -74,43 +102,41 @@ class AnniversaryView:
             )
             pygame.draw.line(surface, (50, 50, 100), start_pos, end_pos, 1)
 
+        localizer = self._localizer
         # Draw logo if available
         if self._logo:
             logo_rect = self._logo.get_rect(center=(self._settings.width // 2, self._settings.height // 2 - 80))
             surface.blit(self._logo, logo_rect)
             
             # Position text below logo
-            start_text = self._fonts.large.render("Press any key to start", True, self._settings.colors.text)
+            start_text = localizer.render(self._fonts.large, "press_start", self._settings.colors.text)
             start_rect = start_text.get_rect(center=(self._settings.width // 2, self._settings.height // 2 + 180))
             surface.blit(start_text, start_rect)
             
             # Optional: Add slogan below
-            branding_text = self._fonts.medium.render(
-                self._settings.branding.slogan, 
-                True, 
-                (173, 216, 230)
-            )
+            branding_text = localizer.render_text(self._fonts.medium, self._settings.branding.slogan, (173, 216, 230))
             branding_rect = branding_text.get_rect(center=(self._settings.width // 2, self._settings.height // 2 + 230))
             surface.blit(branding_text, branding_rect)
         else:
             # Fallback to text-only if logo not found
-            title_text = self._fonts.large.render("PAC-IRANCELL", True, self._settings.colors.primary)
+            title_text = localizer.render(self._fonts.large, "title", self._settings.colors.primary)
             title_rect = title_text.get_rect(center=(self._settings.width // 2, self._settings.height // 2 - 100))
             surface.blit(title_text, title_rect)
 
-            subtitle = self._fonts.medium.render(
-                f"Anniversary Edition - {self._settings.branding.years_of_service} Years of Service",
-                True,
+            subtitle = localizer.render(
+                self._fonts.medium,
+                "subtitle",
                 (255, 215, 0),
+                years=self._settings.branding.years_of_service,
             )
             subtitle_rect = subtitle.get_rect(center=(self._settings.width // 2, self._settings.height // 2 - 30))
             surface.blit(subtitle, subtitle_rect)
 
-            branding_text = self._fonts.default.render(self._settings.branding.slogan, True, (173, 216, 230))
+            branding_text = localizer.render_text(self._fonts.default, self._settings.branding.slogan, (173, 216, 230))
             branding_rect = branding_text.get_rect(center=(self._settings.width // 2, self._settings.height // 2 + 30))
             surface.blit(branding_text, branding_rect)
 
-            start_text = self._fonts.default.render("Press any key to start", True, self._settings.colors.text)
+            start_text = localizer.render(self._fonts.default, "press_start", self._settings.colors.text)
             start_rect = start_text.get_rect(center=(self._settings.width // 2, self._settings.height // 2 + 80))
             surface.blit(start_text, start_rect)
 
@@ -0,0 +1,48 @@
+"""Viewport that scrolls over mazes larger than the window."""
+
+from __future__ import annotations
+
+from utils.config_loader import GameSettings
+
+
+class Camera:
+    """Window-sized view onto the maze, kept centred on a target.
+
+    The view is clamped to the maze edges; a maze smaller than the window is
+    centred instead, so the classic single-screen maze never scrolls.
+    """
+
+    def __init__(self, settings: GameSettings):
+        self._settings = settings
+        self.x = 0
+        self.y = 0
+
+    def apply_settings(self, settings: GameSettings) -> None:
+        self._settings = settings
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        """Maze coordinates of the window's top-left corner."""
+        return self.x, self.y
+
+    def follow(self, x: float, y: float) -> None:
+        """Centre the view on the tile whose top-left corner is ``(x, y)``."""
+        settings = self._settings
+        half_tile = settings.grid_size // 2
+        self.x = self._clamp(int(x) + half_tile - settings.width // 2, settings.maze_width, settings.width)
+        self.y = self._clamp(int(y) + half_tile - settings.height // 2, settings.maze_height, settings.height)
+
+    @staticmethod
+    def _clamp(position: int, maze_extent: int, view_extent: int) -> int:
+        if maze_extent <= view_extent:
+            return (maze_extent - view_extent) // 2
+        return max(0, min(position, maze_extent - view_extent))
+
+    def visible(self, x: float, y: float, width: int, height: int) -> bool:
+        """Whether a maze-space box overlaps the view."""
+        return (
+            x < self.x + self._settings.width
+            and x + width > self.x
+            and y < self.y + self._settings.height
+            and y + height > self.y
+        )
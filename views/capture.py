@@ -0,0 +1,119 @@
+"""Asynchronous capture of presented frames to disk."""
+
+from __future__ import annotations
+
+import queue
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+import pygame
+
+from views.render_backend import RenderBackend
+
+CAPTURE_FORMATS = ("png", "raw", "video")
+
+
+class FrameCapture:
+    """Copy presented frames into a fixed pool of surfaces and encode them on a thread.
+
+    The game thread only blits the frame into a free slot; a writer thread
+    turns slots into a PNG sequence (``png``), one raw RGB24 stream
+    (``raw``) or an H.264 file through an ``ffmpeg`` pipe (``video``).
+    When every slot is still waiting for the writer the frame is dropped
+    instead of blocking the game, and counted in :attr:`dropped`.
+    """
+
+    def __init__(self, directory: str | Path, fmt: str = "png", fps: int = 60, pool_size: int = 8):
+        if fmt not in CAPTURE_FORMATS:
+            raise ValueError(f"Unknown capture format {fmt!r}, expected one of {', '.join(CAPTURE_FORMATS)}")
+        if fmt == "video" and shutil.which("ffmpeg") is None:
+            print("Warning: ffmpeg not found, capturing raw RGB frames instead")
+            fmt = "raw"
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.format = fmt
+        self.fps = fps
+        self.captured = 0
+        self.written = 0
+        self.dropped = 0
+        self._pool_size = pool_size
+        self._slots: list[pygame.Surface] = []
+        self._size: tuple[int, int] | None = None
+        self._free: queue.Queue[int] = queue.Queue()
+        self._pending: queue.Queue[tuple[int, int] | None] = queue.Queue()
+        self._stream = None
+        self._encoder: subprocess.Popen | None = None
+        self._writer = threading.Thread(target=self._write_frames, name="frame-capture", daemon=True)
+        self._writer.start()
+
+    def capture(self, backend: RenderBackend) -> None:
+        """Grab the frame ``backend`` is about to present, or drop it if no slot is free."""
+        size = backend.frame_size
+        if self._size is None:
+            self._allocate(size)
+        elif size != self._size:
+            # The writer's output has a fixed frame size; frames after a
+            # resolution change are skipped rather than corrupting it.
+            self.dropped += 1
+            return
+        try:
+            slot = self._free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return
+        backend.grab_frame(self._slots[slot])
+        self._pending.put((self.captured, slot))
+        self.captured += 1
+
+    def close(self) -> None:
+        """Flush queued frames and finish the output files."""
+        self._pending.put(None)
+        self._writer.join()
+        if self._stream is not None:
+            self._stream.close()
+        if self._encoder is not None:
+            self._encoder.stdin.close()
+            self._encoder.wait()
+
+    def report(self) -> str:
+        return f"Captured {self.written} frames to {self.directory} ({self.dropped} dropped)"
+
+    def _allocate(self, size: tuple[int, int]) -> None:
+        self._size = size
+        self._slots = [pygame.Surface(size) for _ in range(self._pool_size)]
+        for slot in range(self._pool_size):
+            self._free.put(slot)
+        width, height = size
+        if self.format == "raw":
+            self._stream = open(self.directory / f"frames_{width}x{height}_{self.fps}fps.rgb", "wb")
+        elif self.format == "video":
+            self._encoder = subprocess.Popen(
+                [
+                    "ffmpeg", "-loglevel", "error", "-y",
+                    "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(self.fps), "-i", "-",
+                    "-c:v", "libx264", "-pix_fmt", "yuv420p", str(self.directory / "capture.mp4"),
+                ],
+                stdin=subprocess.PIPE,
+            )
+
+    def _write_frames(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            index, slot = item
+            surface = self._slots[slot]
+            try:
+                if self.format == "png":
+                    pygame.image.save(surface, str(self.directory / f"frame_{index:06d}.png"))
+                elif self._encoder is not None:
+                    self._encoder.stdin.write(pygame.image.tobytes(surface, "RGB"))
+                else:
+                    self._stream.write(pygame.image.tobytes(surface, "RGB"))
+                self.written += 1
+            except (OSError, pygame.error) as exc:
+                print(f"Warning: Could not write captured frame {index}: {exc}")
+            finally:
+                self._free.put(slot)
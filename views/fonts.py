@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
+from pathlib import Path
 
 import pygame
 
+FONT_CACHE_PATH = Path(".cache") / "fonts.json"
+
 
 @dataclass
 class FontBundle:
@@ -17,11 +21,50 @@ class FontBundle:
     small: pygame.font.Font
 
 
-def create_font_bundle() -> FontBundle:
-    """Instantiate the default font bundle used across the UI."""
+def create_font_bundle(font_name: str | None = None, cache_path: Path = FONT_CACHE_PATH) -> FontBundle:
+    """Instantiate the default font bundle used across the UI.
+
+    Without a ``font_name`` pygame's bundled font is loaded directly, which is
+    what ``SysFont(None, ...)`` ends up doing after an expensive system-wide font
+    scan. Named fonts are resolved through an on-disk cache for the same reason.
+    """
+    font_path = resolve_font_path(font_name, cache_path) if font_name else None
     return FontBundle(
-        default=pygame.font.SysFont(None, 36),
-        large=pygame.font.SysFont(None, 72),
-        medium=pygame.font.SysFont(None, 48),
-        small=pygame.font.SysFont(None, 24),
+        default=pygame.font.Font(font_path, 36),
+        large=pygame.font.Font(font_path, 72),
+        medium=pygame.font.Font(font_path, 48),
+        small=pygame.font.Font(font_path, 24),
     )
+
+
+def resolve_font_path(font_name: str, cache_path: Path = FONT_CACHE_PATH) -> str | None:
+    """Map a system font name to a file, scanning the system only on a cache miss."""
+    if Path(font_name).is_file():
+        return font_name
+
+    cache = _read_font_cache(cache_path)
+    cached = cache.get(font_name)
+    if cached and Path(cached).is_file():
+        return cached
+
+    font_path = pygame.font.match_font(font_name)
+    if font_path is None:
+        print(f"Warning: Font {font_name!r} not found, using the default font")
+        return None
+
+    cache[font_name] = font_path
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+    return font_path
+
+
+def _read_font_cache(cache_path: Path) -> dict[str, str]:
+    try:
+        with cache_path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
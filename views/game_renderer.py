@@ -4,67 +4,371 @@ from __future__ import annotations
 
 import pygame
 
+from core.events import EventBus, GameEvent, GameEventType, Subscription
 from core.game_controller import GameController
 from utils.config_loader import GameSettings
 from views.anniversary import AnniversaryView
 from views.fonts import FontBundle
+from views.camera import Camera
+from views.localization import Localizer
+from views.particles import ParticleSystem
+from views.quality import QUALITY_TIERS, QualityTier
+from views.sprites import COLORKEY, SpriteAtlas
+
+# Particle burst per gameplay event: (count, speed, lifetime in frames).
+_EFFECT_BURSTS = {
+    GameEventType.COIN_COLLECTED: (6, 1.5, 18.0),
+    GameEventType.POWER_PELLET_COLLECTED: (16, 3.0, 30.0),
+    GameEventType.ENEMY_EATEN: (24, 3.5, 36.0),
+    GameEventType.LEVEL_COMPLETE: (64, 5.0, 60.0),
+}
+
+
+# Maze chunks are square and this many tiles wide.
+_CHUNK_TILES = 8
 
 
 class GameRenderer:
-    """Render the gameplay scene and heads-up display."""
+    """Render the gameplay scene and heads-up display.
+
+    The maze may be larger than the window: a :class:`Camera` follows the
+    player, walls are pre-rendered into chunks that are built on first sight,
+    and coins and pellets are bucketed by chunk, so a frame only touches what
+    lies in view and its cost tracks the window size rather than the maze size.
+    """
 
     def __init__(self, settings: GameSettings, fonts: FontBundle):
         self._settings = settings
         self._fonts = fonts
-        self._anniversary_view = AnniversaryView(settings, fonts)
+        self.localizer = Localizer(settings.language)
+        self._anniversary_view = AnniversaryView(settings, fonts, self.localizer)
+        self.camera = Camera(settings)
+        self._atlas = SpriteAtlas(settings)
+        # Window-sized fill and decorations, rendered once per level.
+        self._backdrop: pygame.Surface | None = None
+        self._view: pygame.Surface | None = None
+        self._view_offset: tuple[int, int] | None = None
+        self._indexed_generation = -1
+        self._wall_buckets: dict[tuple[int, int], list] = {}
+        self._pickup_buckets: dict[tuple[int, int], list] = {}
+        self._chunks: dict[tuple[int, int], pygame.Surface] = {}
+        self.quality = QUALITY_TIERS[0]
+        self.particles = self._create_particles(settings)
+        self._effects_time: float | None = None
+        # HUD values as last announced on the controller's event bus.
+        self._events: EventBus | None = None
+        self._subscription: Subscription | None = None
+        self._score = 0
+        self._lives = 0
+        self._power_active = False
+        self.hud_version = 0
+        self._hud_blits: list[tuple[pygame.Surface, pygame.Rect]] | None = None
+        self._hud_drawn = (-1, -1)
+        # Reused every frame: ``[sprite, Rect]`` items handed to Surface.blits.
+        self._draw_list: list[list] = []
+        self._pickup_items: list[tuple[object, list]] = []
+        self._pickup_view: tuple[int, int, int] | None = None
+        self._mover_items: list[list] = []
+
+    @staticmethod
+    def _create_particles(settings: GameSettings) -> ParticleSystem:
+        palette = [settings.colors.primary, (255, 255, 0), settings.colors.text, *settings.enemy.colors, (128, 0, 128)]
+        return ParticleSystem(settings.effects.particle_cap, palette)
+
+    @property
+    def chunk_size(self) -> int:
+        return self._settings.grid_size * _CHUNK_TILES
+
+    def apply_settings(self, settings: GameSettings, changed: frozenset[str]) -> None:
+        """Adopt reloaded settings and drop caches that depend on them."""
+        self._settings = settings
+        self._anniversary_view.apply_settings(settings, changed)
+        self.camera.apply_settings(settings)
+        if "language" in changed:
+            self.localizer.set_language(settings.language)
+        if changed & {"colors", "layout", "language"}:
+            self._backdrop = None
+            self._indexed_generation = -1
+            self.hud_version += 1
+        if changed & {"colors", "enemy", "layout"}:
+            self._atlas.apply_settings(settings)
+        if changed & {"colors", "enemy", "effects"}:
+            self.particles = self._create_particles(settings)
+            self._scale_particles()
+
+    def apply_quality(self, tier: QualityTier) -> None:
+        """Switch to another cosmetic quality tier."""
+        if tier.decorations != self.quality.decorations:
+            self._backdrop = None
+        self.quality = tier
+        self._atlas.animate_pickups = tier.pickup_animation
+        self._scale_particles()
+        self.hud_version += 1
+
+    def _scale_particles(self) -> None:
+        self.particles.cap = int(self.particles.capacity * self.quality.particle_scale)
+
+    def attach(self, controller: GameController) -> None:
+        """Subscribe to ``controller``'s events, leaving any previous controller's bus."""
+        if controller.events is self._events:
+            return
+        self.detach()
+        handlers = {event_type: self._on_burst for event_type in _EFFECT_BURSTS}
+        handlers[GameEventType.SCORE_CHANGED] = self._on_score
+        handlers[GameEventType.LIVES_CHANGED] = self._on_lives
+        handlers[GameEventType.POWER_MODE_STARTED] = self._on_power
+        handlers[GameEventType.POWER_MODE_ENDED] = self._on_power
+        self._events = controller.events
+        self._subscription = controller.events.subscribe_all(handlers)
+        self._score = controller.player.score
+        self._lives = controller.player.lives
+        self._power_active = controller.power_mode.active
+        self.hud_version += 1
+
+    def detach(self) -> None:
+        if self._subscription is not None:
+            self._subscription.cancel()
+        self._subscription = None
+        self._events = None
+
+    def _on_burst(self, event: GameEvent) -> None:
+        if not self._settings.effects.particles:
+            return
+        count, speed, life = _EFFECT_BURSTS[event.type]
+        color = event.value if event.type is GameEventType.ENEMY_EATEN else None
+        half = self._settings.grid_size // 2
+        self.particles.emit(event.x + half, event.y + half, count, self.particles.color_index(color), speed, life)
+
+    def _on_score(self, event: GameEvent) -> None:
+        self._score = event.value
+        self.hud_version += 1
+
+    def _on_lives(self, event: GameEvent) -> None:
+        self._lives = event.value
+        self.hud_version += 1
+
+    def _on_power(self, event: GameEvent) -> None:
+        self._power_active = event.type is GameEventType.POWER_MODE_STARTED
+        self.hud_version += 1
+
+    def hud_key(self, controller: GameController) -> tuple:
+        """Changes exactly when the HUD would look different."""
+        return self.hud_version, self._power_seconds(controller)
+
+    def _power_seconds(self, controller: GameController) -> int:
+        return controller.power_mode.timer // 60 if self._power_active else -1
+
+    def update_effects(self, controller: GameController) -> None:
+        """Advance live particles; bursts are spawned by the event handlers.
+
+        Particles follow the controller's animation clock, so they freeze and
+        slow down together with every other cosmetic animation.
+        """
+        now = controller.animation_clock.time
+        elapsed = 0.0 if self._effects_time is None else now - self._effects_time
+        self._effects_time = now
+        if self._settings.effects.particles:
+            self.particles.update(elapsed)
+
+    def begin_scene(self, controller: GameController) -> None:
+        """Re-index a newly built level and move the camera onto the player."""
+        self.attach(controller)
+        if self._indexed_generation != controller.level_generation:
+            self._index_level(controller)
+        self.camera.follow(controller.player.x, controller.player.y)
 
     def draw_scene(self, surface: pygame.Surface, controller: GameController) -> None:
-        surface.fill(self._settings.colors.background)
-        self._anniversary_view.draw_decorations(surface)
+        self.begin_scene(controller)
+        surface.blit(self._static_view(surface), (0, 0))
 
-        for wall in controller.game_state.walls:
-            wall.draw(surface)
+        surface.blits(self._build_draw_list(controller), doreturn=False)
+
+        self.update_effects(controller)
+        if self._settings.effects.particles:
+            self.particles.draw(surface, self.camera.offset)
+        self.draw_hud(surface, controller)
+
+    def _static_view(self, surface: pygame.Surface) -> pygame.Surface:
+        """Backdrop and walls as seen from the camera, recomposed only when it moves."""
+        if self._backdrop is None:
+            self._backdrop = self.render_backdrop(surface)
+            self._view = None
+        if self._view is None or self._view_offset != self.camera.offset:
+            if self._view is None:
+                self._view = pygame.Surface(surface.get_size(), 0, surface)
+            self._view.blit(self._backdrop, (0, 0))
+            self._view.blits([(self.wall_chunk(key), position) for key, position in self.visible_chunks()], doreturn=False)
+            self._view_offset = self.camera.offset
+        return self._view
+
+    def render_backdrop(self, surface: pygame.Surface) -> pygame.Surface:
+        """Render the window-sized fill and decorations behind the maze."""
+        backdrop = pygame.Surface(surface.get_size(), 0, surface)
+        backdrop.fill(self._settings.colors.background)
+        if self.quality.decorations:
+            self._anniversary_view.draw_decorations(backdrop)
+        return backdrop
 
-        for coin in controller.game_state.coins:
-            coin.draw(surface)
+    def visible_chunks(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """``(chunk_key, window_position)`` for every chunk in view that holds walls."""
+        return [(key, position) for key, position in self._chunks_in_view() if key in self._wall_buckets]
 
-        for pellet in controller.game_state.power_pellets:
-            pellet.draw(surface)
+    def _chunks_in_view(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        size = self.chunk_size
+        camera_x, camera_y = self.camera.offset
+        first_col, first_row = max(0, camera_x // size), max(0, camera_y // size)
+        last_col = min((self._settings.maze_width - 1) // size, (camera_x + self._settings.width - 1) // size)
+        last_row = min((self._settings.maze_height - 1) // size, (camera_y + self._settings.height - 1) // size)
+        return [
+            ((col, row), (col * size - camera_x, row * size - camera_y))
+            for row in range(first_row, last_row + 1)
+            for col in range(first_col, last_col + 1)
+        ]
 
+    def wall_chunk(self, key: tuple[int, int]) -> pygame.Surface:
+        """The pre-rendered walls of one chunk, drawing it on first use."""
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            size = self.chunk_size
+            chunk = pygame.Surface((size, size))
+            chunk.fill(COLORKEY)
+            origin = (key[0] * size, key[1] * size)
+            for wall in self._wall_buckets[key]:
+                wall.draw(chunk, origin)
+            chunk.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            self._chunks[key] = chunk
+        return chunk
+
+    def _build_draw_list(self, controller: GameController) -> list[list]:
+        """Sprites in view with their window positions, reusing last frame's items.
+
+        Same contents and order as :meth:`visible_entities`, but pickup items
+        are only rebuilt when the view moves and the player and enemies reuse
+        pooled items, so a steady frame allocates nothing here.
+        """
+        camera = self.camera
+        camera_x, camera_y = camera.x, camera.y
+        view = self._pickup_view
+        if view is None or view[0] != camera_x or view[1] != camera_y or view[2] != self._indexed_generation:
+            buckets = self._pickup_buckets
+            self._pickup_items = [
+                (pickup, [None, pygame.Rect(pickup.x - camera_x, pickup.y - camera_y, 0, 0)])
+                for key, _ in self._chunks_in_view()
+                for pickup in buckets.get(key, ())
+            ]
+            self._pickup_view = (camera_x, camera_y, self._indexed_generation)
+
+        sprite = self._atlas.sprite
+        draw_list = self._draw_list
+        draw_list.clear()
+        for pickup, item in self._pickup_items:
+            if not pickup.collected:
+                item[0] = sprite(pickup)
+                draw_list.append(item)
+
+        pool = self._mover_items
+        used = 0
+        grid = self._settings.grid_size
+        visible = camera.visible
+        player = controller.player
+        for entity in controller.game_state.enemies:
+            if entity is player or visible(entity.x, entity.y, grid, grid):
+                if used == len(pool):
+                    pool.append([None, pygame.Rect(0, 0, 0, 0)])
+                item = pool[used]
+                used += 1
+                item[0] = sprite(entity)
+                rect = item[1]
+                rect.x = int(entity.x) - camera_x
+                rect.y = int(entity.y) - camera_y
+                draw_list.append(item)
+        if used == len(pool):
+            pool.append([None, pygame.Rect(0, 0, 0, 0)])
+        item = pool[used]
+        item[0] = sprite(player)
+        item[1].x = int(player.x) - camera_x
+        item[1].y = int(player.y) - camera_y
+        draw_list.append(item)
+        return draw_list
+
+    def visible_entities(self, controller: GameController) -> list:
+        """Uncollected pickups, enemies and the player in view, in drawing order."""
+        entities = []
+        buckets = self._pickup_buckets
+        for key, _ in self._chunks_in_view():
+            for pickup in buckets.get(key, ()):
+                if not pickup.collected:
+                    entities.append(pickup)
+        grid = self._settings.grid_size
+        visible = self.camera.visible
         for enemy in controller.game_state.enemies:
-            enemy.draw(surface)
+            if visible(enemy.x, enemy.y, grid, grid):
+                entities.append(enemy)
+        entities.append(controller.player)
+        return entities
 
-        controller.player.draw(surface)
-        self._draw_ui(surface, controller)
+    def _index_level(self, controller: GameController) -> None:
+        """Bucket walls and pickups by chunk and forget the previous level's chunks."""
+        size = self.chunk_size
+        walls: dict[tuple[int, int], list] = {}
+        for wall in controller.game_state.walls:
+            for row in range(wall.y // size, (wall.y + wall.height - 1) // size + 1):
+                for col in range(wall.x // size, (wall.x + wall.width - 1) // size + 1):
+                    walls.setdefault((col, row), []).append(wall)
+        pickups: dict[tuple[int, int], list] = {}
+        for pickup in (*controller.game_state.coins, *controller.game_state.power_pellets):
+            pickups.setdefault((pickup.x // size, pickup.y // size), []).append(pickup)
+        self._wall_buckets = walls
+        self._pickup_buckets = pickups
+        self._chunks = {}
+        # The cached view is only keyed by camera offset; dropping the backdrop
+        # recomposes it with the new level's walls.
+        self._backdrop = None
+        self._indexed_generation = controller.level_generation
 
     def draw_start_screen(self, surface: pygame.Surface) -> None:
         self._anniversary_view.draw_start_screen(surface)
 
     def draw_game_over(self, surface: pygame.Surface) -> None:
-        text = self._fonts.default.render("GAME OVER! Press R to restart", True, (255, 0, 0))
+        text = self.localizer.render(self._fonts.default, "game_over", (255, 0, 0))
         rect = text.get_rect(center=(self._settings.width // 2, self._settings.height // 2))
         surface.blit(text, rect)
 
     def draw_level_complete(self, surface: pygame.Surface) -> None:
-        text = self._fonts.default.render("LEVEL COMPLETE! Press N for next level", True, self._settings.colors.primary)
+        text = self.localizer.render(self._fonts.default, "level_complete", self._settings.colors.primary)
         rect = text.get_rect(center=(self._settings.width // 2, self._settings.height // 2))
         surface.blit(text, rect)
 
-    def _draw_ui(self, surface: pygame.Surface, controller: GameController) -> None:
-        score_text = self._fonts.default.render(f"Score: {controller.player.score}", True, self._settings.colors.text)
-        surface.blit(score_text, (10, 10))
+    def draw_hud(self, surface: pygame.Surface, controller: GameController) -> None:
+        # HUD values come from events rather than the controller; the layout is
+        # rebuilt only when one of them (or the power countdown) changes.
+        seconds = self._power_seconds(controller)
+        if self._hud_blits is None or self._hud_drawn[0] != self.hud_version or self._hud_drawn[1] != seconds:
+            self._hud_blits = self._layout_hud(seconds)
+            self._hud_drawn = (self.hud_version, seconds)
+        surface.blits(self._hud_blits, doreturn=False)
+
+    def _layout_hud(self, seconds: int) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        # Every string comes from the localizer's caches.
+        render = self.localizer.render
+        text_color = self._settings.colors.text
+        blits = []
+        score_text = render(self._fonts.default, "score", text_color, score=self._score)
+        blits.append((score_text, score_text.get_rect(topleft=(10, 10))))
+
+        # Right-aligned so longer translations stay inside the window.
+        lives_text = render(self._fonts.default, "lives", text_color, lives=self._lives)
+        blits.append((lives_text, lives_text.get_rect(topright=(self._settings.width - 10, 10))))
 
-        lives_text = self._fonts.default.render(f"Lives: {controller.player.lives}", True, self._settings.colors.text)
-        surface.blit(lives_text, (self._settings.width - 120, 10))
+        if self.quality is not QUALITY_TIERS[0]:
+            tier = self.localizer.text(f"tier_{self.quality.name}")
+            quality_text = render(self._fonts.small, "quality", text_color, tier=tier)
+            blits.append((quality_text, quality_text.get_rect(midtop=(self._settings.width // 2, 12))))
 
-        if controller.power_mode.active:
-            power_text = self._fonts.small.render(
-                f"POWER MODE: {controller.power_mode.timer // 60}s",
-                True,
-                self._settings.colors.primary,
-            )
-            surface.blit(power_text, (self._settings.width // 2 - 80, self._settings.height - 70))
+        if seconds >= 0:
+            power_text = render(self._fonts.small, "power_mode", self._settings.colors.primary, seconds=seconds)
+            blits.append((power_text, power_text.get_rect(midtop=(self._settings.width // 2, self._settings.height - 70))))
 
-        title_text = self._fonts.large.render("PAC-IRANCELL", True, self._settings.colors.primary)
-        title_rect = title_text.get_rect(center=(self._settings.width // 2, self._settings.height - 40))
-        surface.blit(title_text, title_rect)
+        title_text = render(self._fonts.large, "title", self._settings.colors.primary)
+        blits.append((title_text, title_text.get_rect(center=(self._settings.width // 2, self._settings.height - 40))))
+        return blits
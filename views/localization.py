@@ -0,0 +1,138 @@
+"""UI string catalogs with pre-shaped text and cached renders."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import pygame
+
+try:
+    # Optional: needed to display right-to-left languages such as Persian.
+    import arabic_reshaper
+    from bidi.algorithm import get_display
+except ImportError:
+    arabic_reshaper = None
+    get_display = None
+
+I18N_DIR = Path("assets/i18n")
+FALLBACK_LANGUAGE = "en"
+
+_RTL_CHARACTERS = re.compile("[\u0590-\u08ff\ufb1d-\ufdff\ufe70-\ufeff]")
+
+# The missing-shaper warning is printed once per process, not on every switch.
+_warned_unshaped = False
+
+
+class Localizer:
+    """Translate catalog keys and render them, shaping right-to-left text once.
+
+    Catalogs are ``assets/i18n/<language>.json``; keys missing from a catalog
+    fall back to English. Static strings are shaped (Arabic-script joining
+    and bidi reordering) when the language is loaded, and their renders are
+    kept for as long as it stays active. Strings built from a template and
+    values, such as the score line, are shaped on first use and their renders
+    kept in an LRU of ``cache_size`` entries, so a value seen again costs a
+    dictionary lookup. Switching language clears both caches.
+    """
+
+    def __init__(self, language: str = FALLBACK_LANGUAGE, catalog_dir: Path = I18N_DIR, cache_size: int = 256):
+        self._catalog_dir = catalog_dir
+        self._cache_size = cache_size
+        self._fallback = self._read_catalog(FALLBACK_LANGUAGE) or {}
+        self.language: str | None = None
+        self.set_language(language)
+
+    def set_language(self, language: str) -> None:
+        """Load ``language`` and rebuild the shaped strings; a no-op if it is active."""
+        if language == self.language:
+            return
+        catalog = self._read_catalog(language)
+        if catalog is None:
+            print(f"Warning: No catalog for language {language!r}, using {FALLBACK_LANGUAGE!r}")
+            language, catalog = FALLBACK_LANGUAGE, self._fallback
+        self.language = language
+        self.rtl = catalog.get("direction") == "rtl"
+        if self.rtl and arabic_reshaper is None:
+            _warn_unshaped()
+        digits = catalog.get("digits", "0123456789")
+        self._digits = str.maketrans("0123456789", digits) if len(digits) == 10 else None
+        self._templates: dict[str, str] = {**self._fallback.get("strings", {}), **catalog.get("strings", {})}
+        self._shaped = {key: self.shape(template) for key, template in self._templates.items() if "{" not in template}
+        self._static: dict[tuple, pygame.Surface] = {}
+        self._dynamic: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def _read_catalog(self, language: str) -> dict[str, Any] | None:
+        try:
+            with (self._catalog_dir / f"{language}.json").open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except OSError:
+            return None
+        except ValueError as exc:
+            print(f"Warning: Invalid catalog for language {language!r}: {exc}")
+            return None
+        return data if isinstance(data, dict) else None
+
+    def shape(self, text: str) -> str:
+        """Return ``text`` in display order with joined letter forms."""
+        if arabic_reshaper is None or not _RTL_CHARACTERS.search(text):
+            return text
+        return get_display(arabic_reshaper.reshape(text))
+
+    def text(self, key: str, **values: Any) -> str:
+        """The shaped translation of ``key`` with ``values`` filled in."""
+        if not values:
+            shaped = self._shaped.get(key)
+            if shaped is not None:
+                return shaped
+        template = self._templates.get(key, key)
+        if values:
+            template = template.format(**{name: self._localize(value) for name, value in values.items()})
+        return self.shape(template)
+
+    def _localize(self, value: Any) -> str:
+        text = str(value)
+        return text.translate(self._digits) if self._digits else text
+
+    def render(self, font: pygame.font.Font, key: str, color, **values: Any) -> pygame.Surface:
+        """Render a translated string, reusing an earlier render of the same text."""
+        if not values:
+            cache_key = (font, key, color)
+            surface = self._static.get(cache_key)
+            if surface is None:
+                surface = font.render(self.text(key), True, color)
+                self._static[cache_key] = surface
+            return surface
+        return self._cached(font, key, color, tuple(values.items()))
+
+    def render_text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Render free text that is not in the catalog, such as the configured slogan."""
+        return self._cached(font, None, color, text)
+
+    def _cached(self, font: pygame.font.Font, key: str | None, color, values) -> pygame.Surface:
+        """LRU lookup; ``values`` is the template values, or the free text when ``key`` is None."""
+        cache_key = (font, key, color, values)
+        cache = self._dynamic
+        surface = cache.get(cache_key)
+        if surface is not None:
+            cache.move_to_end(cache_key)
+            return surface
+        text = self.shape(values) if key is None else self.text(key, **dict(values))
+        surface = font.render(text, True, color)
+        cache[cache_key] = surface
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return surface
+
+
+def _warn_unshaped() -> None:
+    global _warned_unshaped
+    if not _warned_unshaped:
+        _warned_unshaped = True
+        print(
+            "Warning: arabic-reshaper and python-bidi are not installed; right-to-left text will not be shaped "
+            "(see the optional section of requirements.txt)"
+        )
@@ -0,0 +1,199 @@
+"""Pooled particle effects backed by preallocated NumPy arrays."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pygame
+
+# Number of pre-rendered fade steps per colour.
+_FADE_LEVELS = 4
+
+
+class ParticleSystem:
+    """Fixed-capacity particle pool updated in bulk.
+
+    Live particles are packed at the front of the arrays, so updates are a few
+    vectorised operations and no Python object exists per particle. ``cap``
+    limits how many may be alive at once and can be lowered at runtime; bursts
+    that do not fit are truncated rather than growing the pool. Intermediate
+    results go to preallocated scratch arrays (``out=``), so a steady frame
+    allocates no array memory here.
+    """
+
+    def __init__(self, capacity: int, palette: Sequence[tuple[int, int, int]], particle_size: int = 4, seed: int | None = None):
+        self.capacity = capacity
+        self.cap = capacity
+        self.dropped = 0
+        self._palette = list(palette)
+        self._count = 0
+        self._x = np.zeros(capacity, dtype=np.float32)
+        self._y = np.zeros(capacity, dtype=np.float32)
+        self._vx = np.zeros(capacity, dtype=np.float32)
+        self._vy = np.zeros(capacity, dtype=np.float32)
+        self._life = np.zeros(capacity, dtype=np.float32)
+        self._max_life = np.ones(capacity, dtype=np.float32)
+        self._color = np.zeros(capacity, dtype=np.uint8)
+        self._rng = np.random.default_rng(seed)
+        self.sprites = self._build_sprites(particle_size)
+        self._half = self.sprites[0].get_width() // 2
+        # Scratch space for update() and prepare_draw(). The packed arrays have
+        # one spare slot at the end that dead particles are moved into.
+        self._scratch = np.zeros(capacity, dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._slots = np.zeros(capacity, dtype=np.intp)
+        self._packed = np.zeros(capacity + 1, dtype=np.float32)
+        self._packed_color = np.zeros(capacity + 1, dtype=np.uint8)
+        self._fade = np.zeros(capacity, dtype=np.float32)
+        self._sprite_index = np.zeros(capacity, dtype=np.int32)
+        self._draw_x = np.zeros(capacity, dtype=np.int32)
+        self._draw_y = np.zeros(capacity, dtype=np.int32)
+        # Filled by prepare_draw(); items past its return value are stale.
+        self.sprite_index = memoryview(self._sprite_index)
+        self.draw_x = memoryview(self._draw_x)
+        self.draw_y = memoryview(self._draw_y)
+        self._blit_items: list[list] = []
+        self._blits: list[list] = []
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def color_index(self, color: tuple[int, int, int] | None) -> int:
+        """Palette slot for ``color``, falling back to the first entry."""
+        if color is None:
+            return 0
+        try:
+            return self._palette.index(tuple(color))
+        except ValueError:
+            return 0
+
+    def clear(self) -> None:
+        self._count = 0
+        self._life.fill(0)
+
+    def emit(self, x: float, y: float, count: int, color_index: int = 0, speed: float = 2.0, life: float = 30.0) -> None:
+        """Spawn a radial burst of up to ``count`` particles centred on ``(x, y)``."""
+        room = max(0, min(self.cap, self.capacity) - self._count)
+        spawned = min(count, room)
+        self.dropped += count - spawned
+        if spawned <= 0:
+            return
+        start, end = self._count, self._count + spawned
+        angles = self._rng.uniform(0.0, 2 * np.pi, spawned)
+        speeds = self._rng.uniform(0.3 * speed, speed, spawned)
+        self._x[start:end] = x
+        self._y[start:end] = y
+        self._vx[start:end] = np.cos(angles) * speeds
+        self._vy[start:end] = np.sin(angles) * speeds
+        lifetimes = self._rng.uniform(0.6 * life, life, spawned)
+        self._life[start:end] = lifetimes
+        self._max_life[start:end] = lifetimes
+        self._color[start:end] = color_index
+        self._count = end
+
+    def update(self, dt: float = 1.0, drag: float = 0.92, gravity: float = 0.05) -> None:
+        """Advance every live particle by ``dt`` frames and compact out dead ones."""
+        count = self._count
+        if not count or dt <= 0:
+            return
+        # The whole pool is stepped: slicing out the live part would allocate a
+        # view per array, and slots past the live count stay dead (life <= 0).
+        step = self._scratch
+        self._x += np.multiply(self._vx, dt, out=step)
+        self._y += np.multiply(self._vy, dt, out=step)
+        damping = drag ** dt
+        self._vx *= damping
+        self._vy *= damping
+        self._vy += gravity * dt
+        self._life -= dt
+
+        alive = np.greater(self._life, 0, out=self._alive)
+        survivors = int(np.count_nonzero(alive))
+        if survivors != count:
+            # Each survivor's new slot is the number of survivors before it;
+            # dead particles all go to the spare slot past the end.
+            slots = self._slots
+            np.copyto(slots, alive)
+            np.add.accumulate(slots, out=slots)
+            slots -= 1
+            np.copyto(slots, self.capacity, where=np.logical_not(alive, out=alive))
+            for array, packed in (
+                (self._x, self._packed),
+                (self._y, self._packed),
+                (self._vx, self._packed),
+                (self._vy, self._packed),
+                (self._life, self._packed),
+                (self._max_life, self._packed),
+                (self._color, self._packed_color),
+            ):
+                packed[slots] = array
+                array[:] = packed[:-1]
+            self._life[survivors:] = 0
+            self._max_life[survivors:] = 1
+            self._count = survivors
+        if self._count > self.cap:
+            self._count = max(0, self.cap)
+            self._life[self._count:] = 0
+
+    def prepare_draw(self, offset: tuple[int, int] = (0, 0)) -> int:
+        """Fill :attr:`sprite_index`, :attr:`draw_x` and :attr:`draw_y` and return the live count.
+
+        Entry ``i`` of each is the sprite and top-left window position of
+        live particle ``i``.
+        """
+        count = self._count
+        if not count:
+            return 0
+        # Like update(), this covers the whole pool; entries past ``count`` are junk.
+        # Everything stays float32 until the final casts, because mixed-type
+        # ufuncs allocate conversion buffers.
+        fade = np.divide(self._life, self._max_life, out=self._fade)
+        fade *= _FADE_LEVELS
+        np.minimum(fade, _FADE_LEVELS - 1, out=fade)
+        np.floor(fade, out=fade)
+        shade = self._scratch
+        np.copyto(shade, self._color)
+        shade *= _FADE_LEVELS
+        shade += fade
+        np.copyto(self._sprite_index, shade, casting="unsafe")
+        np.copyto(self._draw_x, self._x, casting="unsafe")
+        self._draw_x -= offset[0] + self._half
+        np.copyto(self._draw_y, self._y, casting="unsafe")
+        self._draw_y -= offset[1] + self._half
+        return count
+
+    def draw(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0)) -> None:
+        count = self.prepare_draw(offset)
+        blits = self._blits
+        del blits[count:]
+        if not count:
+            return
+        # Reuse one [sprite, Rect] item per particle slot instead of building tuples.
+        items = self._blit_items
+        while len(blits) < count:
+            if len(items) == len(blits):
+                items.append([self.sprites[0], pygame.Rect(0, 0, 0, 0)])
+            blits.append(items[len(blits)])
+        sprites, sprite_index, draw_x, draw_y = self.sprites, self.sprite_index, self.draw_x, self.draw_y
+        for i in range(count):
+            item = blits[i]
+            item[0] = sprites[sprite_index[i]]
+            rect = item[1]
+            rect.x = draw_x[i]
+            rect.y = draw_y[i]
+        if hasattr(surface, "fblits"):
+            surface.fblits(blits)
+        else:
+            surface.blits(blits, doreturn=False)
+
+    def _build_sprites(self, size: int) -> list[pygame.Surface]:
+        sprites = []
+        for color in self._palette:
+            for level in range(_FADE_LEVELS):
+                sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+                alpha = 255 * (level + 1) // _FADE_LEVELS
+                pygame.draw.circle(sprite, (*color, alpha), (size // 2, size // 2), size // 2)
+                sprites.append(sprite)
+        return sprites
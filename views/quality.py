@@ -0,0 +1,84 @@
+"""Cosmetic quality tiers and the governor that picks one from frame times."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+
+from utils.config_loader import QualitySettings
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    """Which optional cosmetics are drawn at one quality level."""
+
+    name: str
+    pickup_animation: bool
+    decorations: bool
+    particle_scale: float
+
+
+# Ordered from most to least expensive.
+QUALITY_TIERS = (
+    QualityTier("high", pickup_animation=True, decorations=True, particle_scale=1.0),
+    QualityTier("medium", pickup_animation=True, decorations=True, particle_scale=0.5),
+    QualityTier("low", pickup_animation=False, decorations=False, particle_scale=0.25),
+    QualityTier("minimal", pickup_animation=False, decorations=False, particle_scale=0.0),
+)
+
+
+def tier_index(name: str) -> int:
+    for index, tier in enumerate(QUALITY_TIERS):
+        if tier.name == name:
+            return index
+    print(f"Warning: Unknown quality tier {name!r}, using {QUALITY_TIERS[0].name!r}")
+    return 0
+
+
+class QualityGovernor:
+    """Step cosmetic quality down when frames run over budget and back up with headroom.
+
+    Frame times are the work done per frame (``Clock.get_rawtime``), not the
+    time spent sleeping in ``Clock.tick``. The tier drops one step once the
+    average over ``window_frames`` exceeds the frame budget, and rises one step
+    only after twice as many frames averaged below ``headroom`` times the budget.
+    The window restarts after every change, so a new tier is judged on its own
+    frames and the governor cannot flip-flop from one frame to the next.
+    """
+
+    def __init__(self, settings: QualitySettings, fps: int):
+        self._samples: deque[float] = deque()
+        self.configure(settings, fps)
+
+    def configure(self, settings: QualitySettings, fps: int) -> None:
+        """Apply (re)loaded settings, restarting from the configured tier."""
+        self._settings = settings
+        self._budget_ms = 1000 / max(1, fps)
+        self._index = tier_index(settings.tier)
+        self._samples = deque(maxlen=max(1, settings.window_frames) * 2)
+
+    @property
+    def tier(self) -> QualityTier:
+        return QUALITY_TIERS[self._index]
+
+    def record(self, frame_ms: float) -> bool:
+        """Add one frame's work time; return whether the tier changed."""
+        if not self._settings.adaptive:
+            return False
+        samples = self._samples
+        samples.append(frame_ms)
+        window = max(1, self._settings.window_frames)
+        if len(samples) >= window and self._index < len(QUALITY_TIERS) - 1:
+            recent = sum(islice(samples, len(samples) - window, None)) / window
+            if recent > self._budget_ms:
+                return self._step(1)
+        if len(samples) == samples.maxlen and self._index > 0:
+            if sum(samples) / len(samples) < self._budget_ms * self._settings.headroom:
+                return self._step(-1)
+        return False
+
+    def _step(self, direction: int) -> bool:
+        self._index += direction
+        self._samples.clear()
+        return True
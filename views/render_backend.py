@@ -0,0 +1,144 @@
+"""Presentation backends that own the window and drive a renderer."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+import pygame
+
+from core.game_controller import GameController
+from utils.config_loader import GameSettings
+from views.fonts import FontBundle
+from views.game_renderer import GameRenderer
+from views.quality import QualityTier
+
+
+class RenderBackend(ABC):
+    """Common interface the main loop uses regardless of how frames are drawn."""
+
+    name = "abstract"
+
+    @abstractmethod
+    def draw_start_screen(self) -> None:
+        """Draw the start screen into the next frame."""
+
+    @abstractmethod
+    def draw_scene(self, controller: GameController) -> None:
+        """Draw the gameplay scene and HUD into the next frame."""
+
+    @abstractmethod
+    def draw_game_over(self) -> None:
+        """Overlay the game over banner."""
+
+    @abstractmethod
+    def draw_level_complete(self) -> None:
+        """Overlay the level complete banner."""
+
+    @abstractmethod
+    def attach(self, controller: GameController) -> None:
+        """Subscribe to the controller's events; call before its first update."""
+
+    @abstractmethod
+    def detach(self) -> None:
+        """Unsubscribe, e.g. before the backend is replaced."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the window; call after :meth:`detach` and before creating a replacement."""
+
+    @abstractmethod
+    def present(self) -> None:
+        """Show the finished frame."""
+
+    @property
+    @abstractmethod
+    def frame_size(self) -> tuple[int, int]:
+        """Pixel size of the frames :meth:`grab_frame` produces."""
+
+    @abstractmethod
+    def grab_frame(self, target: pygame.Surface) -> None:
+        """Copy the finished, not yet presented frame into ``target``."""
+
+    @abstractmethod
+    def apply_settings(self, settings: GameSettings, changed: frozenset[str]) -> None:
+        """Adopt hot-reloaded settings."""
+
+    @abstractmethod
+    def apply_quality(self, tier: QualityTier) -> None:
+        """Switch cosmetic quality, e.g. when the governor changes tier."""
+
+
+class SoftwareBackend(RenderBackend):
+    """Draw with ``pygame.draw`` onto the display surface and flip it."""
+
+    name = "software"
+
+    def __init__(self, settings: GameSettings, fonts: FontBundle, display_index: int = 0):
+        self._settings = settings
+        self._display_index = display_index
+        self.screen = self._open_display(settings, display_index)
+        self.renderer = GameRenderer(settings, fonts)
+
+    @staticmethod
+    def _open_display(settings: GameSettings, display_index: int = 0) -> pygame.Surface:
+        flags = pygame.FULLSCREEN | pygame.SCALED if settings.display.fullscreen else 0
+        screen = pygame.display.set_mode((settings.width, settings.height), flags, display=display_index)
+        pygame.display.set_caption(settings.title)
+        return screen
+
+    def draw_start_screen(self) -> None:
+        self.renderer.draw_start_screen(self.screen)
+
+    def draw_scene(self, controller: GameController) -> None:
+        self.renderer.draw_scene(self.screen, controller)
+
+    def draw_game_over(self) -> None:
+        self.renderer.draw_game_over(self.screen)
+
+    def draw_level_complete(self) -> None:
+        self.renderer.draw_level_complete(self.screen)
+
+    def attach(self, controller: GameController) -> None:
+        self.renderer.attach(controller)
+
+    def detach(self) -> None:
+        self.renderer.detach()
+
+    def close(self) -> None:
+        # The display module owns the window; restarting it closes the window
+        # but leaves the module ready for whichever backend comes next.
+        pygame.display.quit()
+        pygame.display.init()
+
+    def present(self) -> None:
+        pygame.display.flip()
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        return self.screen.get_size()
+
+    def grab_frame(self, target: pygame.Surface) -> None:
+        target.blit(self.screen, (0, 0))
+
+    def apply_settings(self, settings: GameSettings, changed: frozenset[str]) -> None:
+        self._settings = settings
+        if changed & {"layout", "display"}:
+            self.screen = self._open_display(settings, self._display_index)
+        elif "title" in changed:
+            pygame.display.set_caption(settings.title)
+        self.renderer.apply_settings(settings, changed)
+
+    def apply_quality(self, tier: QualityTier) -> None:
+        self.renderer.apply_quality(tier)
+
+
+def create_backend(settings: GameSettings, fonts: FontBundle, display_index: int = 0) -> RenderBackend:
+    """Build the configured backend on ``display_index``, falling back to software rendering."""
+    if settings.display.backend == "texture":
+        try:
+            from views.texture_renderer import TextureBackend
+
+            return TextureBackend(settings, fonts, display_index)
+        except (ImportError, RuntimeError) as exc:
+            print(f"Warning: Texture renderer unavailable ({exc}), using software rendering")
+    return SoftwareBackend(settings, fonts, display_index)
@@ -0,0 +1,92 @@
+"""Pre-rendered entity sprites keyed by visual state."""
+
+from __future__ import annotations
+
+import copy
+from typing import Hashable
+
+import pygame
+
+from core.entities import Coin, Enemy, Player, PowerPellet
+from utils.config_loader import GameSettings
+
+# Transparent colour of baked sprites and wall chunks; chosen so no configured
+# colour collides.
+COLORKEY = (1, 0, 1)
+
+# Pickup keys are looked up for every visible pickup each frame; sharing the
+# tuples keeps that lookup allocation free.
+_COIN_KEYS = (("coin", 0), ("coin", 1))
+_PELLET_KEYS = (("pellet", 0), ("pellet", 1), ("pellet", 2))
+_COIN_STILL = ("coin", "still")
+_PELLET_STILL = ("pellet", "still")
+
+
+class SpriteAtlas:
+    """Bake each distinct entity appearance once into a grid-sized surface.
+
+    Entities keep drawing themselves with ``pygame.draw``; the atlas simply
+    replays that drawing onto an off-screen tile the first time a visual state
+    is seen, so renderers can blit (or upload) the result afterwards.
+    """
+
+    def __init__(self, settings: GameSettings):
+        self._settings = settings
+        self._sprites: dict[Hashable, pygame.Surface] = {}
+        # When false, coins and pellets use one still frame instead of pulsing.
+        self.animate_pickups = True
+
+    def apply_settings(self, settings: GameSettings) -> None:
+        self._settings = settings
+        self.clear()
+
+    def clear(self) -> None:
+        self._sprites.clear()
+
+    def sprite_key(self, entity) -> Hashable:
+        """Return a key that changes exactly when the entity's appearance does."""
+        if isinstance(entity, Coin):
+            return _COIN_KEYS[entity.animation_counter % 4 // 2] if self.animate_pickups else _COIN_STILL
+        if isinstance(entity, PowerPellet):
+            return _PELLET_KEYS[entity.animation_counter % 5 // 2] if self.animate_pickups else _PELLET_STILL
+        if isinstance(entity, Player):
+            return ("player", entity.direction, entity.mouth_angle)
+        if isinstance(entity, Enemy):
+            if entity.frozen:
+                return ("enemy", "frozen")
+            if entity.frightened:
+                return ("enemy", "frightened")
+            return ("enemy", "normal", entity.color)
+        raise TypeError(f"No sprite for {type(entity).__name__}")
+
+    def sprite_for(self, entity) -> tuple[Hashable, pygame.Surface]:
+        key = self.sprite_key(entity)
+        return key, self._sprite(key, entity)
+
+    def sprite(self, entity) -> pygame.Surface:
+        """The baked surface for ``entity``'s current appearance."""
+        return self._sprite(self.sprite_key(entity), entity)
+
+    def _sprite(self, key: Hashable, entity) -> pygame.Surface:
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._bake(entity)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _bake(self, entity) -> pygame.Surface:
+        grid = self._settings.grid_size
+        # Entities draw opaque shapes only, so a colour key is enough and its
+        # run-length encoded blits are much cheaper than per-pixel alpha.
+        sprite = pygame.Surface((grid, grid))
+        sprite.fill(COLORKEY)
+        if isinstance(entity, (Coin, PowerPellet)) and not self.animate_pickups:
+            # A fresh pickup on its own clock draws the first animation frame.
+            stamp = type(entity)(self._settings, 0, 0)
+        else:
+            stamp = copy.copy(entity)
+            stamp.x = 0
+            stamp.y = 0
+        stamp.draw(sprite)
+        sprite.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return sprite
@@ -0,0 +1,226 @@
+"""GPU composited renderer built on ``pygame._sdl2.video``."""
+
+from __future__ import annotations
+
+import os
+from typing import Hashable
+
+import pygame
+from pygame._sdl2 import video
+
+from core.game_controller import GameController
+from utils.config_loader import GameSettings
+from views.fonts import FontBundle
+from views.game_renderer import GameRenderer
+from views.quality import QualityTier
+from views.render_backend import RenderBackend
+from views.sprites import SpriteAtlas
+
+
+class TextureBackend(RenderBackend):
+    """Upload the maze and sprites once and let the SDL renderer composite them.
+
+    The maze backdrop, every baked sprite and the HUD live in GPU textures; a
+    gameplay frame only issues texture copies. The logical frame is scaled by
+    the largest integer factor that fits the window and centred in it.
+
+    Raises ``RuntimeError`` when no hardware accelerated driver is available so
+    callers can fall back to :class:`views.render_backend.SoftwareBackend`.
+    """
+
+    name = "texture"
+
+    def __init__(self, settings: GameSettings, fonts: FontBundle, display_index: int = 0):
+        # Nearest-neighbour sampling keeps integer-scaled pixel art crisp.
+        os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "0")
+        self._settings = settings
+        self._display_index = display_index
+        self._scene = GameRenderer(settings, fonts)
+        self._atlas = SpriteAtlas(settings)
+        self._window = video.Window(
+            settings.title,
+            size=self._window_size(settings, display_index),
+            position=self._window_position(display_index),
+        )
+        if settings.display.fullscreen:
+            self._window.set_fullscreen(desktop=True)
+        try:
+            self._renderer = video.Renderer(self._window, accelerated=1)
+        except RuntimeError:
+            # pygame.error and pygame._sdl2's own error both derive from RuntimeError.
+            self._window.destroy()
+            raise
+        self._scratch = pygame.Surface((settings.width, settings.height))
+        self._reset_textures()
+        self._update_scaling()
+
+    @staticmethod
+    def _window_size(settings: GameSettings, display_index: int = 0) -> tuple[int, int]:
+        if settings.display.fullscreen:
+            desktop_sizes = pygame.display.get_desktop_sizes()
+            if desktop_sizes:
+                return desktop_sizes[min(display_index, len(desktop_sizes) - 1)]
+        return settings.width, settings.height
+
+    @staticmethod
+    def _window_position(display_index: int) -> tuple[int, int]:
+        # SDL_WINDOWPOS_CENTERED_DISPLAY(n): centre the window on monitor ``n``.
+        centred = 0x2FFF0000 | display_index
+        return centred, centred
+
+    def _reset_textures(self) -> None:
+        self._sprite_textures: dict[Hashable, video.Texture] = {}
+        self._text_textures: dict[str, video.Texture] = {}
+        self._background: video.Texture | None = None
+        self._chunk_textures: dict[tuple[int, int], video.Texture] = {}
+        self._background_generation = -1
+        self._hud: video.Texture | None = None
+        self._hud_key: tuple | None = None
+        self._start_screen: video.Texture | None = None
+        self._particle_textures: list[video.Texture] | None = None
+        self._particle_source = None
+
+    def _update_scaling(self) -> None:
+        window_width, window_height = self._window.size
+        self._scale = max(1, min(window_width // self._settings.width, window_height // self._settings.height))
+        self._offset_x = (window_width - self._settings.width * self._scale) // 2
+        self._offset_y = (window_height - self._settings.height * self._scale) // 2
+
+    def _dest(self, x: float, y: float, width: int, height: int) -> pygame.Rect:
+        scale = self._scale
+        return pygame.Rect(self._offset_x + int(x) * scale, self._offset_y + int(y) * scale, width * scale, height * scale)
+
+    def _begin_frame(self) -> None:
+        self._renderer.draw_color = (0, 0, 0, 255)
+        self._renderer.clear()
+
+    def draw_start_screen(self) -> None:
+        self._begin_frame()
+        self._scene.draw_start_screen(self._scratch)
+        if self._start_screen is None:
+            self._start_screen = video.Texture(self._renderer, self._scratch.get_size(), streaming=True)
+        self._start_screen.update(self._scratch)
+        self._start_screen.draw(dstrect=self._dest(0, 0, self._settings.width, self._settings.height))
+
+    def draw_scene(self, controller: GameController) -> None:
+        self._begin_frame()
+        scene = self._scene
+        scene.begin_scene(controller)
+        width, height = self._settings.width, self._settings.height
+        if self._background is None or self._background_generation != controller.level_generation:
+            self._background = video.Texture.from_surface(self._renderer, scene.render_backdrop(self._scratch))
+            self._chunk_textures = {}
+            self._background_generation = controller.level_generation
+        self._background.draw(dstrect=self._dest(0, 0, width, height))
+
+        chunk_size = scene.chunk_size
+        for key, (x, y) in scene.visible_chunks():
+            texture = self._chunk_textures.get(key)
+            if texture is None:
+                texture = video.Texture.from_surface(self._renderer, scene.wall_chunk(key))
+                self._chunk_textures[key] = texture
+            texture.draw(dstrect=self._dest(x, y, chunk_size, chunk_size))
+
+        camera_x, camera_y = scene.camera.offset
+        for entity in scene.visible_entities(controller):
+            self._draw_sprite(entity, entity.x - camera_x, entity.y - camera_y)
+        self._draw_particles(controller)
+        self._draw_hud(controller)
+
+    def _draw_sprite(self, entity, x: float, y: float) -> None:
+        key = self._atlas.sprite_key(entity)
+        texture = self._sprite_textures.get(key)
+        if texture is None:
+            _, sprite = self._atlas.sprite_for(entity)
+            texture = video.Texture.from_surface(self._renderer, sprite)
+            self._sprite_textures[key] = texture
+        grid = self._settings.grid_size
+        texture.draw(dstrect=self._dest(x, y, grid, grid))
+
+    def _draw_particles(self, controller: GameController) -> None:
+        particles = self._scene.particles
+        self._scene.update_effects(controller)
+        if not self._settings.effects.particles:
+            return
+        if self._particle_textures is None or self._particle_source is not particles:
+            self._particle_textures = [video.Texture.from_surface(self._renderer, sprite) for sprite in particles.sprites]
+            self._particle_source = particles
+        size = particles.sprites[0].get_width()
+        textures = self._particle_textures
+        sprite_index, draw_x, draw_y = particles.sprite_index, particles.draw_x, particles.draw_y
+        for i in range(particles.prepare_draw(self._scene.camera.offset)):
+            textures[sprite_index[i]].draw(dstrect=self._dest(draw_x[i], draw_y[i], size, size))
+
+    def _draw_hud(self, controller: GameController) -> None:
+        hud_key = self._scene.hud_key(controller)
+        if self._hud is None or hud_key != self._hud_key:
+            overlay = pygame.Surface((self._settings.width, self._settings.height), pygame.SRCALPHA)
+            self._scene.draw_hud(overlay, controller)
+            self._hud = video.Texture.from_surface(self._renderer, overlay)
+            self._hud_key = hud_key
+        self._hud.draw(dstrect=self._dest(0, 0, self._settings.width, self._settings.height))
+
+    def _draw_banner(self, name: str, draw) -> None:
+        texture = self._text_textures.get(name)
+        if texture is None:
+            overlay = pygame.Surface((self._settings.width, self._settings.height), pygame.SRCALPHA)
+            draw(overlay)
+            texture = video.Texture.from_surface(self._renderer, overlay)
+            self._text_textures[name] = texture
+        texture.draw(dstrect=self._dest(0, 0, self._settings.width, self._settings.height))
+
+    def draw_game_over(self) -> None:
+        self._draw_banner("game_over", self._scene.draw_game_over)
+
+    def draw_level_complete(self) -> None:
+        self._draw_banner("level_complete", self._scene.draw_level_complete)
+
+    def attach(self, controller: GameController) -> None:
+        self._scene.attach(controller)
+
+    def detach(self) -> None:
+        self._scene.detach()
+
+    def close(self) -> None:
+        # Textures keep the renderer alive and must go first; dropping the last
+        # reference destroys the SDL renderer, which has no explicit destroy().
+        self._reset_textures()
+        del self._renderer
+        self._window.destroy()
+
+    def present(self) -> None:
+        self._renderer.present()
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        return self._window.size
+
+    def grab_frame(self, target: pygame.Surface) -> None:
+        # Reads the back buffer, so this must run before present().
+        self._renderer.to_surface(surface=target)
+
+    def apply_settings(self, settings: GameSettings, changed: frozenset[str]) -> None:
+        self._settings = settings
+        self._scene.apply_settings(settings, changed)
+        if "title" in changed:
+            self._window.title = settings.title
+        if changed & {"layout", "display"}:
+            if settings.display.fullscreen:
+                self._window.set_fullscreen(desktop=True)
+            else:
+                self._window.set_windowed()
+            self._window.size = self._window_size(settings, self._display_index)
+            self._scratch = pygame.Surface((settings.width, settings.height))
+            self._update_scaling()
+        if changed & {"layout", "colors", "enemy"}:
+            self._atlas.apply_settings(settings)
+            self._reset_textures()
+        elif "language" in changed:
+            # Banners, HUD and backdrop all hold rendered text.
+            self._reset_textures()
+
+    def apply_quality(self, tier: QualityTier) -> None:
+        if tier.decorations != self._scene.quality.decorations:
+            self._background = None
+        self._scene.apply_quality(tier)
+        self._atlas.animate_pickups = tier.pickup_animation